@@ -368,6 +368,14 @@ def pack_project(project, dirpath, dbonly):
     PypeCommands().pack_project(project, dirpath, dbonly)
 
 
+@main.command()
+@click.option(
+    "--output", help="Path where manifest is stored", default=None)
+def create_modules_manifest(output):
+    """Create manifest of default modules and hosts for lazy loading."""
+    PypeCommands().create_modules_manifest(output)
+
+
 @main.command()
 @click.option("--zipfile", help="Path to zip file")
 @click.option(
@@ -97,7 +97,9 @@ from .python_module_tools import (
 
 from .profiles_filtering import (
     compile_list_of_regexes,
-    filter_profiles
+    filter_profiles,
+    ProfileMatcher,
+    get_profile_matcher,
 )
 
 from .transcoding import (
@@ -150,6 +152,7 @@ from .path_tools import (
     format_file_size,
     collect_frames,
     create_hard_link,
+    clone_file,
     version_up,
     get_version_from_path,
     get_last_version_from_path,
@@ -259,6 +262,8 @@ __all__ = [
     "compile_list_of_regexes",
 
     "filter_profiles",
+    "ProfileMatcher",
+    "get_profile_matcher",
 
     "prepare_template_data",
     "source_hash",
@@ -266,6 +271,7 @@ __all__ = [
     "format_file_size",
     "collect_frames",
     "create_hard_link",
+    "clone_file",
     "version_up",
     "get_version_from_path",
     "get_last_version_from_path",
@@ -0,0 +1,244 @@
+"""Client of long-lived burnin process.
+
+Burnin process is started once and reused by all burnins created in the
+process. See 'openpype/scripts/otio_burnin_worker.py' for the protocol.
+"""
+import os
+import json
+import atexit
+import platform
+import threading
+import subprocess
+
+from .log import Logger
+from .execute import (
+    get_openpype_execute_args,
+    clean_envs_for_openpype_process,
+)
+from .openpype_version import is_running_from_build
+
+BURNIN_WORKER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "scripts",
+    "otio_burnin_worker.py"
+)
+
+
+class BurninWorkerError(RuntimeError):
+    """Burnin worker process is not available."""
+    pass
+
+
+class BurninWorker(object):
+    """Long-lived process creating burnins.
+
+    Process is started on first use and keeps running until 'stop' is
+    called or current process ends. Jobs are processed concurrently by the
+    worker.
+
+    Args:
+        max_workers (Optional[int]): Max number of burnins created at the
+            same time. CPU count of the machine is used if not passed.
+    """
+
+    def __init__(self, max_workers=None):
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._process = None
+        self._pending = {}
+        self._next_id = 0
+        self.log = Logger.get_logger(self.__class__.__name__)
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """Start worker process if is not running."""
+        with self._lock:
+            if self.is_running():
+                return
+
+            args = get_openpype_execute_args("run", BURNIN_WORKER_SCRIPT)
+            if self._max_workers:
+                args.append(str(self._max_workers))
+
+            env = clean_envs_for_openpype_process(os.environ)
+            # Only keep OpenPype version if we are running from build.
+            if not is_running_from_build():
+                env.pop("OPENPYPE_VERSION", None)
+
+            kwargs = {}
+            if platform.system().lower() == "windows":
+                kwargs["creationflags"] = (
+                    subprocess.CREATE_NEW_PROCESS_GROUP
+                    | getattr(subprocess, "DETACHED_PROCESS", 0)
+                    | getattr(subprocess, "CREATE_NO_WINDOW", 0)
+                )
+
+            self.log.debug("Starting burnin worker: {}".format(
+                " ".join(args)))
+            process = subprocess.Popen(
+                args,
+                env={str(k): str(v) for k, v in env.items()},
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                **kwargs
+            )
+            # Set when all results of the process were read
+            process.results_finished = threading.Event()
+            self._process = process
+
+        for target in (self._read_results, self._read_output):
+            thread = threading.Thread(target=target, args=(process, ))
+            thread.daemon = True
+            thread.start()
+
+    def stop(self, timeout=10):
+        """Stop worker process after all sent jobs are processed."""
+        with self._lock:
+            process = self._process
+            self._process = None
+
+        if process is None or process.poll() is not None:
+            return
+
+        try:
+            process.stdin.close()
+        except (IOError, OSError):
+            pass
+
+        # 'wait' does not support timeout in Python 2
+        finished = threading.Event()
+        thread = threading.Thread(
+            target=lambda: (process.wait(), finished.set()))
+        thread.daemon = True
+        thread.start()
+        if not finished.wait(timeout):
+            process.kill()
+
+    def process(self, jobs_data, logger=None):
+        """Create burnins and wait until all of them are finished.
+
+        Args:
+            jobs_data (list[dict[str, Any]]): Input data of
+                'otio_burnin.py' for each burnin.
+            logger (Optional[logging.Logger]): Logger for output of jobs.
+
+        Returns:
+            list[dict[str, Any]]: Result of each job with keys 'success',
+                'error', 'output' and 'worker_failed'. Jobs which were
+                not processed because worker ended have set
+                'worker_failed' to 'True'.
+
+        Raises:
+            BurninWorkerError: If worker process can't be started.
+        """
+        if logger is None:
+            logger = self.log
+
+        try:
+            self.start()
+        except Exception as exc:
+            raise BurninWorkerError(
+                "Failed to start burnin worker: {}".format(exc))
+
+        items = []
+        with self._lock:
+            process = self._process
+            for data in jobs_data:
+                job_id = self._next_id
+                self._next_id += 1
+                item = {"event": threading.Event(), "result": None}
+                self._pending[job_id] = item
+                items.append(item)
+                line = json.dumps({"id": job_id, "data": data}) + "\n"
+                try:
+                    process.stdin.write(line.encode("utf-8"))
+                    process.stdin.flush()
+                except (IOError, OSError):
+                    # Results of pending jobs are set by '_read_results'
+                    break
+
+        results = []
+        for item in items:
+            while not item["event"].wait(0.5):
+                # Worker ended before the job was sent
+                if process.results_finished.is_set():
+                    break
+
+            result = item["result"]
+            if result is None:
+                result = self._get_worker_failed_result()
+            if result.get("output"):
+                logger.debug(result["output"])
+            results.append(result)
+
+        # Jobs which were not sent at all
+        for _ in range(len(jobs_data) - len(items)):
+            results.append(self._get_worker_failed_result())
+        return results
+
+    def _get_worker_failed_result(self):
+        return {
+            "success": False,
+            "error": "Burnin worker process ended",
+            "output": None,
+            "worker_failed": True
+        }
+
+    def _read_results(self, process):
+        for line in process.stdout:
+            line = line.decode("utf-8", errors="backslashreplace").strip()
+            try:
+                result = json.loads(line)
+            except ValueError:
+                result = None
+
+            if not isinstance(result, dict) or "id" not in result:
+                if line:
+                    self.log.debug(line)
+                continue
+
+            result["worker_failed"] = False
+            with self._lock:
+                item = self._pending.pop(result["id"], None)
+            if item is not None:
+                item["result"] = result
+                item["event"].set()
+
+        process.wait()
+        with self._lock:
+            if self._process is process:
+                self._process = None
+            items = list(self._pending.values())
+            self._pending.clear()
+
+        for item in items:
+            item["result"] = self._get_worker_failed_result()
+            item["event"].set()
+        process.results_finished.set()
+
+    def _read_output(self, process):
+        for line in process.stderr:
+            line = line.decode("utf-8", errors="backslashreplace").rstrip()
+            if line:
+                self.log.debug(line)
+
+
+_BURNIN_WORKER = None
+_BURNIN_WORKER_LOCK = threading.Lock()
+
+
+def get_burnin_worker():
+    """Burnin worker shared in current process.
+
+    Returns:
+        BurninWorker: Worker which is stopped when process ends.
+    """
+    global _BURNIN_WORKER
+    with _BURNIN_WORKER_LOCK:
+        if _BURNIN_WORKER is None:
+            _BURNIN_WORKER = BurninWorker()
+            atexit.register(_BURNIN_WORKER.stop)
+    return _BURNIN_WORKER
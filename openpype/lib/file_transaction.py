@@ -2,9 +2,13 @@ import os
 import logging
 import sys
 import errno
+import hashlib
+import threading
+import collections
 import six
 
-from openpype.lib import create_hard_link
+from openpype.lib import create_hard_link, clone_file
+from openpype.lib.python_2_comp import ThreadPoolExecutor
 
 # this is needed until speedcopy for linux is fixed
 if sys.platform == "win32":
@@ -12,6 +16,10 @@ if sys.platform == "win32":
 else:
     from shutil import copyfile
 
+# Reflink and in-kernel copy used by 'clone_file' are available only on
+#   linux, other platforms use platform copy for clone transfers
+CLONE_SUPPORTED = sys.platform.startswith("linux")
+
 
 class DuplicateDestinationError(ValueError):
     """Error raised when transfer destination already exists in queue.
@@ -47,19 +55,64 @@ class FileTransaction(object):
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Transfers in step 2 can run on a bounded pool of worker threads. Files
+    are grouped by destination directory so each folder is created only
+    once before any copy starts. When 'checksum_algorithm' is set the
+    checksum of each copied file is calculated from the copied stream
+    (no additional read of the file) and available in 'checksums'.
+
+    Transfers added with 'MODE_CLONE' try copy-on-write reflink and
+    in-kernel copy before falling back to byte copy. Used method of each
+    transferred file is available in 'transfer_methods'. Checksums are not
+    calculated for cloned files as their content is never read. Clone
+    transfers are processed as 'MODE_COPY' on platforms other than linux.
+
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for output.
+        allow_queue_replacements (Optional[bool]): Allow replacing of
+            queued transfer with different source for the same destination.
+        max_workers (Optional[int]): Maximum number of concurrent
+            transfers. Value '1' processes transfers sequentially.
+        checksum_algorithm (Optional[str]): Name of 'hashlib' algorithm
+            used to calculate checksum of copied files e.g. 'sha256'.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
-
-    def __init__(self, log=None, allow_queue_replacements=False):
+    MODE_CLONE = 2
+
+    # Size of chunk used for copy when checksum is calculated
+    _copy_chunk_size = 1024 * 1024
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=1,
+        checksum_algorithm=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        if ThreadPoolExecutor is None or not max_workers:
+            max_workers = 1
+        self._max_workers = max(1, int(max_workers))
+
+        if checksum_algorithm:
+            # Validate algorithm name early
+            hashlib.new(checksum_algorithm)
+        self._checksum_algorithm = checksum_algorithm
+        # Checksum of copied files by destination path
+        self._checksums = {}
+        # Method used to transfer file by destination path
+        self._transfer_methods = {}
+        self._lock = threading.Lock()
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -78,7 +131,7 @@ class FileTransaction(object):
         Args:
             src (str): Source path.
             dst (str): Destination path.
-            mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_CLONE): Transfer mode.
         """
 
         opts = {"mode": mode}
@@ -111,10 +164,21 @@ class FileTransaction(object):
 
     def process(self):
         # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
+        transfers_by_dirname = collections.OrderedDict()
+        for dst, (src, opts) in self._transfers.items():
             self.log.debug("Checking file ... {} -> {}".format(src, dst))
             path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
+            if path_same:
+                self.log.debug(
+                    "Source and destination are same files {} -> {}".format(
+                        src, dst))
+                continue
+
+            dirname = os.path.dirname(dst)
+            transfers_by_dirname.setdefault(dirname, []).append(
+                (src, dst, opts)
+            )
+            if not os.path.exists(dst):
                 continue
 
             # Backup original file
@@ -125,26 +189,123 @@ class FileTransaction(object):
                 "Backup existing file: {} -> {}".format(dst, backup))
             os.rename(dst, backup)
 
+        # Create each destination folder only once
+        transfers = []
+        for dirname, dir_transfers in transfers_by_dirname.items():
+            self._create_folder(dirname)
+            transfers.extend(dir_transfers)
+
         # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
-                self.log.debug(
-                    "Source and destination are same files {} -> {}".format(
-                        src, dst))
-                continue
+        if self._max_workers == 1 or len(transfers) < 2:
+            for src, dst, opts in transfers:
+                self._transfer_file(src, dst, opts)
+                self._transferred.append(dst)
+            return
+
+        self.log.debug("Transferring {} files using {} workers".format(
+            len(transfers), self._max_workers))
+        failed_event = threading.Event()
+        futures = []
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for src, dst, opts in transfers:
+                futures.append(executor.submit(
+                    self._process_transfer, src, dst, opts, failed_event
+                ))
+
+        # All workers finished, collect transferred files in queue order
+        #   so rollback can remove them even if some of the workers failed
+        first_error = None
+        for (_, dst, _), future in zip(transfers, futures):
+            error = future.exception()
+            if error is None:
+                if future.result():
+                    self._transferred.append(dst)
+            elif first_error is None:
+                first_error = error
+
+        if first_error is not None:
+            raise first_error
+
+    def _process_transfer(self, src, dst, opts, failed_event):
+        """Transfer single file in worker thread.
+
+        Transfers are skipped if other transfer already failed.
+
+        Returns:
+            bool: File was transferred.
+        """
+
+        if failed_event.is_set():
+            return False
 
-            self._create_folder_for_file(dst)
+        try:
+            self._transfer_file(src, dst, opts)
+        except BaseException:
+            failed_event.set()
+            raise
+        return True
+
+    def _transfer_file(self, src, dst, opts):
+        try:
+            method = None
+            mode = opts["mode"]
+            if mode == self.MODE_CLONE and not CLONE_SUPPORTED:
+                mode = self.MODE_COPY
 
-            if opts["mode"] == self.MODE_COPY:
+            if mode == self.MODE_COPY:
                 self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
+                method = "copy"
+                if self._checksum_algorithm:
+                    checksum = self._copy_with_checksum(src, dst)
+                    with self._lock:
+                        self._checksums[dst] = checksum
+                else:
+                    copyfile(src, dst)
+
+            elif mode == self.MODE_HARDLINK:
                 self.log.debug("Hardlinking file ... {} -> {}".format(
                     src, dst))
+                method = "hardlink"
                 create_hard_link(src, dst)
 
-            self._transferred.append(dst)
+            elif mode == self.MODE_CLONE:
+                method = clone_file(src, dst)
+                self.log.debug("Cloned file using {} ... {} -> {}".format(
+                    method, src, dst))
+
+            with self._lock:
+                self._transfer_methods[dst] = method
+
+        except BaseException:
+            # Remove partially written file, it is not tracked in
+            #   transferred files so rollback would not remove it
+            if os.path.exists(dst):
+                try:
+                    os.remove(dst)
+                except OSError:
+                    self.log.warning(
+                        "Failed to remove partially transferred file: {}"
+                        .format(dst),
+                        exc_info=True)
+            raise
+
+    def _copy_with_checksum(self, src, dst):
+        """Copy file and calculate checksum of copied data.
+
+        Returns:
+            str: Hex digest of copied data.
+        """
+
+        hash_obj = hashlib.new(self._checksum_algorithm)
+        with open(src, "rb") as src_stream:
+            with open(dst, "wb") as dst_stream:
+                while True:
+                    chunk = src_stream.read(self._copy_chunk_size)
+                    if not chunk:
+                        break
+                    hash_obj.update(chunk)
+                    dst_stream.write(chunk)
+        return hash_obj.hexdigest()
 
     def finalize(self):
         # Delete any backed up files
@@ -195,8 +356,26 @@ class FileTransaction(object):
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
+    @property
+    def checksums(self):
+        """Return checksums of copied files by destination path.
+
+        Checksums are available only if 'checksum_algorithm' was passed.
+        """
+        return dict(self._checksums)
+
+    @property
+    def transfer_methods(self):
+        """Return used transfer method by destination path.
+
+        Values are 'copy', 'hardlink' or method used by 'clone_file'.
+        """
+        return dict(self._transfer_methods)
+
     def _create_folder_for_file(self, path):
-        dirname = os.path.dirname(path)
+        self._create_folder(os.path.dirname(path))
+
+    def _create_folder(self, dirname):
         try:
             os.makedirs(dirname)
         except OSError as e:
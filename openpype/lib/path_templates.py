@@ -2,6 +2,7 @@ import os
 import re
 import copy
 import numbers
+import threading
 import collections
 
 import six
@@ -10,6 +11,7 @@ KEY_PATTERN = re.compile(r"(\{.*?[^{0]*\})")
 KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
+OPTIONAL_CHAR_PATTERN = re.compile(r"([<>])")
 
 
 def merge_dict(main_dict, enhance_dict):
@@ -82,6 +84,12 @@ class TemplateUnsolved(Exception):
 
 class StringTemplate(object):
     """String that can be formatted."""
+
+    # Parsed parts by template string
+    _parts_cache = collections.OrderedDict()
+    _parts_cache_lock = threading.Lock()
+    _parts_cache_size = 1024
+
     def __init__(self, template):
         if not isinstance(template, six.string_types):
             raise TypeError("<{}> argument must be a string, not {}.".format(
@@ -89,6 +97,32 @@ class StringTemplate(object):
             ))
 
         self._template = template
+        self._parts = self._get_template_parts(template)
+
+    @classmethod
+    def _get_template_parts(cls, template):
+        """Parsed parts of template shared by all objects of the template.
+
+        Parts are not changed during formatting so the same templates, e.g.
+            anatomy templates, are parsed only once.
+        """
+        cache = StringTemplate._parts_cache
+        with StringTemplate._parts_cache_lock:
+            parts = cache.pop(template, None)
+            if parts is not None:
+                # move to the end as recently used
+                cache[template] = parts
+                return parts
+
+        parts = cls._parse_template(template)
+        with StringTemplate._parts_cache_lock:
+            cache[template] = parts
+            while len(cache) > StringTemplate._parts_cache_size:
+                cache.popitem(last=False)
+        return parts
+
+    @classmethod
+    def _parse_template(cls, template):
         parts = []
         last_end_idx = 0
         for item in KEY_PATTERN.finditer(template):
@@ -107,19 +141,14 @@ class StringTemplate(object):
                 new_parts.append(part)
                 continue
 
-            substr = ""
-            for char in part:
-                if char not in ("<", ">"):
-                    substr += char
-                else:
-                    if substr:
-                        new_parts.append(substr)
-                    new_parts.append(char)
-                    substr = ""
-            if substr:
-                new_parts.append(substr)
+            # Split optional start and end chars from string
+            new_parts.extend(
+                substr
+                for substr in OPTIONAL_CHAR_PATTERN.split(part)
+                if substr
+            )
 
-        self._parts = self.find_optional_parts(new_parts)
+        return cls.find_optional_parts(new_parts)
 
     def __str__(self):
         return self.template
@@ -182,6 +211,33 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_batch(self, data, items):
+        """Format template for each item with values changed by the item.
+
+        Faster alternative of calling 'format' in a loop, e.g. for each
+        frame of sequence, shared data are not copied for each item.
+
+        Args:
+            data (dict): Data shared by all items.
+            items (Iterable[dict]): Values changed for each item,
+                e.g. '{"frame": 1001}'.
+
+        Returns:
+            list[TemplateResult]: Result for each item.
+        """
+        results = []
+        for item in items:
+            item_data = dict(data)
+            item_data.update(item)
+            results.append(self.format(item_data))
+        return results
+
+    def format_strict_batch(self, data, items):
+        results = self.format_batch(data, items)
+        for result in results:
+            result.validate()
+        return results
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -704,6 +760,16 @@ class FormattingPart:
     def __init__(self, template):
         self._template = template
 
+        # Prepare keys used to access value in data
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
+
     @property
     def template(self):
         return self._template
@@ -732,17 +798,13 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
-        # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -1,5 +1,7 @@
 import os
 import re
+import errno
+import shutil
 import logging
 import platform
 
@@ -65,6 +67,106 @@ def create_hard_link(src_path, dst_path):
     )
 
 
+# 'FICLONE' ioctl request from 'linux/fs.h'
+_FICLONE = 0x40049409
+# Errors meaning that fast copy method is not supported for source and
+#   destination (different filesystems, unsupported filesystem etc.)
+_FAST_COPY_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+    errno.EPERM,
+}
+
+
+def _reflink_file(src_fd, dst_fd):
+    import fcntl
+
+    fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+
+
+def _copy_file_range(src_fd, dst_fd, size):
+    offset = 0
+    while offset < size:
+        copied = os.copy_file_range(
+            src_fd, dst_fd, size - offset, offset, offset
+        )
+        if copied == 0:
+            break
+        offset += copied
+    return offset
+
+
+def _sendfile(src_fd, dst_fd, size):
+    offset = 0
+    while offset < size:
+        copied = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if copied == 0:
+            break
+        offset += copied
+    return offset
+
+
+def clone_file(src_path, dst_path):
+    """Copy file content using the fastest available method.
+
+    Methods are tried in order 'reflink' (copy-on-write clone on
+    Btrfs/XFS), 'copy_file_range' (in-kernel copy, may be server side
+    copy on network filesystems) and 'sendfile'. Byte copy is used when
+    none of them is available for the source and destination.
+
+    Only file content is copied, same as 'shutil.copyfile'.
+
+    Args:
+        src_path (str): Full path to source file.
+        dst_path (str): Full path to destination file.
+
+    Returns:
+        str: Used method 'reflink', 'copy_file_range', 'sendfile'
+            or 'copy'.
+    """
+
+    if platform.system().lower() != "linux":
+        shutil.copyfile(src_path, dst_path)
+        return "copy"
+
+    methods = [("reflink", None)]
+    if hasattr(os, "copy_file_range"):
+        methods.append(("copy_file_range", _copy_file_range))
+    if hasattr(os, "sendfile"):
+        methods.append(("sendfile", _sendfile))
+
+    with open(src_path, "rb") as src_stream:
+        size = os.fstat(src_stream.fileno()).st_size
+        with open(dst_path, "wb") as dst_stream:
+            src_fd = src_stream.fileno()
+            dst_fd = dst_stream.fileno()
+            for method, func in methods:
+                try:
+                    if func is None:
+                        _reflink_file(src_fd, dst_fd)
+                        return method
+
+                    copied = func(src_fd, dst_fd, size)
+                    if copied == size:
+                        return method
+
+                except (OSError, IOError) as exc:
+                    if exc.errno not in _FAST_COPY_UNSUPPORTED_ERRNOS:
+                        raise
+
+                # Discard anything written by failed method
+                dst_stream.seek(0)
+                dst_stream.truncate()
+
+            src_stream.seek(0)
+            shutil.copyfileobj(src_stream, dst_stream)
+    return "copy"
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
@@ -1,8 +1,16 @@
 import re
 import logging
+import threading
+import collections
+
+import six
 
 log = logging.getLogger(__name__)
 
+# Characters with special meaning in regex, values without them are
+#   matched by exact match
+REGEX_SPECIAL_CHARS_PATTERN = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -116,6 +124,267 @@ def validate_value_by_regexes(value, in_list):
     return -1
 
 
+def _get_keys_order(key_values, keys_order):
+    if not keys_order:
+        return tuple(key_values.keys())
+
+    _keys_order = list(keys_order)
+    # Make all keys from `key_values` are passed
+    for key in key_values.keys():
+        if key not in _keys_order:
+            _keys_order.append(key)
+    return tuple(_keys_order)
+
+
+class _KeyIndex(object):
+    """Pre-compiled filters of all profiles for single key.
+
+    Values of profiles without regex special characters are stored in
+    index of exact values. Other values are compiled to regexes.
+
+    Args:
+        profiles (tuple[dict[str, Any]]): Profiles.
+        key (str): Key of filter in profiles.
+    """
+
+    def __init__(self, profiles, key):
+        # Profiles which match any value (filter is not set or contain "*")
+        any_indexes = set()
+        exact_indexes = collections.defaultdict(set)
+        regexes_by_index = []
+        for idx, profile in enumerate(profiles):
+            in_list = profile.get(key)
+            if not in_list:
+                any_indexes.add(idx)
+                continue
+
+            if not isinstance(in_list, (list, tuple, set)):
+                in_list = [in_list]
+
+            if "*" in in_list:
+                any_indexes.add(idx)
+                continue
+
+            regex_items = []
+            for item in in_list:
+                if not item:
+                    continue
+                if (
+                    isinstance(item, six.string_types)
+                    and not REGEX_SPECIAL_CHARS_PATTERN.search(item)
+                ):
+                    exact_indexes[item].add(idx)
+                else:
+                    regex_items.append(item)
+
+            regexes = compile_list_of_regexes(regex_items)
+            if regexes:
+                regexes_by_index.append((idx, regexes))
+
+        self.any_indexes = frozenset(any_indexes)
+        self._exact_indexes = dict(exact_indexes)
+        self._regexes_by_index = regexes_by_index
+
+    def get_matching_indexes(self, value):
+        """Indexes of profiles with filter matching the value.
+
+        Profiles which match any value are not included.
+
+        Returns:
+            set[int]: Indexes of matching profiles.
+        """
+        # If value is not set and profile has specific values then
+        #   resolve value as not matching.
+        if not value:
+            return set()
+
+        output = set(self._exact_indexes.get(value, ()))
+        for idx, regexes in self._regexes_by_index:
+            if idx in output:
+                continue
+            for regex in regexes:
+                if hasattr(regex, "fullmatch"):
+                    result = regex.fullmatch(value)
+                else:
+                    result = fullmatch(regex, value)
+                if result:
+                    output.add(idx)
+                    break
+        return output
+
+
+class ProfileMatcher(object):
+    """Pre-compiled profiles for repeated filtering.
+
+    Alternative to 'filter_profiles' for cases when the same profiles are
+    filtered multiple times. Regexes of profiles are compiled only once and
+    values without regex special characters are matched by index of exact
+    values. Results are cached for the same key values.
+
+    Profiles must not be changed after matcher is created.
+
+    Args:
+        profiles (Iterable[dict[str, Any]]): Profile definitions.
+        cache_size (Optional[int]): Max number of cached results.
+    """
+
+    def __init__(self, profiles, cache_size=256):
+        self._profiles = tuple(profiles or ())
+        self._key_indexes = {}
+        self._cache = collections.OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    @property
+    def profiles(self):
+        return self._profiles
+
+    def _get_key_index(self, key):
+        key_index = self._key_indexes.get(key)
+        if key_index is None:
+            key_index = _KeyIndex(self._profiles, key)
+            self._key_indexes[key] = key_index
+        return key_index
+
+    def match(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile for key values.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value. Key is checked if is
+                available in profile and if Value is matching it's values.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            dict/None: Return most matching profile or None if none of
+                profiles match at least one criteria.
+        """
+        if not self._profiles:
+            return None
+
+        if not logger:
+            logger = log
+
+        keys_order = _get_keys_order(key_values, keys_order)
+        values = tuple(key_values[key] for key in keys_order)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        log_parts = None
+        if debug_enabled:
+            log_parts = " | ".join([
+                "{}: \"{}\"".format(*item)
+                for item in key_values.items()
+            ])
+            logger.debug(
+                "Looking for matching profile for: {}".format(log_parts)
+            )
+
+        cache_key = (keys_order, values)
+        try:
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+
+        with self._lock:
+            if cache_key is not None and cache_key in self._cache:
+                # move to the end as recently used
+                profile = self._cache.pop(cache_key)
+                self._cache[cache_key] = profile
+            else:
+                profile = self._match(keys_order, values, logger, log_parts)
+                if cache_key is not None and self._cache_size:
+                    self._cache[cache_key] = profile
+                    while len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+
+        if profile and debug_enabled:
+            logger.debug("Profile selected: {}".format(profile))
+        return profile
+
+    def _match(self, keys_order, values, logger, log_parts):
+        candidates = None
+        matching_by_key = []
+        for key, value in zip(keys_order, values):
+            key_index = self._get_key_index(key)
+            matching = key_index.get_matching_indexes(value)
+            matching_by_key.append(matching)
+            allowed = matching | key_index.any_indexes
+            if candidates is None:
+                candidates = allowed
+            else:
+                candidates &= allowed
+
+            if not candidates:
+                break
+
+        if candidates is None:
+            candidates = set(range(len(self._profiles)))
+
+        if not candidates:
+            if log_parts is not None:
+                logger.debug(
+                    "None of profiles match your setup. {}".format(log_parts)
+                )
+            return None
+
+        # Each profile get 1 point for each matching filter. Profile with
+        #   most points is returned.
+        matching_profiles = []
+        highest_profile_points = -1
+        for idx in sorted(candidates):
+            profile_scores = [idx in matching for matching in matching_by_key]
+            profile_points = sum(profile_scores)
+            if profile_points < highest_profile_points:
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+            matching_profiles.append((self._profiles[idx], profile_scores))
+
+        if len(matching_profiles) > 1 and log_parts is not None:
+            logger.debug(
+                "More than one profile match your setup. {}".format(log_parts)
+            )
+        return _profile_exclusion(matching_profiles, logger)
+
+
+_PROFILE_MATCHERS = collections.OrderedDict()
+_PROFILE_MATCHERS_LOCK = threading.Lock()
+_PROFILE_MATCHERS_SIZE = 64
+
+
+def get_profile_matcher(profiles):
+    """Profile matcher shared for the same profiles object.
+
+    Matchers are cached by identity of profiles, so the same matcher is
+    used for profiles from the same settings data. Profiles must not be
+    changed after the matcher is created.
+
+    Args:
+        profiles (list[dict[str, Any]]): Profile definitions, usually
+            from settings.
+
+    Returns:
+        ProfileMatcher: Matcher of the profiles.
+    """
+    key = id(profiles)
+    with _PROFILE_MATCHERS_LOCK:
+        item = _PROFILE_MATCHERS.pop(key, None)
+        # Cached item keeps reference to profiles so id can't be reused
+        if item is not None and item[0] is profiles:
+            # move to the end as recently used
+            _PROFILE_MATCHERS[key] = item
+            return item[1]
+
+        matcher = ProfileMatcher(profiles)
+        _PROFILE_MATCHERS[key] = (profiles, matcher)
+        while len(_PROFILE_MATCHERS) > _PROFILE_MATCHERS_SIZE:
+            _PROFILE_MATCHERS.popitem(last=False)
+    return matcher
+
+
 def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     """ Filter profiles by entered key -> values.
 
@@ -134,6 +403,9 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     profiles with same score then first in order is used (order of profiles
     matter).
 
+    Use 'ProfileMatcher' or 'get_profile_matcher' when the same profiles
+    are filtered repeatedly.
+
     Args:
         profiles_data (list): Profile definitions as dictionaries.
         key_values (dict): Mapping of Key <-> Value. Key is checked if is
@@ -149,79 +421,6 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not profiles_data:
         return None
 
-    if not logger:
-        logger = log
-
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
-    else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
-
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
-
-    logger.debug(
-        "Looking for matching profile for: {}".format(log_parts)
+    return ProfileMatcher(profiles_data, cache_size=0).match(
+        key_values, keys_order, logger
     )
-
-    matching_profiles = None
-    highest_profile_points = -1
-    # Each profile get 1 point for each matching filter. Profile with most
-    # points is returned. For cases when more than one profile will match
-    # are also stored ordered lists of matching values.
-    for profile in profiles_data:
-        profile_points = 0
-        profile_scores = []
-
-        for key in keys_order:
-            value = key_values[key]
-            match = validate_value_by_regexes(value, profile.get(key))
-            if match == -1:
-                profile_value = profile.get(key) or []
-                logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
-                )
-                profile_points = -1
-                break
-
-            profile_points += match
-            profile_scores.append(bool(match))
-
-        if (
-            profile_points < 0
-            or profile_points < highest_profile_points
-        ):
-            continue
-
-        if profile_points > highest_profile_points:
-            matching_profiles = []
-            highest_profile_points = profile_points
-
-        if profile_points == highest_profile_points:
-            matching_profiles.append((profile, profile_scores))
-
-    if not matching_profiles:
-        logger.debug(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
-        return None
-
-    if len(matching_profiles) > 1:
-        logger.debug(
-            "More than one profile match your setup. {}".format(log_parts)
-        )
-
-    profile = _profile_exclusion(matching_profiles, logger)
-    if profile:
-        logger.debug(
-            "Profile selected: {}".format(profile)
-        )
-    return profile
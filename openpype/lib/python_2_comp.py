@@ -1,5 +1,34 @@
+import os
+import sys
 import weakref
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Python 2 hosts without 'futures' backport should process sequentially
+    ThreadPoolExecutor = None
+
+
+def replace_file(src, dst):
+    """Move 'src' file to 'dst' and overwrite existing 'dst' file.
+
+    Python 2 does not have 'os.replace' and 'os.rename' fails on Windows
+    if destination exists, so existing file is removed first. The
+    replacement is not atomic in that case.
+
+    Args:
+        src (str): Path to source file.
+        dst (str): Path to destination file.
+    """
+    replace = getattr(os, "replace", None)
+    if replace is not None:
+        replace(src, dst)
+        return
+
+    if sys.platform.startswith("win") and os.path.exists(dst):
+        os.remove(dst)
+    os.rename(src, dst)
+
 
 WeakMethod = getattr(weakref, "WeakMethod", None)
 
@@ -1,15 +1,24 @@
 import os
 import re
+import math
 import logging
 import json
+import shutil
+import hashlib
 import collections
 import tempfile
 import subprocess
 import platform
+import multiprocessing
+import threading
+import time
 
 import xml.etree.ElementTree
 
+import clique
+
 from .execute import run_subprocess
+from .python_2_comp import ThreadPoolExecutor
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
     get_oiio_tool_args,
@@ -66,6 +75,188 @@ VIDEO_EXTENSIONS = {
 }
 
 
+class MediaInfoCache(object):
+    """Cache of outputs of tools reading information about media files.
+
+    Output of oiiotool or ffprobe is stored by kind of information, path,
+    modification time and size of the file, so changed file is read again.
+    Raw output is cached and parsed on each access so callers can modify
+    returned data.
+
+    Least recently used outputs are removed when cache has more than
+    'max_items' items. Outputs of files in a directory can be stored to
+    temp directory and loaded in following publish of the same directory.
+    Only 'max_cache_files' most recent files are kept and files older than
+    'cache_file_lifetime' seconds are removed.
+
+    Args:
+        max_items (int): Max number of cached outputs.
+    """
+
+    cache_version = 1
+    max_cache_files = 100
+    cache_file_lifetime = 7 * 24 * 60 * 60
+
+    def __init__(self, max_items=512):
+        self._max_items = max_items
+        self._lock = threading.Lock()
+        self._items = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _get_key(kind, filepath):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        mtime = getattr(stat, "st_mtime_ns", stat.st_mtime)
+        return (kind, os.path.normpath(filepath), mtime, stat.st_size)
+
+    def get(self, kind, filepath):
+        """Cached output for file.
+
+        Args:
+            kind (str): Kind of information, e.g. tool with arguments.
+            filepath (str): Path to media file.
+
+        Returns:
+            Union[str, None]: Cached output or None if file was not read
+                or changed.
+        """
+        key = self._get_key(kind, filepath)
+        with self._lock:
+            output = None
+            if key is not None:
+                output = self._items.get(key)
+            if output is None:
+                self.misses += 1
+                return None
+            # move to the end as recently used
+            self._items[key] = self._items.pop(key)
+            self.hits += 1
+            return output
+
+    def set(self, kind, filepath, output):
+        """Store output for file, should be called with valid output only."""
+        key = self._get_key(kind, filepath)
+        if key is None:
+            return
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = output
+            while len(self._items) > self._max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _get_cache_dir(self):
+        return os.path.join(tempfile.gettempdir(), "openpype_media_info")
+
+    def _get_cache_filepath(self, dirpath):
+        dirpath = os.path.normpath(os.path.abspath(dirpath))
+        return os.path.join(
+            self._get_cache_dir(),
+            "{}.json".format(hashlib.sha1(dirpath.encode("utf-8")).hexdigest())
+        )
+
+    def _prune_cache_files(self):
+        cache_dir = self._get_cache_dir()
+        try:
+            filepaths = [
+                os.path.join(cache_dir, filename)
+                for filename in os.listdir(cache_dir)
+            ]
+            mtimes = {
+                filepath: os.path.getmtime(filepath)
+                for filepath in filepaths
+            }
+        except (IOError, OSError):
+            return
+
+        filepaths.sort(key=lambda filepath: mtimes[filepath], reverse=True)
+        min_mtime = time.time() - self.cache_file_lifetime
+        for idx, filepath in enumerate(filepaths):
+            if idx < self.max_cache_files and mtimes[filepath] >= min_mtime:
+                continue
+            try:
+                os.remove(filepath)
+            except (IOError, OSError):
+                pass
+
+    def load(self, dirpath):
+        """Load outputs stored for files in directory by previous publish.
+
+        Args:
+            dirpath (str): Directory with media files, e.g. staging dir.
+        """
+        filepath = self._get_cache_filepath(dirpath)
+        if not os.path.exists(filepath):
+            return
+        try:
+            with open(filepath, "r") as stream:
+                data = json.load(stream)
+        except (IOError, OSError, ValueError):
+            return
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != self.cache_version
+        ):
+            return
+
+        items = data["items"][-self._max_items:]
+        with self._lock:
+            for item in items:
+                key = tuple(item[:-1])
+                if key not in self._items:
+                    self._items[key] = item[-1]
+            while len(self._items) > self._max_items:
+                self._items.popitem(last=False)
+
+    def save(self, dirpath):
+        """Store outputs of files in directory for following publishes.
+
+        Only outputs of files directly in the directory which still exist
+        are stored.
+
+        Args:
+            dirpath (str): Directory with media files, e.g. staging dir.
+        """
+        dirpath = os.path.normpath(dirpath)
+        with self._lock:
+            items = [
+                list(key) + [output]
+                for key, output in self._items.items()
+                if os.path.dirname(key[1]) == dirpath
+            ]
+        items = [item for item in items if os.path.exists(item[1])]
+        if not items:
+            return
+
+        filepath = self._get_cache_filepath(dirpath)
+        try:
+            cache_dir = os.path.dirname(filepath)
+            if not os.path.exists(cache_dir):
+                os.makedirs(cache_dir)
+            with open(filepath, "w") as stream:
+                json.dump(
+                    {"version": self.cache_version, "items": items},
+                    stream
+                )
+        except (IOError, OSError):
+            return
+        self._prune_cache_files()
+
+
+# Shared cache of 'get_oiio_info_for_input' and 'get_ffprobe_data'
+MEDIA_INFO_CACHE = MediaInfoCache()
+
+
 def get_transcode_temp_directory():
     """Creates temporary folder for transcoding.
 
@@ -81,7 +272,8 @@ def get_transcode_temp_directory():
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Output is cached in
+    'MEDIA_INFO_CACHE' until the file changes.
     """
     args = get_oiio_tool_args(
         "oiiotool",
@@ -93,8 +285,13 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
 
     args.extend(["-i:infoformat=xml", filepath])
 
-    output = run_subprocess(args, logger=logger)
-    output = output.replace("\r\n", "\n")
+    cache_kind = "oiio_info_subimages" if subimages else "oiio_info"
+    cached_output = MEDIA_INFO_CACHE.get(cache_kind, filepath)
+    if cached_output is not None:
+        output = cached_output
+    else:
+        output = run_subprocess(args, logger=logger)
+        output = output.replace("\r\n", "\n")
 
     xml_started = False
     subimages_lines = []
@@ -118,6 +315,9 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
             )
         )
 
+    if cached_output is None:
+        MEDIA_INFO_CACHE.set(cache_kind, filepath, output)
+
     output = []
     for subimage_lines in subimages_lines:
         xml_text = "\n".join(subimage_lines)
@@ -658,7 +858,8 @@ def convert_for_ffmpeg(
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -671,12 +872,19 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Contiguous frames of a sequence are converted by single oiiotool
+    process using '--frames'. Frames are split to chunks converted
+    concurrently, oiiotool threads are divided between the processes.
+    Conversion stops on first error and already converted output is removed.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of same type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Max number of concurrent oiiotool
+            processes. Number of CPUs is used if not passed.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
@@ -695,7 +903,231 @@ def convert_input_paths_for_ffmpeg(
         ).format(ext))
 
     input_info = get_oiio_info_for_input(first_input_path, logger=logger)
+    conversion_options = _get_ffmpeg_conversion_options(input_info, logger)
+
+    cpu_count = multiprocessing.cpu_count()
+    if max_workers is None:
+        max_workers = cpu_count
+    jobs = _get_conversion_jobs(input_paths, output_dir, max_workers)
+    workers = max(1, min(max_workers, len(jobs)))
+
+    # Divide threads between concurrent processes
+    threads = None
+    if workers > 1:
+        threads = max(1, cpu_count // workers)
+
+    oiio_cmds = [
+        _get_ffmpeg_conversion_cmd(
+            input_path, output_path, conversion_options, frames, threads
+        )
+        for input_path, output_path, frames in jobs
+    ]
+
+    failed_event = threading.Event()
+
+    def _convert(oiio_cmd):
+        # Skip conversions that did not start before first failure
+        if failed_event.is_set():
+            return
+        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+        try:
+            run_subprocess(oiio_cmd, logger=logger)
+        except BaseException:
+            failed_event.set()
+            raise
+
+    errors = []
+    if ThreadPoolExecutor is None or workers < 2:
+        for oiio_cmd in oiio_cmds:
+            try:
+                _convert(oiio_cmd)
+            except BaseException as exc:
+                errors.append(exc)
+                break
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_convert, oiio_cmd)
+                for oiio_cmd in oiio_cmds
+            ]
+        for future in futures:
+            exc = future.exception()
+            if exc is not None:
+                errors.append(exc)
+
+    if errors:
+        # Remove partial output so it's not used by following processing
+        for _input_path, output_path, frames in jobs:
+            for path in _get_conversion_output_paths(output_path, frames):
+                if os.path.exists(path):
+                    os.remove(path)
+        raise errors[0]
+
+
+def stream_converted_frames_to_ffmpeg(
+    ffmpeg_args,
+    input_paths,
+    logger=None,
+    buffer_size=None,
+    shell=False
+):
+    """Run ffmpeg reading frames converted for ffmpeg from its stdin.
+
+    Alternative to 'convert_input_paths_for_ffmpeg' which does not need
+    converted copy of whole sequence. Frames are converted ahead in
+    frame order and written to stdin of ffmpeg process. At most
+    'buffer_size' converted frames exist in temporary directory at once,
+    each frame is removed right after it was written.
+
+    Currently can convert only exrs. The ffmpeg command must read the video
+    input from 'pipe:0' using 'exr_pipe' format.
 
+    Args:
+        ffmpeg_args (Union[str, list[str]]): Ffmpeg command.
+        input_paths (list[str]): Paths to frames in order they should be
+            read by ffmpeg. Same path can be used multiple times (to fill
+            gaps in sequence).
+        logger (logging.Logger): Logger used for logging.
+        buffer_size (Optional[int]): Max number of frames converted ahead.
+            Number of CPUs is used if not passed.
+        shell (bool): Ffmpeg command should be executed in shell.
+
+    Returns:
+        str: Output of ffmpeg process.
+
+    Raises:
+        ValueError: If input filepath has extension not supported by function.
+            Currently is supported only ".exr" extension.
+        RuntimeError: If conversion of frame or ffmpeg process failed.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    first_input_path = input_paths[0]
+    ext = os.path.splitext(first_input_path)[1].lower()
+    if ext != ".exr":
+        raise ValueError((
+            "Function 'stream_converted_frames_to_ffmpeg' currently support"
+            " only \".exr\" extension. Got \"{}\"."
+        ).format(ext))
+
+    input_info = get_oiio_info_for_input(first_input_path, logger=logger)
+    conversion_options = _get_ffmpeg_conversion_options(input_info, logger)
+
+    cpu_count = multiprocessing.cpu_count()
+    if buffer_size is None:
+        buffer_size = cpu_count
+    buffer_size = max(1, buffer_size)
+    threads = None
+    if buffer_size > 1:
+        threads = max(1, cpu_count // buffer_size)
+
+    executor = None
+    if ThreadPoolExecutor is not None and buffer_size > 1:
+        executor = ThreadPoolExecutor(max_workers=buffer_size)
+
+    temp_dir = get_transcode_temp_directory()
+    output_lines = []
+    proc = subprocess.Popen(
+        ffmpeg_args,
+        shell=shell,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT
+    )
+    # Output must be read during streaming otherwise ffmpeg may block
+    output_thread = threading.Thread(
+        target=lambda: output_lines.extend(proc.stdout)
+    )
+    output_thread.start()
+
+    pending = collections.deque()
+    frames_iter = iter(enumerate(input_paths))
+    try:
+        while True:
+            # Convert frames ahead to keep buffer full
+            while len(pending) < buffer_size:
+                item = next(frames_iter, None)
+                if item is None:
+                    break
+                idx, input_path = item
+                output_path = os.path.join(
+                    temp_dir, "{:08d}{}".format(idx, ext)
+                )
+                oiio_cmd = _get_ffmpeg_conversion_cmd(
+                    input_path, output_path, conversion_options,
+                    threads=threads
+                )
+                logger.debug(
+                    "Conversion command: {}".format(" ".join(oiio_cmd)))
+                if executor is None:
+                    run_subprocess(oiio_cmd, logger=logger)
+                    future = None
+                else:
+                    future = executor.submit(
+                        run_subprocess, oiio_cmd, logger=logger
+                    )
+                pending.append((future, output_path))
+
+            if not pending:
+                break
+
+            future, output_path = pending[0]
+            if future is not None:
+                future.result()
+            pending.popleft()
+
+            try:
+                with open(output_path, "rb") as stream:
+                    shutil.copyfileobj(stream, proc.stdin)
+            except (IOError, OSError):
+                # Ffmpeg does not read input anymore, result is validated
+                #   by its return code
+                break
+            finally:
+                os.remove(output_path)
+
+    finally:
+        for future, _ in pending:
+            if future is not None:
+                future.cancel()
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        try:
+            proc.stdin.close()
+        except (IOError, OSError):
+            pass
+
+        # Conversion failed, ffmpeg result is not needed
+        if pending and proc.poll() is None:
+            proc.kill()
+
+        proc.wait()
+        output_thread.join()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    output = b"".join(output_lines).decode("utf-8", errors="backslashreplace")
+    if output:
+        logger.debug(output)
+
+    if proc.returncode != 0:
+        raise RuntimeError((
+            "Executing arguments was not successful: \"{}\""
+            "\n\nOutput:\n{}"
+        ).format(ffmpeg_args, output))
+
+    return output
+
+
+def _get_ffmpeg_conversion_options(input_info, logger):
+    """Prepare oiiotool arguments shared by conversions of all frames.
+
+    Returns:
+        dict[str, Any]: Compression, input and channel arguments and
+            arguments erasing attributes not supported by ffmpeg.
+    """
     # Change compression only if source compression is "dwaa" or "dwab"
     #   - they're not supported in ffmpeg
     compression = input_info["attribs"].get("compression")
@@ -705,71 +1137,149 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
-    for input_path in input_paths:
-        # Prepare subprocess arguments
-        oiio_cmd = get_oiio_tool_args(
-            "oiiotool",
-            # Don't add any additional attributes
-            "--nosoftwareattrib",
-        )
-        # Add input compression if available
-        if compression:
-            oiio_cmd.extend(["--compression", compression])
+    erase_args = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
 
-        oiio_cmd.extend([
-            input_arg, input_path,
-            # Tell oiiotool which channels should be put to top stack
-            #   (and output)
-            "--ch", channels_arg,
-            # Use first subimage
-            "--subimage", "0"
-        ])
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing prohibited symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
 
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
 
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
-
-        # Add last argument - path to output
-        base_filename = os.path.basename(input_path)
-        output_path = os.path.join(output_dir, base_filename)
-        oiio_cmd.extend([
-            "-o", output_path
-        ])
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            erase_args.extend(["--eraseattrib", attr_name])
 
-        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+    return {
+        "compression": compression,
+        "input_arg": input_arg,
+        "channels_arg": channels_arg,
+        "erase_args": erase_args,
+    }
+
+
+def _get_ffmpeg_conversion_cmd(
+    input_path, output_path, conversion_options, frames=None, threads=None
+):
+    # Prepare subprocess arguments
+    oiio_cmd = get_oiio_tool_args(
+        "oiiotool",
+        # Don't add any additional attributes
+        "--nosoftwareattrib",
+    )
+    if threads:
+        oiio_cmd.extend(["--threads", str(threads)])
+
+    if frames:
+        oiio_cmd.extend(["--frames", frames])
+
+    # Add input compression if available
+    compression = conversion_options["compression"]
+    if compression:
+        oiio_cmd.extend(["--compression", compression])
+
+    oiio_cmd.extend([
+        conversion_options["input_arg"], input_path,
+        # Tell oiiotool which channels should be put to top stack
+        #   (and output)
+        "--ch", conversion_options["channels_arg"],
+        # Use first subimage
+        "--subimage", "0"
+    ])
+    oiio_cmd.extend(conversion_options["erase_args"])
+
+    # Add last argument - path to output
+    oiio_cmd.extend([
+        "-o", output_path
+    ])
+    return oiio_cmd
+
+
+def _get_conversion_jobs(input_paths, output_dir, max_workers):
+    """Split input paths to oiiotool conversions.
+
+    Contiguous frames of sequences are converted using '--frames' with
+    frame pattern. Frames are split to chunks so there is at least
+    'max_workers' of chunks if possible.
+
+    Returns:
+        list[tuple[str, str, Union[str, None]]]: Input path or pattern,
+            output path or pattern and frames range for each conversion.
+    """
+    sequences, remainders = clique.assemble(
+        input_paths,
+        patterns=[clique.PATTERNS["frames"]],
+        assume_padded_when_ambiguous=True
+    )
+
+    jobs = []
+    for input_path in remainders:
+        output_path = os.path.join(output_dir, os.path.basename(input_path))
+        jobs.append((input_path, output_path, None))
+
+    ranges = []
+    for sequence in sequences:
+        frames = sorted(sequence.indexes)
+        range_start = previous = frames[0]
+        for frame in frames[1:]:
+            if frame != previous + 1:
+                ranges.append((sequence, range_start, previous))
+                range_start = frame
+            previous = frame
+        ranges.append((sequence, range_start, previous))
+
+    frames_count = sum(end - start + 1 for _, start, end in ranges)
+    chunk_size = max(1, int(math.ceil(frames_count / float(max_workers or 1))))
+    for sequence, range_start, range_end in ranges:
+        input_pattern = sequence.format("{head}{padding}{tail}")
+        output_pattern = os.path.join(
+            output_dir,
+            os.path.basename(sequence.format("{head}{padding}{tail}"))
+        )
+        for chunk_start in range(range_start, range_end + 1, chunk_size):
+            chunk_end = min(range_end, chunk_start + chunk_size - 1)
+            jobs.append((
+                input_pattern,
+                output_pattern,
+                "{}-{}".format(chunk_start, chunk_end)
+            ))
+    return jobs
+
+
+def _get_conversion_output_paths(output_path, frames):
+    if not frames:
+        return [output_path]
+    start, end = frames.split("-")
+    return [
+        output_path % frame
+        for frame in range(int(start), int(end) + 1)
+    ]
 
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Output is cached in 'MEDIA_INFO_CACHE' until the file changes.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
@@ -779,6 +1289,11 @@ def get_ffprobe_data(path_to_file, logger=None):
     logger.debug(
         "Getting information about input \"{}\".".format(path_to_file)
     )
+    cached_output = MEDIA_INFO_CACHE.get("ffprobe", path_to_file)
+    if cached_output is not None:
+        logger.debug("Using cached FFprobe output.")
+        return json.loads(cached_output)
+
     ffprobe_args = get_ffmpeg_tool_args("ffprobe")
     args = ffprobe_args + [
         "-hide_banner",
@@ -820,7 +1335,11 @@ def get_ffprobe_data(path_to_file, logger=None):
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)
+    data = json.loads(popen_stdout)
+    if popen.returncode == 0:
+        MEDIA_INFO_CACHE.set(
+            "ffprobe", path_to_file, popen_stdout.decode("utf-8"))
+    return data
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
@@ -1130,31 +1649,129 @@ def convert_colorspace(
     Raises:
         ValueError: if misconfigured
     """
+    convert_colorspace_batch(
+        input_path,
+        [{
+            "output_path": output_path,
+            "target_colorspace": target_colorspace,
+            "view": view,
+            "display": display,
+            "additional_command_args": additional_command_args,
+        }],
+        config_path,
+        source_colorspace,
+        logger=logger
+    )
+
+
+def convert_colorspace_batch(
+    input_path,
+    outputs,
+    config_path,
+    source_colorspace,
+    input_info=None,
+    threads=None,
+    logger=None,
+):
+    """Convert source file to multiple outputs from single decode of input.
+
+    Decoded input is duplicated on oiiotool stack ('--dup') for each output
+    so input is read only once. Output arguments (like '-d' for bit depth)
+    stay set for all following outputs, so only one output with additional
+    command arguments is converted in the same command, others are
+    converted by separate commands.
+
+    Args:
+        input_path (str): Path that should be converted. Single file or
+            image sequence in format 'file.FRAMESTART-FRAMEEND#.ext'.
+        outputs (list[dict[str, Any]]): Output definitions with keys
+            'output_path', 'target_colorspace', 'view', 'display' and
+            'additional_command_args', see 'convert_colorspace'.
+        config_path (str): path to OCIO config file
+        source_colorspace (str): ocio valid color space of source files
+        input_info (Optional[dict]): Output of 'get_oiio_info_for_input'
+            for input, allows to probe image sequence only once.
+        threads (Optional[int]): Number of threads used by oiiotool.
+        logger (logging.Logger): Logger used for logging.
+    Raises:
+        ValueError: if misconfigured
+    """
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    input_info = get_oiio_info_for_input(input_path, logger=logger)
+    # Validate all outputs before any conversion starts
+    plain_outputs_args = []
+    outputs_args = []
+    for output in outputs:
+        additional_command_args = output.get("additional_command_args")
+        output_args = _get_colorspace_conversion_args(
+            source_colorspace,
+            output.get("target_colorspace"),
+            output.get("view"),
+            output.get("display"),
+            additional_command_args
+        )
+        output_args.extend(["-o", output["output_path"]])
+        if additional_command_args:
+            outputs_args.append(output_args)
+        else:
+            plain_outputs_args.append(output_args)
+
+    # Output with additional arguments must be last in command
+    batches = [plain_outputs_args + outputs_args[:1]]
+    batches.extend([output_args] for output_args in outputs_args[1:])
+
+    if input_info is None:
+        input_info = get_oiio_info_for_input(input_path, logger=logger)
 
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
-    # Prepare subprocess arguments
-    oiio_cmd = get_oiio_tool_args(
-        "oiiotool",
-        # Don't add any additional attributes
-        "--nosoftwareattrib",
-        "--colorconfig", config_path
-    )
+    for batch in batches:
+        if not batch:
+            continue
 
-    oiio_cmd.extend([
-        input_arg, input_path,
-        # Tell oiiotool which channels should be put to top stack
-        #   (and output)
-        "--ch", channels_arg,
-        # Use first subimage
-        "--subimage", "0"
-    ])
+        # Prepare subprocess arguments
+        oiio_cmd = get_oiio_tool_args(
+            "oiiotool",
+            # Don't add any additional attributes
+            "--nosoftwareattrib",
+            "--colorconfig", config_path
+        )
+        if threads:
+            oiio_cmd.extend(["--threads", str(threads)])
 
+        oiio_cmd.extend([
+            input_arg, input_path,
+            # Tell oiiotool which channels should be put to top stack
+            #   (and output)
+            "--ch", channels_arg,
+            # Use first subimage
+            "--subimage", "0"
+        ])
+
+        last_idx = len(batch) - 1
+        for idx, output_args in enumerate(batch):
+            if idx == last_idx:
+                oiio_cmd.extend(output_args)
+                break
+            # Convert copy of decoded input and remove it after output
+            #   so the input is on top of stack for next output
+            oiio_cmd.append("--dup")
+            oiio_cmd.extend(output_args)
+            oiio_cmd.append("--pop")
+
+        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
+        run_subprocess(oiio_cmd, logger=logger)
+
+
+def _get_colorspace_conversion_args(
+    source_colorspace,
+    target_colorspace,
+    view,
+    display,
+    additional_command_args
+):
     if all([target_colorspace, view, display]):
         raise ValueError("Colorspace and both screen and display"
                          " cannot be set together."
@@ -1162,21 +1779,18 @@ def convert_colorspace(
     if not target_colorspace and not all([view, display]):
         raise ValueError("Both screen and display must be set.")
 
+    args = []
     if additional_command_args:
-        oiio_cmd.extend(additional_command_args)
+        args.extend(additional_command_args)
 
     if target_colorspace:
-        oiio_cmd.extend(["--colorconvert",
-                         source_colorspace,
-                         target_colorspace])
+        args.extend(["--colorconvert",
+                     source_colorspace,
+                     target_colorspace])
     if view and display:
-        oiio_cmd.extend(["--iscolorspace", source_colorspace])
-        oiio_cmd.extend(["--ociodisplay", display, view])
-
-    oiio_cmd.extend(["-o", output_path])
-
-    logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-    run_subprocess(oiio_cmd, logger=logger)
+        args.extend(["--iscolorspace", source_colorspace])
+        args.extend(["--ociodisplay", display, view])
+    return args
 
 
 def split_cmd_args(in_args):
@@ -29,6 +29,7 @@ from openpype.settings import (
 )
 
 from openpype.settings.lib import (
+    DEFAULTS_DIR,
     get_studio_system_settings_overrides,
     load_json_file,
 )
@@ -39,6 +40,7 @@ from openpype.settings.ayon_settings import (
 
 from openpype.lib import (
     Logger,
+    env_value_to_bool,
     import_filepath,
     import_module_from_dirpath,
 )
@@ -76,6 +78,14 @@ IGNORED_HOSTS_IN_AYON = {
     "flame",
     "harmony",
 }
+# Hosts imported with host of 'AVALON_APP' when modules are loaded lazily
+# - photoshop and aftereffects use webpublisher addon for headless publishing
+LAZY_HOST_DEPENDENCIES = {
+    "photoshop": {"webpublisher"},
+    "aftereffects": {"webpublisher"},
+}
+# Filename of manifest of default modules and hosts in "./openpype/modules"
+MODULES_MANIFEST_FILENAME = "modules_manifest.json"
 
 
 # Inherit from `object` for Python 2 hosts
@@ -94,11 +104,15 @@ class _ModuleClass(object):
         # Where modules and interfaces are stored
         super(_ModuleClass, self).__setattr__("__attributes__", dict())
         super(_ModuleClass, self).__setattr__("__defaults__", set())
+        # Modules skipped by lazy loading, imported on first usage
+        super(_ModuleClass, self).__setattr__("__lazy__", dict())
 
         super(_ModuleClass, self).__setattr__("_log", None)
 
     def __getattr__(self, attr_name):
         if attr_name not in self.__attributes__:
+            if attr_name in self.__lazy__:
+                return self.__lazy__[attr_name]
             if attr_name in ("__path__", "__file__"):
                 return None
             raise AttributeError("'{}' has not attribute '{}'".format(
@@ -180,6 +194,10 @@ class _LoadCache:
     modules_lock = threading.Lock()
     interfaces_loaded = False
     modules_loaded = False
+    # Manifest used to load modules, 'None' if modules were loaded eagerly
+    manifest = None
+    # Time spent on import of each python module by its name
+    import_times = {}
 
 
 def get_default_modules_dir():
@@ -248,6 +266,419 @@ def get_module_dirs():
     return dirpaths
 
 
+def get_modules_manifest_path():
+    """Path to manifest of default modules and hosts."""
+    return os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        MODULES_MANIFEST_FILENAME
+    )
+
+
+def is_lazy_modules_loading_enabled():
+    """Modules are loaded lazily using manifest.
+
+    Lazy loading is enabled with 'OPENPYPE_LAZY_MODULES' environment
+    variable. Default modules disabled in studio settings are not imported
+    and only host of 'AVALON_APP' is imported from hosts.
+
+    Returns:
+        bool: Lazy loading is enabled.
+    """
+    return env_value_to_bool("OPENPYPE_LAZY_MODULES", default=False)
+
+
+def get_modules_manifest():
+    """Manifest of default modules and hosts.
+
+    Manifest is created with 'create_modules_manifest' and contains import
+    string and addon classes of each module and host. Addon classes contain
+    class name, addon name, host name and key of modules settings which
+    defines if addon is enabled.
+
+    ```javascript
+    {
+        "modules": {
+            "ftrack": {
+                "import_str": "openpype.modules.ftrack",
+                "addons": [
+                    {
+                        "class_name": "FtrackModule",
+                        "name": "ftrack",
+                        "host_name": null,
+                        "settings_key": "ftrack"
+                    }
+                ]
+            },
+            ...
+        },
+        "hosts": {...}
+    }
+    ```
+
+    Returns:
+        Union[dict[str, Any], None]: Manifest data or None if manifest
+            does not exist or can't be read.
+    """
+    path = get_modules_manifest_path()
+    if not os.path.exists(path):
+        return None
+
+    try:
+        manifest = load_json_file(path)
+    except Exception:
+        Logger.get_logger("ModulesLoader").warning(
+            "Failed to read modules manifest {}".format(path),
+            exc_info=True
+        )
+        return None
+
+    if "modules" not in manifest or "hosts" not in manifest:
+        return None
+    return manifest
+
+
+def create_modules_manifest(filepath=None):
+    """Create manifest of default modules and hosts.
+
+    All default modules and hosts are imported to find their addon classes.
+    Manifest must be re-created when addon class is added, renamed or
+    removed. Addons are initialized with default settings to find out if
+    their enabled state is defined by settings, so manifest should not be
+    created in AYON mode.
+
+    Args:
+        filepath (Optional[str]): Where manifest is stored. Path from
+            'get_modules_manifest_path' is used if not passed.
+
+    Returns:
+        dict[str, Any]: Manifest data.
+    """
+    if filepath is None:
+        filepath = get_modules_manifest_path()
+
+    load_interfaces()
+
+    log = Logger.get_logger("ModulesManifest")
+    modules_settings = _load_default_modules_settings()
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    hosts_dir = os.path.join(os.path.dirname(current_dir), "hosts")
+    manifest = {}
+    for key, dirpath, package, ignored_filenames in (
+        (
+            "modules",
+            current_dir,
+            "openpype.modules",
+            IGNORED_DEFAULT_FILENAMES
+        ),
+        ("hosts", hosts_dir, "openpype.hosts", ()),
+    ):
+        entries = {}
+        for filename in sorted(os.listdir(dirpath)):
+            if (
+                filename in IGNORED_FILENAMES
+                or filename in ignored_filenames
+            ):
+                continue
+
+            fullpath = os.path.join(dirpath, filename)
+            basename, ext = os.path.splitext(filename)
+            if os.path.isdir(fullpath):
+                init_path = os.path.join(fullpath, "__init__.py")
+                if not os.path.exists(init_path):
+                    continue
+
+            elif ext != ".py":
+                continue
+
+            import_str = "{}.{}".format(package, basename)
+            # Addons are unknown if import fails so module is always
+            #   imported and searched for addon classes
+            addons = None
+            try:
+                module = __import__(import_str, fromlist=("", ))
+                addons = [
+                    {
+                        "class_name": addon_class.__name__,
+                        "name": _get_addon_class_name(addon_class),
+                        "host_name": _get_addon_class_host_name(addon_class),
+                        "settings_key": _get_addon_settings_key(
+                            addon_class, modules_settings
+                        )
+                    }
+                    for addon_class in _get_addon_classes(module)
+                ]
+
+            except Exception:
+                log.warning(
+                    "Failed to import {}".format(import_str), exc_info=True
+                )
+
+            entries[basename] = {
+                "import_str": import_str,
+                "addons": addons
+            }
+        manifest[key] = entries
+
+    with open(filepath, "w") as stream:
+        json.dump(manifest, stream, indent=4, sort_keys=True)
+        stream.write("\n")
+    return manifest
+
+
+def _get_addon_class_name(addon_class):
+    name = getattr(addon_class, "name", None)
+    if isinstance(name, six.string_types):
+        return name
+    return None
+
+
+def _get_addon_class_host_name(addon_class):
+    if not issubclass(addon_class, IHostAddon):
+        return None
+    host_name = getattr(addon_class, "host_name", None)
+    if isinstance(host_name, six.string_types):
+        return host_name
+    return None
+
+
+def _get_addon_settings_key(addon_class, modules_settings):
+    """Key of modules settings which defines if addon is enabled.
+
+    Addon is initialized with enabled and disabled value in settings to
+    validate that its enabled state is defined only by the value.
+
+    Returns:
+        Union[str, None]: Settings key or None if enabled state of addon
+            is not defined by settings.
+    """
+    name = _get_addon_class_name(addon_class)
+    if (
+        name is None
+        or not issubclass(addon_class, OpenPypeModule)
+        or not isinstance(modules_settings.get(name), dict)
+        or "enabled" not in modules_settings[name]
+    ):
+        return None
+
+    for enabled in (True, False):
+        settings = copy.deepcopy(modules_settings)
+        settings[name]["enabled"] = enabled
+        try:
+            addon = addon_class(None, settings)
+        except Exception:
+            return None
+
+        if addon.enabled is not enabled:
+            return None
+    return name
+
+
+def _get_addon_classes(module, log=None):
+    """Addon classes available in python module.
+
+    Args:
+        module (types.ModuleType): Python module where to look for classes.
+        log (Optional[logging.Logger]): Logger used to report abstract
+            classes.
+
+    Returns:
+        list[type[AYONAddon]]: Classes which are not abstract.
+    """
+    addon_classes = []
+    for name in dir(module):
+        modules_item = getattr(module, name, None)
+        # Filter globals that are not classes which inherit from
+        #   AYONAddon
+        if (
+            not inspect.isclass(modules_item)
+            or modules_item is AYONAddon
+            or modules_item is OpenPypeModule
+            or modules_item is OpenPypeAddOn
+            or not issubclass(modules_item, AYONAddon)
+        ):
+            continue
+
+        # Check if class is abstract (Developing purpose)
+        if inspect.isabstract(modules_item):
+            if log is None:
+                continue
+            # Find abstract attributes by convention on `abc` module
+            not_implemented = []
+            for attr_name in dir(modules_item):
+                attr = getattr(modules_item, attr_name, None)
+                abs_method = getattr(
+                    attr, "__isabstractmethod__", None
+                )
+                if attr and abs_method:
+                    not_implemented.append(attr_name)
+
+            # Log missing implementations
+            log.warning((
+                "Skipping abstract Class: {}."
+                " Missing implementations: {}"
+            ).format(name, ", ".join(not_implemented)))
+            continue
+        addon_classes.append(modules_item)
+    return addon_classes
+
+
+def _get_manifest_addon_classes(module, entry):
+    """Addon classes of python module defined in manifest entry.
+
+    Returns:
+        Union[list[type[AYONAddon]], None]: Addon classes or None if
+            manifest does not match content of the module.
+    """
+    addons = entry.get("addons")
+    if addons is None:
+        return None
+
+    addon_classes = []
+    for addon in addons:
+        addon_class = getattr(module, addon["class_name"], None)
+        if (
+            not inspect.isclass(addon_class)
+            or not issubclass(addon_class, AYONAddon)
+            or inspect.isabstract(addon_class)
+        ):
+            return None
+        addon_classes.append(addon_class)
+    return addon_classes
+
+
+def _load_default_modules_settings():
+    return load_json_file(
+        os.path.join(DEFAULTS_DIR, SYSTEM_SETTINGS_KEY, "modules.json")
+    )
+
+
+def _get_module_enabled_states():
+    """Enabled state of modules from studio settings.
+
+    System settings can't be used during modules loading because default
+    settings of modules require loaded modules. Values are taken from
+    studio overrides and default settings of "./openpype/settings".
+
+    Returns:
+        dict[str, bool]: Enabled state by module settings key.
+    """
+    studio_overrides = get_studio_system_settings_overrides()
+    output = {}
+    for modules_settings in (
+        _load_default_modules_settings(),
+        studio_overrides.get("modules") or {},
+    ):
+        for key, value in modules_settings.items():
+            if isinstance(value, dict) and "enabled" in value:
+                output[key] = value["enabled"]
+    return output
+
+
+def _get_names_skipped_by_manifest(manifest):
+    """Default modules and hosts which are not imported in lazy loading.
+
+    Modules are skipped if all their addons are disabled in studio settings
+    and their enabled state is defined only by settings.
+    Hosts are skipped if 'AVALON_APP' is set and they don't provide
+    addon for the host. Modules or hosts with unknown addons are
+    never skipped.
+
+    Args:
+        manifest (dict[str, Any]): Manifest of modules and hosts.
+
+    Returns:
+        tuple[set[str], set[str]]: Names of skipped modules and hosts.
+    """
+    skipped_modules = set()
+    # Settings of modules are converted from AYON settings, only hosts
+    #   are skipped in AYON mode
+    if not AYON_SERVER_ENABLED:
+        enabled_states = _get_module_enabled_states()
+        for basename, entry in manifest["modules"].items():
+            addons = entry.get("addons")
+            if not addons:
+                continue
+
+            if all(
+                addon.get("settings_key")
+                and enabled_states.get(addon["settings_key"]) is False
+                for addon in addons
+            ):
+                skipped_modules.add(basename)
+
+    skipped_hosts = set()
+    current_host_name = os.environ.get("AVALON_APP")
+    if not current_host_name:
+        return skipped_modules, skipped_hosts
+
+    required_host_names = {current_host_name}
+    required_host_names |= LAZY_HOST_DEPENDENCIES.get(
+        current_host_name, set()
+    )
+    for basename, entry in manifest["hosts"].items():
+        addons = entry.get("addons")
+        if not addons:
+            continue
+
+        host_names = {
+            addon["host_name"]
+            for addon in addons
+            if addon["host_name"]
+        }
+        if host_names and not host_names & required_host_names:
+            skipped_hosts.add(basename)
+    return skipped_modules, skipped_hosts
+
+
+def _register_lazy_modules(
+    openpype_modules, modules_key, import_prefix, basenames, log
+):
+    """Make modules skipped by lazy loading importable on first usage.
+
+    Skipped modules are not used as addons but other code can still import
+    them from 'openpype_modules', e.g. settings entities import
+    'sync_server'. Module is executed on first access to its attribute.
+
+    Args:
+        openpype_modules (_ModuleClass): Fake module with loaded modules.
+        modules_key (str): Name of 'openpype_modules' in 'sys.modules'.
+        import_prefix (str): Package of modules, e.g. 'openpype.modules'.
+        basenames (Iterable[str]): Names of skipped modules.
+        log (logging.Logger): Logger.
+
+    Returns:
+        set[str]: Names of registered modules, other modules can't be
+            imported lazily and should be loaded.
+    """
+    try:
+        from importlib.util import find_spec, module_from_spec, LazyLoader
+    except ImportError:
+        return set()
+
+    registered = set()
+    for basename in basenames:
+        import_str = "{}.{}".format(import_prefix, basename)
+        module = sys.modules.get(import_str)
+        if module is None:
+            try:
+                spec = find_spec(import_str)
+            except Exception:
+                spec = None
+            if spec is None or spec.loader is None:
+                log.debug("Module {} can't be imported lazily".format(
+                    import_str))
+                continue
+            spec.loader = LazyLoader(spec.loader)
+            module = module_from_spec(spec)
+            sys.modules[import_str] = module
+            spec.loader.exec_module(module)
+
+        sys.modules["{}.{}".format(modules_key, basename)] = module
+        openpype_modules.__lazy__[basename] = module
+        registered.add(basename)
+    return registered
+
+
 def load_interfaces(force=False):
     """Load interfaces from modules into `openpype_interfaces`.
 
@@ -549,6 +980,43 @@ def _load_modules():
     if AYON_SERVER_ENABLED:
         ignored_current_dir_filenames |= IGNORED_FILENAMES_IN_AYON
 
+    # Skip default modules and hosts which are not used
+    # - modules and hosts missing in manifest are imported
+    manifest = None
+    if is_lazy_modules_loading_enabled():
+        manifest = get_modules_manifest()
+        if manifest is None:
+            log.warning(
+                "Modules manifest is not available. Loading all modules."
+            )
+
+    if manifest is not None:
+        skipped_modules, skipped_hosts = _get_names_skipped_by_manifest(
+            manifest
+        )
+        skipped_modules = _register_lazy_modules(
+            openpype_modules,
+            modules_key,
+            "openpype.modules",
+            skipped_modules,
+            log
+        )
+        skipped_hosts = _register_lazy_modules(
+            openpype_modules,
+            modules_key,
+            "openpype.hosts",
+            skipped_hosts,
+            log
+        )
+        log.debug("Skipped modules: {}, skipped hosts: {}".format(
+            ", ".join(sorted(skipped_modules)),
+            ", ".join(sorted(skipped_hosts))
+        ))
+        ignored_current_dir_filenames |= skipped_modules
+        ignored_host_names |= skipped_hosts
+    _LoadCache.manifest = manifest
+    _LoadCache.import_times = {}
+
     processed_paths = set()
     for dirpath in frozenset(module_dirs):
         # Skip already processed paths
@@ -570,9 +1038,15 @@ def _load_modules():
             if filename in IGNORED_FILENAMES:
                 continue
 
+            fullpath = os.path.join(dirpath, filename)
+            basename, ext = os.path.splitext(filename)
+
             if (
                 is_in_current_dir
-                and filename in ignored_current_dir_filenames
+                and (
+                    filename in ignored_current_dir_filenames
+                    or basename in ignored_current_dir_filenames
+                )
             ):
                 continue
 
@@ -582,9 +1056,6 @@ def _load_modules():
             ):
                 continue
 
-            fullpath = os.path.join(dirpath, filename)
-            basename, ext = os.path.splitext(filename)
-
             if basename in ignore_addon_names:
                 continue
 
@@ -604,6 +1075,7 @@ def _load_modules():
 
             # TODO add more logic how to define if folder is module or not
             # - check manifest and content of manifest
+            import_start = time.time()
             try:
                 # Don't import dynamically current directory modules
                 if is_in_current_dir:
@@ -647,6 +1119,10 @@ def _load_modules():
                     msg = "Failed to import module '{}'.".format(fullpath)
                 log.error(msg, exc_info=True)
 
+            import_time = time.time() - import_start
+            _LoadCache.import_times[basename] = import_time
+            log.debug("Imported '{}' in {:.3f}s".format(basename, import_time))
+
 
 @six.add_metaclass(ABCMeta)
 class AYONAddon(object):
@@ -898,41 +1374,28 @@ class ModulesManager:
         time_start = time.time()
         prev_start_time = time_start
 
+        manifest = _LoadCache.manifest or {}
+        manifest_entries = {}
+        for key in ("modules", "hosts"):
+            manifest_entries.update(manifest.get(key) or {})
+
+        import_report = {}
         module_classes = []
-        for module in openpype_modules:
+        for basename, module in openpype_modules.items():
+            # Use addon classes from manifest if are available
+            addon_classes = None
+            entry = manifest_entries.get(basename)
+            if entry is not None:
+                addon_classes = _get_manifest_addon_classes(module, entry)
+
             # Go through globals in `pype.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   AYONAddon
-                if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is AYONAddon
-                    or modules_item is OpenPypeModule
-                    or modules_item is OpenPypeAddOn
-                    or not issubclass(modules_item, AYONAddon)
-                ):
-                    continue
+            if addon_classes is None:
+                addon_classes = _get_addon_classes(module, self.log)
 
-                # Check if class is abstract (Developing purpose)
-                if inspect.isabstract(modules_item):
-                    # Find abstract attributes by convention on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
-                        )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
-
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
-                    continue
-                module_classes.append(modules_item)
+            import_time = _LoadCache.import_times.get(basename)
+            if addon_classes and import_time is not None:
+                import_report[addon_classes[0].__name__] = import_time
+            module_classes.extend(addon_classes)
 
         for modules_item in module_classes:
             is_openpype_module = issubclass(modules_item, OpenPypeModule)
@@ -963,6 +1426,10 @@ class ModulesManager:
                 )
 
         if self._report is not None:
+            import_report[self._report_total_key] = sum(
+                _LoadCache.import_times.values()
+            )
+            self._report["Import"] = import_report
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
 
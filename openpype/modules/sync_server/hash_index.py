@@ -0,0 +1,241 @@
+import os
+import json
+import collections
+import hashlib
+import threading
+
+import appdirs
+
+from openpype.lib import Logger
+
+
+def get_file_content_hash(file_path, chunk_size=4 * 1024 * 1024):
+    """Sha256 of file content.
+
+    Args:
+        file_path (str): Path to file.
+        chunk_size (int): Size of chunks read at once.
+
+    Returns:
+        str: Hex digest.
+    """
+    hash_obj = hashlib.sha256()
+    with open(file_path, "rb") as stream:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
+
+class ContentHashIndex:
+    """Index of file contents already synchronized to sites.
+
+    Content hash of a published file is calculated only once. It is cached
+    by local path with modification time and size of the file, so the same
+    published file is not read again until it is changed. Only
+    'max_content_hashes' of most recently used files are kept.
+
+    For each site the index stores content hash to site path of a file
+    already synchronized to the site, with size and modification time of
+    the file on site. Entry is used only if the file on site still has the
+    same size and modification time, it is dropped otherwise. Index is
+    stored in local user directory so it survives restart of the server.
+
+    Args:
+        root (Optional[str]): Directory where index files are stored.
+    """
+
+    max_content_hashes = 10000
+
+    def __init__(self, root=None):
+        if root is None:
+            root = os.path.join(
+                appdirs.user_data_dir("openpype", "pypeclub"),
+                "sync_server"
+            )
+        self._root = root
+        self._lock = threading.Lock()
+        self._content_hashes = None
+        self._paths_by_site = {}
+        self._changed = set()
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    def get_content_hash(self, file_path):
+        """Content hash of local file.
+
+        Args:
+            file_path (str): Resolved local path of the file.
+
+        Returns:
+            str: Content hash.
+        """
+        stat = os.stat(file_path)
+        key = os.path.normpath(file_path)
+        with self._lock:
+            content_hashes = self._get_content_hashes()
+            entry = content_hashes.pop(key, None)
+            if entry is not None:
+                # move to the end as recently used
+                content_hashes[key] = entry
+                self._changed.add(None)
+        if (
+            entry is not None
+            and entry["mtime"] == stat.st_mtime
+            and entry["size"] == stat.st_size
+        ):
+            return entry["hash"]
+
+        content_hash = get_file_content_hash(file_path)
+        with self._lock:
+            content_hashes = self._get_content_hashes()
+            content_hashes.pop(key, None)
+            content_hashes[key] = {
+                "hash": content_hash,
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+            }
+            while len(content_hashes) > self.max_content_hashes:
+                content_hashes.popitem(last=False)
+            self._changed.add(None)
+        return content_hash
+
+    def get_path(self, site_name, content_hash, file_stat):
+        """Path on site of file with the same content.
+
+        Args:
+            site_name (str): Site name.
+            content_hash (str): Content hash of file.
+            file_stat (Callable[[str], Union[dict, None]]): Returns 'size'
+                and 'mtime' of file on site or None if file doesn't exist.
+
+        Returns:
+            Union[str, None]: Path of file on site or None if content
+                is not on site.
+        """
+        with self._lock:
+            entry = self._get_site_paths(site_name).get(content_hash)
+        if not isinstance(entry, dict):
+            self.remove_path(site_name, content_hash)
+            return None
+
+        path = entry["path"]
+        stat = file_stat(path)
+        if (
+            stat is None
+            or stat["size"] != entry["size"]
+            or stat["mtime"] != entry["mtime"]
+        ):
+            self.log.debug("Indexed file {} was changed".format(path))
+            self.remove_path(site_name, content_hash)
+            return None
+        return path
+
+    def add_path(self, site_name, content_hash, path, stat):
+        """Store that content is available on site under 'path'.
+
+        Other content indexed under the same path is removed as the file
+        was overwritten.
+
+        Args:
+            site_name (str): Site name.
+            content_hash (str): Content hash of file.
+            path (str): Path of file on site.
+            stat (dict): 'size' and 'mtime' of file on site.
+        """
+        with self._lock:
+            site_paths = self._get_site_paths(site_name)
+            self._pop_path_entries(site_paths, path)
+            site_paths[content_hash] = {
+                "path": path,
+                "size": stat["size"],
+                "mtime": stat["mtime"],
+            }
+            self._changed.add(site_name)
+
+    def remove_path(self, site_name, content_hash):
+        """Remove path which is not available on site anymore."""
+        with self._lock:
+            if self._get_site_paths(site_name).pop(content_hash, None):
+                self._changed.add(site_name)
+
+    def remove_file(self, site_name, path):
+        """Remove entries of file which was deleted or overwritten."""
+        with self._lock:
+            if self._pop_path_entries(self._get_site_paths(site_name), path):
+                self._changed.add(site_name)
+
+    @staticmethod
+    def _pop_path_entries(site_paths, path):
+        content_hashes = [
+            content_hash
+            for content_hash, entry in site_paths.items()
+            if not isinstance(entry, dict) or entry["path"] == path
+        ]
+        for content_hash in content_hashes:
+            site_paths.pop(content_hash)
+        return bool(content_hashes)
+
+    def save(self):
+        """Write changed parts of index to disk."""
+        with self._lock:
+            changed = self._changed
+            self._changed = set()
+            for site_name in changed:
+                if site_name is None:
+                    data = self._content_hashes
+                else:
+                    data = self._paths_by_site[site_name]
+                self._write(self._get_filepath(site_name), data)
+
+    def _get_content_hashes(self):
+        if self._content_hashes is None:
+            # entries are stored from least recently used
+            self._content_hashes = collections.OrderedDict(
+                (key, entry)
+                for key, entry in self._read(
+                    self._get_filepath(None)).items()
+                # skip entries stored in older format
+                if isinstance(entry, dict)
+            )
+        return self._content_hashes
+
+    def _get_site_paths(self, site_name):
+        paths = self._paths_by_site.get(site_name)
+        if paths is None:
+            paths = self._read(self._get_filepath(site_name))
+            self._paths_by_site[site_name] = paths
+        return paths
+
+    def _get_filepath(self, site_name):
+        if site_name is None:
+            filename = "content_hashes.json"
+        else:
+            filename = "hash_index_{}.json".format(site_name)
+        return os.path.join(self._root, filename)
+
+    def _read(self, filepath):
+        if not os.path.exists(filepath):
+            return {}
+        try:
+            with open(filepath, "r") as stream:
+                return json.load(
+                    stream, object_pairs_hook=collections.OrderedDict)
+        except ValueError:
+            self.log.warning(
+                "Hash index {} is corrupted".format(filepath), exc_info=True)
+        return {}
+
+    def _write(self, filepath, data):
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        tmp_path = filepath + ".tmp"
+        with open(tmp_path, "w") as stream:
+            json.dump(data, stream)
+        os.replace(tmp_path, filepath)
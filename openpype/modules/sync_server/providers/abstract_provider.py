@@ -11,6 +11,8 @@ class AbstractProvider:
     LABEL = ''
 
     _log = None
+    # limits transfer rate of site, set by sync server before transfer
+    bandwidth_limiter = None
 
     def __init__(self, project_name, site_name, tree=None, presets=None):
         self.presets = None
@@ -27,6 +29,18 @@ class AbstractProvider:
             self._log = Logger.get_logger(self.__class__.__name__)
         return self._log
 
+    def consume_bandwidth(self, size):
+        """Wait until 'size' bytes can be transferred.
+
+        Should be called for each transferred chunk so transfer rate of
+        site is limited during the whole transfer.
+
+        Args:
+            size (int): Number of transferred bytes.
+        """
+        if self.bandwidth_limiter is not None and size > 0:
+            self.bandwidth_limiter.consume(size)
+
     @abc.abstractmethod
     def is_active(self):
         """
@@ -117,6 +131,43 @@ class AbstractProvider:
         """
         pass
 
+    def copy_remote_file(self, source_path, target_path):
+        """
+            Copy file already present on provider to 'target_path'.
+
+            Used to avoid upload of content which is already on provider.
+            Provider should link or copy the file on its side if possible.
+
+        Args:
+            source_path (string): absolute path of existing file on provider
+            target_path (string): absolute path of new file on provider
+
+        Returns:
+            (string) file_id of created file
+        Raises:
+            NotImplementedError: provider can't copy files on its side
+            FileNotFoundError: 'source_path' doesn't exist
+        """
+        raise NotImplementedError(
+            "{} can't copy files".format(self.__class__.__name__))
+
+    def get_file_stat(self, path):
+        """
+            Size and modification time of file on provider.
+
+            Used to validate that file with known content was not changed.
+
+        Args:
+            path (string): absolute path of file on provider
+
+        Returns:
+            (dict) with 'size' and 'mtime' or None if file doesn't exist
+        Raises:
+            NotImplementedError: provider can't return file stat
+        """
+        raise NotImplementedError(
+            "{} can't return file stat".format(self.__class__.__name__))
+
     @abc.abstractmethod
     def delete_file(self, path):
         """
@@ -262,8 +262,10 @@ class DropboxHandler(AbstractProvider):
             CHUNK_SIZE = 50 * 1024 * 1024
 
             if file_size <= CHUNK_SIZE:
+                self.consume_bandwidth(file_size)
                 self.dbx.files_upload(f.read(), path, mode=mode)
             else:
+                self.consume_bandwidth(CHUNK_SIZE)
                 upload_session_start_result = \
                     self.dbx.files_upload_session_start(f.read(CHUNK_SIZE))
 
@@ -274,6 +276,8 @@ class DropboxHandler(AbstractProvider):
                 commit = dropbox.files.CommitInfo(path=path, mode=mode)
 
                 while f.tell() < file_size:
+                    self.consume_bandwidth(
+                        min(CHUNK_SIZE, file_size - f.tell()))
                     if (file_size - f.tell()) <= CHUNK_SIZE:
                         self.dbx.files_upload_session_finish(
                             f.read(CHUNK_SIZE),
@@ -331,6 +335,8 @@ class DropboxHandler(AbstractProvider):
         if os.path.exists(local_path) and overwrite:
             os.unlink(local_path)
 
+        # whole file is downloaded at once
+        self.consume_bandwidth(file.get("size") or 0)
         self.dbx.files_download_to_file(local_path, source_path)
 
         server.update_db(
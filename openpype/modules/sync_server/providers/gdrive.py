@@ -327,9 +327,13 @@ class GDriveHandler(AbstractProvider):
             self.log.debug("Start Upload! {}".format(source_path))
             last_tick = status = response = None
             status_val = 0
+            uploaded_size = 0
             while response is None:
                 if status:
                     status_val = float(status.progress())
+                    self.consume_bandwidth(
+                        status.resumable_progress - uploaded_size)
+                    uploaded_size = status.resumable_progress
                 if not last_tick or \
                         time.time() - last_tick >= server.LOG_PROGRESS_SEC:
                     last_tick = time.time()
@@ -350,6 +354,7 @@ class GDriveHandler(AbstractProvider):
                 ):
                     raise ValueError("Paused during process, please redo.")
                 status, response = request.next_chunk()
+            self.consume_bandwidth(media.size() - uploaded_size)
 
         except errors.HttpError as ex:
             if ex.resp['status'] == '404':
@@ -414,12 +419,17 @@ class GDriveHandler(AbstractProvider):
                                                  supportsAllDrives=True)
 
         with open(local_path + "/" + target_name, "wb") as fh:
-            downloader = MediaIoBaseDownload(fh, request)
+            downloader = MediaIoBaseDownload(
+                fh, request, chunksize=self.CHUNK_SIZE)
             last_tick = status = response = None
             status_val = 0
+            downloaded_size = 0
             while response is None:
                 if status:
                     status_val = float(status.progress())
+                    self.consume_bandwidth(
+                        status.resumable_progress - downloaded_size)
+                    downloaded_size = status.resumable_progress
                 if not last_tick or \
                         time.time() - last_tick >= server.LOG_PROGRESS_SEC:
                     last_tick = time.time()
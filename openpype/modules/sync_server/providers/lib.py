@@ -13,7 +13,8 @@ class ProviderFactory:
     def __init__(self):
         self.providers = {}  # {'PROVIDER_LABEL: {cls, int},..}
 
-    def register_provider(self, provider, creator, batch_limit):
+    def register_provider(self, provider, creator, batch_limit,
+                          max_transfers=None):
         """
             Provide all necessary information for one specific remote provider
         Args:
@@ -21,10 +22,12 @@ class ProviderFactory:
             creator (class): class implementing AbstractProvider
             batch_limit (int): number of files that could be processed in
                                     one loop (based on provider API quota)
+            max_transfers (int): number of files transferred concurrently
+                by all sites of provider, None for no limit
         Returns:
             modifies self.providers and self.sites
         """
-        self.providers[provider] = (creator, batch_limit)
+        self.providers[provider] = (creator, batch_limit, max_transfers)
 
     def get_provider(self, provider, project_name, site_name,
                      tree=None, presets=None):
@@ -67,6 +70,17 @@ class ProviderFactory:
         info = self._get_creator_info(provider)
         return info[1]
 
+    def get_provider_max_transfers(self, provider):
+        """
+            Max number of concurrent transfers for all sites of 'provider'.
+        Args:
+            provider (string): 'gdrive','S3'
+        Returns:
+            (int) or None if not limited
+        """
+        info = self._get_creator_info(provider)
+        return info[2]
+
     def get_provider_configurable_items(self, provider):
         """
             Returns dict of modifiable properties for 'provider'.
@@ -93,7 +107,7 @@ class ProviderFactory:
         Args:
             provider (string): 'gdrive' etc
         Returns:
-            (tuple): (creator, batch_limit)
+            (tuple): (creator, batch_limit, max_transfers)
                 creator is class of a provider (ex: GDriveHandler)
                 batch_limit denotes how many files synced at single loop
                    its provided via 'register_provider' as its needed even
@@ -111,8 +125,8 @@ factory = ProviderFactory()
 # this says that there is implemented provider with a label 'gdrive'
 # there is implementing 'GDriveHandler' class
 # 7 denotes number of files that could be synced in single loop - learned by
-# trial and error
-factory.register_provider(GDriveHandler.CODE, GDriveHandler, 7)
-factory.register_provider(DropboxHandler.CODE, DropboxHandler, 10)
-factory.register_provider(LocalDriveHandler.CODE, LocalDriveHandler, 50)
-factory.register_provider(SFTPHandler.CODE, SFTPHandler, 20)
+# trial and error, last number is limit of concurrent transfers
+factory.register_provider(GDriveHandler.CODE, GDriveHandler, 7, 3)
+factory.register_provider(DropboxHandler.CODE, DropboxHandler, 10, 3)
+factory.register_provider(LocalDriveHandler.CODE, LocalDriveHandler, 50, 8)
+factory.register_provider(SFTPHandler.CODE, SFTPHandler, 20, 4)
@@ -1,10 +1,10 @@
 from __future__ import print_function
-import os.path
+import os
+import errno
 import shutil
-import threading
 import time
 
-from openpype.lib import Logger
+from openpype.lib import Logger, create_hard_link, clone_file
 from openpype.lib.local_settings import get_local_site_id
 from openpype.pipeline import Anatomy
 from .abstract_provider import AbstractProvider
@@ -16,6 +16,11 @@ class LocalDriveHandler(AbstractProvider):
     CODE = 'local_drive'
     LABEL = 'Local drive'
 
+    # size of chunk copied between progress reports
+    CHUNK_SIZE = 8 * 1024 * 1024
+    # suffix of partially copied file, used for resume of copy
+    PARTIAL_SUFFIX = ".part"
+
     """ Handles required operations on mounted disks with OS """
     def __init__(self, project_name, site_name, tree=None, presets=None):
         self.presets = None
@@ -93,11 +98,11 @@ class LocalDriveHandler(AbstractProvider):
                                     .format(source_path))
 
         if overwrite:
-            thread = threading.Thread(target=self._copy,
-                                      args=(source_path, target_path))
-            thread.start()
-            self._mark_progress(project_name, file, representation, server,
-                                site, source_path, target_path, direction)
+            progress_callback = self._get_progress_callback(
+                project_name, file, representation, server, site,
+                os.path.getsize(source_path), direction
+            )
+            self._copy(source_path, target_path, progress_callback)
         else:
             if os.path.exists(target_path):
                 raise ValueError("File {} exists, set overwrite".
@@ -116,6 +121,35 @@ class LocalDriveHandler(AbstractProvider):
                                 representation, site,
                                 overwrite, direction="Download")
 
+    def copy_remote_file(self, source_path, target_path):
+        """
+            Hardlinks or clones existing file to 'target_path'
+        """
+        if not os.path.isfile(source_path):
+            raise FileNotFoundError("Source file {} doesn't exist."
+                                    .format(source_path))
+
+        if os.path.exists(target_path):
+            if os.path.samefile(source_path, target_path):
+                return os.path.basename(target_path)
+            os.remove(target_path)
+
+        try:
+            create_hard_link(source_path, target_path)
+        except (OSError, NotImplementedError):
+            clone_file(source_path, target_path)
+        return os.path.basename(target_path)
+
+    def get_file_stat(self, path):
+        """
+            Size and modification time of file at 'path'
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return {"size": stat.st_size, "mtime": stat.st_mtime}
+
     def delete_file(self, path):
         """
             Deletes a file at 'path'
@@ -183,41 +217,117 @@ class LocalDriveHandler(AbstractProvider):
         """
         pass
 
-    def _copy(self, source_path, target_path):
+    def _copy(self, source_path, target_path, progress_callback=None):
+        """
+            Copies file in chunks, reports copied bytes to
+            'progress_callback'.
+
+            File is copied to temporary '.part' file first which is renamed
+            to 'target_path' when complete, so interrupted copy could be
+            resumed from copied offset. 'copy_file_range' is used to copy
+            chunks inside of kernel where available.
+        """
         print("copying {}->{}".format(source_path, target_path))
-        try:
-            shutil.copy(source_path, target_path)
-        except shutil.SameFileError:
+        if (
+            os.path.exists(target_path)
+            and os.path.samefile(source_path, target_path)
+        ):
             print("same files, skipping")
+            return
+
+        partial_path = target_path + self.PARTIAL_SUFFIX
+        source_stat = os.stat(source_path)
+        offset = 0
+        if os.path.exists(partial_path):
+            partial_stat = os.stat(partial_path)
+            # resume only if source was not changed since copy started
+            if (
+                partial_stat.st_size <= source_stat.st_size
+                and partial_stat.st_mtime >= source_stat.st_mtime
+            ):
+                offset = partial_stat.st_size
+                log.debug("Resuming copy of {} from {} bytes".format(
+                    source_path, offset))
+
+        mode = "ab" if offset else "wb"
+        with open(source_path, "rb") as src_stream:
+            with open(partial_path, mode) as dst_stream:
+                self._copy_chunks(
+                    src_stream, dst_stream, offset, source_stat.st_size,
+                    progress_callback
+                )
+
+        shutil.copymode(source_path, partial_path)
+        os.replace(partial_path, target_path)
+
+    def _copy_chunks(self, src_stream, dst_stream, offset, size,
+                     progress_callback):
+        src_fd = src_stream.fileno()
+        dst_fd = dst_stream.fileno()
+        use_copy_range = hasattr(os, "copy_file_range")
+        src_stream.seek(offset)
+        while offset < size:
+            chunk_size = min(self.CHUNK_SIZE, size - offset)
+            copied = None
+            if use_copy_range:
+                try:
+                    copied = os.copy_file_range(
+                        src_fd, dst_fd, chunk_size, offset, offset
+                    )
+                except OSError as exc:
+                    if exc.errno not in (
+                        errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                        errno.EOPNOTSUPP, errno.EBADF
+                    ):
+                        raise
+                    use_copy_range = False
+
+            if copied is None:
+                src_stream.seek(offset)
+                dst_stream.seek(offset)
+                data = src_stream.read(chunk_size)
+                dst_stream.write(data)
+                dst_stream.flush()
+                copied = len(data)
+
+            if not copied:
+                raise IOError(
+                    "Source file {} was truncated during copy".format(
+                        src_stream.name))
+
+            offset += copied
+            self.consume_bandwidth(copied)
+            if progress_callback is not None:
+                progress_callback(offset)
+
+    def _get_progress_callback(self, project_name, file, representation,
+                               server, site, source_file_size, direction):
+        """
+            Returns callback updating progress field in DB by values 0-1.
 
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        source_file_size = os.path.getsize(source_path)
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
+            Progress is written at most once per 'LOG_PROGRESS_SEC'.
+        """
+        # list to allow change from callback in Python 2 syntax
+        last_tick = [None]
+
+        def progress_callback(copied_size):
+            if copied_size >= source_file_size:
+                return
+            if last_tick[0] and \
+                    time.time() - last_tick[0] < server.LOG_PROGRESS_SEC:
+                return
+            last_tick[0] = time.time()
+            status_val = copied_size / source_file_size
+            log.debug(direction + "ed %d%%." % int(status_val * 100))
+            server.update_db(project_name=project_name,
+                             new_file_id=None,
+                             file=file,
+                             representation=representation,
+                             site=site,
+                             progress=status_val
+                             )
+
+        return progress_callback
 
     def _normalize_site_name(self, site_name):
         """Transform user id to 'local' for Local settings"""
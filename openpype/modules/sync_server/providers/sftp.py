@@ -1,8 +1,10 @@
 import os
 import os.path
 import time
+import socket
 import threading
 import platform
+import contextlib
 
 from openpype.lib import Logger
 from openpype.settings import get_system_settings
@@ -10,6 +12,7 @@ from .abstract_provider import AbstractProvider
 log = Logger.get_logger("SyncServer-SFTPHandler")
 
 pysftp = None
+paramiko = None
 try:
     import pysftp
     import paramiko
@@ -20,6 +23,140 @@ except (ImportError, SyntaxError):
     log.warning("Import failed, imported from Python 2, operations will fail.")
 
 
+class SFTPConnectionPool:
+    """Pool of SFTP sessions shared by all handlers of the same server.
+
+    Handlers are created for each transferred file, so connections are
+    stored on pool instead of handler. Pool also caches folders known to
+    exist on server to save round trips for files in the same folder,
+    the cache is cleared when any operation fails as folders might have
+    been removed by other process.
+
+    Args:
+        create_func (Callable[[], pysftp.Connection]): Creates new
+            connection.
+        max_size (int): Max number of opened connections.
+    """
+
+    def __init__(self, create_func, max_size):
+        self._create_func = create_func
+        self._semaphore = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle = []
+        self._existing_folders = set()
+        self._closed = False
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Borrow connection from pool.
+
+        Connection is closed instead of returned to pool if transport
+        failed during usage.
+        """
+        self._semaphore.acquire()
+        conn = None
+        try:
+            conn = self._acquire()
+            yield conn
+        except (EOFError, socket.error, paramiko.SSHException):
+            self._close(conn)
+            conn = None
+            self.clear_known_folders()
+            raise
+        except Exception:
+            self.clear_known_folders()
+            raise
+        finally:
+            if conn is not None:
+                with self._lock:
+                    if self._closed:
+                        self._close(conn)
+                    else:
+                        self._idle.append(conn)
+            self._semaphore.release()
+
+    def is_folder_known(self, path):
+        with self._lock:
+            return path in self._existing_folders
+
+    def add_known_folder(self, path):
+        """Mark 'path' and all its parents as existing."""
+        with self._lock:
+            while path and path not in self._existing_folders:
+                self._existing_folders.add(path)
+                parent = os.path.dirname(path)
+                if parent == path:
+                    break
+                path = parent
+
+    def forget_folder(self, path):
+        """Remove 'path' and its subfolders from known folders."""
+        prefix = path.rstrip("/") + "/"
+        with self._lock:
+            self._existing_folders = {
+                folder
+                for folder in self._existing_folders
+                if folder != path and not folder.startswith(prefix)
+            }
+
+    def clear_known_folders(self):
+        with self._lock:
+            self._existing_folders = set()
+
+    def close(self):
+        """Close idle connections, used connections are not returned."""
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+            self._existing_folders = set()
+            self._closed = True
+        for conn in idle:
+            self._close(conn)
+
+    def _acquire(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn = self._idle.pop()
+            if self._is_alive(conn):
+                return conn
+            self._close(conn)
+
+        conn = self._create_func()
+        if conn is None:
+            raise ConnectionError("Couldn't connect to SFTP server")
+        return conn
+
+    @staticmethod
+    def _is_alive(conn):
+        try:
+            return conn.sftp_client.get_channel().get_transport().is_active()
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(conn):
+        if conn is None:
+            return
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _remove_pool(key, pool):
+    """Remove pool from shared pools and close its connections."""
+    with _pools_lock:
+        if _pools.get(key) is pool:
+            _pools.pop(key)
+    pool.close()
+
+
 class SFTPHandler(AbstractProvider):
     """
         Implementation of SFTP API.
@@ -34,12 +171,19 @@ class SFTPHandler(AbstractProvider):
     CODE = 'sftp'
     LABEL = 'SFTP'
 
+    # max opened connections to one server, transfers + metadata queries
+    MAX_CONNECTIONS = 5
+    # size of chunk between progress reports
+    CHUNK_SIZE = 4 * 1024 * 1024
+    # suffix of partially transferred file, used for resume of transfer
+    PARTIAL_SUFFIX = ".part"
+
     def __init__(self, project_name, site_name, tree=None, presets=None):
         self.presets = None
         self.project_name = project_name
         self.site_name = site_name
         self.root = None
-        self._conn = None
+        self._pool = None
 
         self.presets = presets
         if not self.presets:
@@ -59,12 +203,34 @@ class SFTPHandler(AbstractProvider):
         self._tree = None
 
     @property
-    def conn(self):
-        """SFTP connection, cannot be used in all places though."""
-        if not self._conn:
-            self._conn = self._get_conn()
-
-        return self._conn
+    def pool(self):
+        """Connection pool shared by handlers of the same server."""
+        if self._pool is None:
+            key = self._get_pool_key()
+            with _pools_lock:
+                pool = _pools.get(key)
+                if pool is None:
+                    pool = SFTPConnectionPool(self._get_conn,
+                                              self.MAX_CONNECTIONS)
+                    _pools[key] = pool
+            self._pool = pool
+        return self._pool
+
+    def _get_pool_key(self):
+        """Connections can be shared only with the same credentials."""
+        return (
+            self.sftp_host,
+            self.sftp_port,
+            self.sftp_user,
+            self.sftp_pass,
+            self._get_private_key(),
+            self.sftp_key_pass
+        )
+
+    def _get_private_key(self):
+        if not self.sftp_key:
+            return None
+        return self.sftp_key[platform.system().lower()]
 
     def is_active(self):
         """
@@ -72,7 +238,13 @@ class SFTPHandler(AbstractProvider):
         Returns:
             (boolean)
         """
-        return self.presets.get("enabled") and self.conn is not None
+        if not self.presets.get("enabled"):
+            return False
+        try:
+            with self.pool.connection():
+                return True
+        except Exception:
+            return False
 
     @classmethod
     def get_system_settings_schema(cls):
@@ -218,7 +390,10 @@ class SFTPHandler(AbstractProvider):
         Returns:
             (string) folder id of lowest subfolder from 'path'
         """
-        self.conn.makedirs(path)
+        if not self.pool.is_folder_known(path):
+            with self.pool.connection() as conn:
+                conn.makedirs(path)
+            self.pool.add_known_folder(path)
 
         return os.path.basename(path)
 
@@ -254,18 +429,53 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._upload,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "upload")
+        progress_callback = self._get_progress_callback(
+            project_name, file, representation, server, site,
+            os.path.getsize(source_path), "upload"
+        )
+        self._upload(source_path, target_path, progress_callback)
 
         return os.path.basename(target_path)
 
-    def _upload(self, source_path, target_path):
+    def _upload(self, source_path, target_path, progress_callback=None):
+        """Upload file with pipelined writes.
+
+        Data are written to '.part' file which is renamed when complete,
+        interrupted upload continues from size of the '.part' file.
+        """
         print("copying {}->{}".format(source_path, target_path))
-        conn = self._get_conn()
-        conn.put(source_path, target_path)
+        partial_path = target_path + self.PARTIAL_SUFFIX
+        source_stat = os.stat(source_path)
+        with self.pool.connection() as conn:
+            sftp = conn.sftp_client
+            offset = 0
+            try:
+                partial_stat = sftp.stat(partial_path)
+                if (
+                    partial_stat.st_size <= source_stat.st_size
+                    and partial_stat.st_mtime >= int(source_stat.st_mtime)
+                ):
+                    offset = partial_stat.st_size
+            except IOError:
+                pass
+
+            mode = "ab" if offset else "wb"
+            with open(source_path, "rb") as src_stream:
+                with sftp.open(partial_path, mode) as dst_stream:
+                    # do not wait for server response for each write
+                    dst_stream.set_pipelined(True)
+                    src_stream.seek(offset)
+                    while True:
+                        data = src_stream.read(self.CHUNK_SIZE)
+                        if not data:
+                            break
+                        dst_stream.write(data)
+                        offset += len(data)
+                        self.consume_bandwidth(len(data))
+                        if progress_callback is not None:
+                            progress_callback(offset)
+
+            self._replace(sftp, partial_path, target_path)
 
     def download_file(self, source_path, target_path,
                       server, project_name, file, representation, site,
@@ -300,18 +510,70 @@ class SFTPHandler(AbstractProvider):
                 raise ValueError("File {} exists, set overwrite".
                                  format(target_path))
 
-        thread = threading.Thread(target=self._download,
-                                  args=(source_path, target_path))
-        thread.start()
-        self._mark_progress(project_name, file, representation, server,
-                            site, source_path, target_path, "download")
+        self._download(source_path, target_path, server, project_name,
+                       file, representation, site)
 
         return os.path.basename(target_path)
 
-    def _download(self, source_path, target_path):
+    def _download(self, source_path, target_path, server=None,
+                  project_name=None, file=None, representation=None,
+                  site=None):
+        """Download file with prefetched reads.
+
+        Data are written to local '.part' file which is renamed when
+        complete, interrupted download continues from its size.
+        """
         print("downloading {}->{}".format(source_path, target_path))
-        conn = self._get_conn()
-        conn.get(source_path, target_path)
+        partial_path = target_path + self.PARTIAL_SUFFIX
+        with self.pool.connection() as conn:
+            sftp = conn.sftp_client
+            source_stat = sftp.stat(source_path)
+            size = source_stat.st_size
+            progress_callback = None
+            if server is not None:
+                progress_callback = self._get_progress_callback(
+                    project_name, file, representation, server, site,
+                    size, "download"
+                )
+
+            offset = 0
+            if os.path.exists(partial_path):
+                partial_stat = os.stat(partial_path)
+                if (
+                    partial_stat.st_size <= size
+                    and partial_stat.st_mtime >= source_stat.st_mtime
+                ):
+                    offset = partial_stat.st_size
+
+            mode = "ab" if offset else "wb"
+            with sftp.open(source_path, "rb") as src_stream:
+                src_stream.seek(offset)
+                # request remaining data ahead in parallel
+                src_stream.prefetch(size)
+                with open(partial_path, mode) as dst_stream:
+                    while offset < size:
+                        data = src_stream.read(self.CHUNK_SIZE)
+                        if not data:
+                            break
+                        dst_stream.write(data)
+                        offset += len(data)
+                        self.consume_bandwidth(len(data))
+                        if progress_callback is not None:
+                            progress_callback(offset)
+
+        os.replace(partial_path, target_path)
+
+    def _replace(self, sftp, source_path, target_path):
+        """Rename remote file, overwrite existing target."""
+        try:
+            sftp.posix_rename(source_path, target_path)
+        except IOError:
+            # server without 'posix-rename' extension
+            try:
+                sftp.remove(target_path)
+            except IOError:
+                pass
+            sftp.rename(source_path, target_path)
 
     def delete_file(self, path):
         """
@@ -327,7 +589,10 @@ class SFTPHandler(AbstractProvider):
             raise FileNotFoundError("File {} to be deleted doesn't exist."
                                     .format(path))
 
-        self.conn.remove(path)
+        with self.pool.connection() as conn:
+            conn.remove(path)
+        # folder might be removed with its last file
+        self.pool.forget_folder(os.path.dirname(path))
 
     def list_folder(self, folder_path):
         """
@@ -352,7 +617,14 @@ class SFTPHandler(AbstractProvider):
         if not file_path:
             return False
 
-        return self.conn.isdir(file_path)
+        if self.pool.is_folder_known(file_path):
+            return True
+
+        with self.pool.connection() as conn:
+            exists = conn.isdir(file_path)
+        if exists:
+            self.pool.add_known_folder(file_path)
+        return exists
 
     def file_path_exists(self, file_path):
         """
@@ -366,7 +638,8 @@ class SFTPHandler(AbstractProvider):
         if not file_path:
             return False
 
-        return self.conn.isfile(file_path)
+        with self.pool.connection() as conn:
+            return conn.isfile(file_path)
 
     @classmethod
     def get_presets(cls):
@@ -394,8 +667,8 @@ class SFTPHandler(AbstractProvider):
         """
             Returns fresh sftp connection.
 
-            It seems that connection cannot be cached into self.conn, at least
-            for get and put which run in separate threads.
+            Connections are reused through 'pool', a connection must not be
+            used by multiple threads at the same time.
 
         Returns:
             pysftp.Connection
@@ -415,50 +688,45 @@ class SFTPHandler(AbstractProvider):
         if self.sftp_pass and self.sftp_pass.strip():
             conn_params['password'] = self.sftp_pass
         if self.sftp_key:  # expects .pem format, not .ppk!
-            conn_params['private_key'] = \
-                self.sftp_key[platform.system().lower()]
+            conn_params['private_key'] = self._get_private_key()
         if self.sftp_key_pass:
             conn_params['private_key_pass'] = self.sftp_key_pass
 
         try:
             return pysftp.Connection(**conn_params)
+        except paramiko.ssh_exception.AuthenticationException:
+            # credentials are not valid anymore, don't keep pool for them
+            self.log.warning("Couldn't authenticate", exc_info=True)
+            _remove_pool(self._get_pool_key(), self.pool)
         except (paramiko.ssh_exception.SSHException,
                 pysftp.exceptions.ConnectionException):
             self.log.warning("Couldn't connect", exc_info=True)
 
-    def _mark_progress(self, project_name, file, representation, server, site,
-                       source_path, target_path, direction):
-        """
-            Updates progress field in DB by values 0-1.
-
-            Compares file sizes of source and target.
-        """
-        pass
-        if direction == "upload":
-            source_file_size = os.path.getsize(source_path)
-        else:
-            source_file_size = self.conn.stat(source_path).st_size
-
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
-                last_tick = time.time()
-                self.log.debug(direction + "ed %d%%." % int(status_val * 100))
-                server.update_db(project_name=project_name,
-                                 new_file_id=None,
-                                 file=file,
-                                 representation=representation,
-                                 site=site,
-                                 progress=status_val
-                                 )
-            try:
-                if direction == "upload":
-                    target_file_size = self.conn.stat(target_path).st_size
-                else:
-                    target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
+    def _get_progress_callback(self, project_name, file, representation,
+                               server, site, source_file_size, direction):
+        """
+            Returns callback updating progress field in DB by values 0-1.
+
+            Progress is written at most once per 'LOG_PROGRESS_SEC'.
+        """
+        # list to allow change from callback in Python 2 syntax
+        last_tick = [None]
+
+        def progress_callback(transferred_size):
+            if not source_file_size or transferred_size >= source_file_size:
+                return
+            if last_tick[0] and \
+                    time.time() - last_tick[0] < server.LOG_PROGRESS_SEC:
+                return
+            last_tick[0] = time.time()
+            status_val = transferred_size / source_file_size
+            self.log.debug(direction + "ed %d%%." % int(status_val * 100))
+            server.update_db(project_name=project_name,
+                             new_file_id=None,
+                             file=file,
+                             representation=representation,
+                             site=site,
+                             progress=status_val
+                             )
+
+        return progress_callback
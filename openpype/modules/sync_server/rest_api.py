@@ -30,8 +30,22 @@ class SyncServerModuleRestApi:
             self.reset_timer,
         )
 
-    async def reset_timer(self, _request):
-        """Force timer to run immediately."""
-        self.module.reset_timer()
+    async def reset_timer(self, request):
+        """Force timer to run immediately.
+
+        Request body could contain 'project_name' and 'representation_ids'
+        to check only changed representations.
+        """
+        data = {}
+        if request.can_read_body:
+            try:
+                data = await request.json()
+            except ValueError:
+                self.log.warning("Invalid reset timer request data")
+
+        self.module.reset_timer(
+            data.get("project_name"),
+            data.get("representation_ids")
+        )
 
         return Response(status=200)
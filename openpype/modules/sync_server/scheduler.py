@@ -0,0 +1,361 @@
+"""Python 3 only implementation."""
+import time
+import heapq
+import random
+import asyncio
+import itertools
+import threading
+from collections import Counter
+
+from openpype.lib import Logger
+
+
+class TokenBucket:
+    """Token bucket limiting average transfer rate.
+
+    Providers consume tokens for each transferred chunk. Consumer can take
+    more tokens than available, following consumers then wait until the
+    debt is paid back, so chunks bigger than capacity are allowed.
+
+    Args:
+        rate (float): Bytes per second.
+        capacity (Optional[float]): Max burst in bytes, 'rate' by default.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self._tokens = self.capacity
+        self._last_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount):
+        """Take 'amount' of tokens, block until they are available.
+
+        Should be called from worker threads, not from event loop.
+
+        Args:
+            amount (int): Number of bytes.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._last_time) * self.rate
+            )
+            self._last_time = now
+            self._tokens -= amount
+            wait = 0
+            if self._tokens < 0:
+                wait = -self._tokens / self.rate
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class SiteCircuitBreaker:
+    """Stops using a site after repeated failures.
+
+    After 'failure_threshold' consecutive failures the site is not used
+    for a cooldown which doubles with each following trip up to
+    'max_cooldown'. After the cooldown single failure trips the breaker
+    again, first success closes it.
+
+    Args:
+        failure_threshold (int): Consecutive failures tripping the breaker.
+        base_cooldown (float): Seconds of first cooldown.
+        max_cooldown (float): Max seconds of cooldown.
+    """
+
+    def __init__(self, failure_threshold=5, base_cooldown=30,
+                 max_cooldown=900):
+        self._failure_threshold = failure_threshold
+        self._base_cooldown = base_cooldown
+        self._max_cooldown = max_cooldown
+        self._lock = threading.Lock()
+        self._failures = Counter()
+        self._trips = Counter()
+        self._open_until = {}
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    def allows(self, site_name):
+        """Site can be used, breaker is closed or cooldown elapsed."""
+        with self._lock:
+            open_until = self._open_until.get(site_name)
+        return open_until is None or time.monotonic() >= open_until
+
+    def record_success(self, site_name):
+        with self._lock:
+            self._failures.pop(site_name, None)
+            self._trips.pop(site_name, None)
+            self._open_until.pop(site_name, None)
+
+    def record_failure(self, site_name):
+        with self._lock:
+            self._failures[site_name] += 1
+            if self._failures[site_name] < self._failure_threshold:
+                return
+            self._trips[site_name] += 1
+            cooldown = min(
+                self._max_cooldown,
+                self._base_cooldown * 2 ** (self._trips[site_name] - 1)
+            )
+            self._open_until[site_name] = time.monotonic() + cooldown
+            # next failure after cooldown trips the breaker again
+            self._failures[site_name] = self._failure_threshold - 1
+        self.log.warning(
+            "Site {} is failing, not used for {} seconds".format(
+                site_name, cooldown))
+
+
+def get_retry_delay(tries, base_delay, max_delay):
+    """Exponential backoff with random jitter.
+
+    Args:
+        tries (int): Number of already failed attempts.
+        base_delay (float): Delay after first failure.
+        max_delay (float): Max delay.
+
+    Returns:
+        float: Seconds to wait before next attempt.
+    """
+    delay = min(max_delay, base_delay * 2 ** max(tries - 1, 0))
+    return random.uniform(delay / 2, delay)
+
+
+class _TransferJob:
+    def __init__(self, key, site_name, provider, coro_factory, on_done):
+        self.key = key
+        self.site_name = site_name
+        self.provider = provider
+        self.coro_factory = coro_factory
+        self.on_done = on_done
+        self.priority = 0
+        self.not_before = 0
+
+
+class TransferScheduler:
+    """Runs transfers by priority with concurrency limits.
+
+    Transfers are started whenever a slot frees up, the pending transfer
+    with highest priority which fits into limits of its site and provider
+    is started first. Unlike awaiting whole batch, a transfer added with
+    high priority starts as soon as any running transfer finishes.
+
+    Keys of transfers stay 'scheduled' after transfer finished until they
+    are released with 'release_finished', so the same file is not
+    scheduled again before its result is written to database.
+
+    Args:
+        max_transfers (int): Max number of concurrent transfers.
+    """
+
+    def __init__(self, max_transfers):
+        self._max_transfers = max_transfers
+        self._site_limits = {}
+        self._provider_limits = {}
+        self._bandwidth_limiters = {}
+
+        self._queue = []
+        self._counter = itertools.count()
+        self._running = 0
+        self._running_by_site = Counter()
+        self._running_by_provider = Counter()
+        self._scheduled_keys = set()
+        self._finished_jobs = {}
+        self._tasks = set()
+        self._wakeup = None
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    def set_site_limit(self, site_name, limit):
+        """Max concurrent transfers of site, 'None' or 0 for no limit."""
+        self._site_limits[site_name] = limit
+
+    def set_provider_limit(self, provider, limit):
+        """Max concurrent transfers of provider, 'None' or 0 for no limit."""
+        self._provider_limits[provider] = limit
+
+    def set_bandwidth_limit(self, site_name, bytes_per_sec):
+        """Limit average transfer rate of site.
+
+        Args:
+            site_name (str): Site name.
+            bytes_per_sec (Union[int, None]): Limit, 'None' or 0 to remove.
+        """
+        if not bytes_per_sec:
+            self._bandwidth_limiters.pop(site_name, None)
+            return
+
+        limiter = self._bandwidth_limiters.get(site_name)
+        if limiter is None or limiter.rate != bytes_per_sec:
+            self._bandwidth_limiters[site_name] = TokenBucket(bytes_per_sec)
+
+    def get_bandwidth_limiter(self, site_name):
+        """Token bucket of site or None if bandwidth is not limited."""
+        return self._bandwidth_limiters.get(site_name)
+
+    def is_scheduled(self, key):
+        return key in self._scheduled_keys
+
+    def has_pending(self):
+        """Any transfer is waiting or running."""
+        return bool(self._queue) or self._running > 0
+
+    def submit(self, key, priority, site_name, provider, coro_factory,
+               on_done):
+        """Add transfer to queue.
+
+        Args:
+            key (Hashable): Unique identifier of transfer.
+            priority (int): Higher priority transfers are started first.
+            site_name (str): Site used for concurrency limits.
+            provider (str): Provider used for concurrency limits.
+            coro_factory (Callable[[], Awaitable]): Creates coroutine
+                doing the transfer.
+            on_done (Callable[[Any], None]): Called with result of
+                transfer or with raised exception.
+
+        Returns:
+            bool: Transfer was added, False if key is already scheduled.
+        """
+        if key in self._scheduled_keys:
+            return False
+        self._scheduled_keys.add(key)
+        job = _TransferJob(key, site_name, provider, coro_factory, on_done)
+        job.priority = int(priority)
+        self._push(job)
+        return True
+
+    def resubmit(self, key, delay):
+        """Run finished transfer again after 'delay' seconds.
+
+        Can be called only for finished transfer which was not released
+        yet, e.g. from its 'on_done' callback.
+
+        Args:
+            key (Hashable): Identifier of finished transfer.
+            delay (float): Seconds to wait before transfer starts.
+
+        Returns:
+            bool: Transfer was scheduled again.
+        """
+        job = self._finished_jobs.pop(key, None)
+        if job is None:
+            return False
+        job.not_before = time.monotonic() + delay
+        self._push(job)
+        return True
+
+    def _push(self, job):
+        heapq.heappush(
+            self._queue, (-job.priority, next(self._counter), job)
+        )
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def release_finished(self):
+        """Allow finished transfers to be scheduled again.
+
+        Should be called only after results of finished transfers are
+        stored.
+
+        Returns:
+            set: Keys of released transfers.
+        """
+        finished_keys = set(self._finished_jobs.keys())
+        self._finished_jobs = {}
+        self._scheduled_keys -= finished_keys
+        return finished_keys
+
+    async def run(self):
+        """Start waiting transfers whenever a slot frees up."""
+        self._wakeup = asyncio.Event()
+        while True:
+            timeout = self._dispatch()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def _can_start(self, job):
+        if self._running >= self._max_transfers:
+            return False
+        site_limit = self._site_limits.get(job.site_name)
+        if site_limit and self._running_by_site[job.site_name] >= site_limit:
+            return False
+        provider_limit = self._provider_limits.get(job.provider)
+        if (
+            provider_limit
+            and self._running_by_provider[job.provider] >= provider_limit
+        ):
+            return False
+        return True
+
+    def _dispatch(self):
+        """Start transfers which fit into limits.
+
+        Returns:
+            Union[float, None]: Seconds until first delayed transfer can
+                start, None if there is no delayed transfer.
+        """
+        blocked = []
+        timeout = None
+        now = time.monotonic()
+        while self._queue and self._running < self._max_transfers:
+            item = heapq.heappop(self._queue)
+            job = item[-1]
+            if job.not_before > now:
+                blocked.append(item)
+                wait = job.not_before - now
+                if timeout is None or wait < timeout:
+                    timeout = wait
+                continue
+            if not self._can_start(job):
+                blocked.append(item)
+                continue
+            self._running += 1
+            self._running_by_site[job.site_name] += 1
+            self._running_by_provider[job.provider] += 1
+            task = asyncio.ensure_future(self._run_job(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        for item in blocked:
+            heapq.heappush(self._queue, item)
+        return timeout
+
+    async def _run_job(self, job):
+        try:
+            result = await job.coro_factory()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            result = exc
+        finally:
+            self._running -= 1
+            self._running_by_site[job.site_name] -= 1
+            self._running_by_provider[job.provider] -= 1
+            self._finished_jobs[job.key] = job
+            if self._wakeup is not None:
+                self._wakeup.set()
+
+        try:
+            job.on_done(result)
+        except Exception:
+            self.log.warning(
+                "Failed to process result of {}".format(job.key),
+                exc_info=True
+            )
@@ -0,0 +1,151 @@
+import time
+import datetime
+import threading
+from collections import defaultdict
+
+from bson.objectid import ObjectId
+
+
+class SyncQueue:
+    """Queue of representations which should be checked by sync loop.
+
+    Instead of rescanning all representations of a project on each loop,
+    only representations touched since last loop are checked. Queue is fed
+    by site changes ('add_site', 'reset_site_on_representation'), by
+    publishes and by representations which are still waiting for
+    synchronization (e.g. skipped because of batch limit or failed).
+
+    Publishes are found by polling representation '_id', which contains
+    creation time. Id is created before files are integrated and document
+    is inserted after that, so representations created in last
+    'lookback' seconds are polled on each loop and only not yet seen ids
+    are queued. Updated representations keep their id, integrator sends
+    them using 'reset_timer'.
+
+    Full scan of the project is done only when it is requested or when
+    'full_reconcile_interval' elapsed since last full scan, to catch
+    changes made by other processes.
+
+    Args:
+        full_reconcile_interval (int): Seconds between full scans.
+        lookback (int): Seconds for which are polled created
+            representations.
+    """
+
+    def __init__(self, full_reconcile_interval, lookback=3600):
+        self._full_reconcile_interval = full_reconcile_interval
+        self._lookback = lookback
+        self._lock = threading.Lock()
+        # representation ids to check by project name
+        self._pending = defaultdict(set)
+        # polled representation ids in lookback window by project name
+        self._seen = defaultdict(set)
+        # time of last full scan by project name
+        self._last_full_reconcile = {}
+        # time of full scan requests by project name ('None' for all)
+        self._full_reconcile_requests = {}
+
+    def add(self, project_name, representation_ids):
+        """Mark representations to be checked in next loop.
+
+        Args:
+            project_name (str): Project name.
+            representation_ids (Iterable[Union[str, ObjectId]]): Ids of
+                changed representations.
+        """
+        repre_ids = {
+            ObjectId(repre_id)
+            for repre_id in representation_ids
+            if repre_id
+        }
+        if not repre_ids:
+            return
+        with self._lock:
+            self._pending[project_name].update(repre_ids)
+
+    def pop(self, project_name):
+        """Representation ids waiting for check for project.
+
+        Returns:
+            set[ObjectId]: Ids of representations, queue for project
+                is emptied.
+        """
+        with self._lock:
+            return self._pending.pop(project_name, set())
+
+    def request_full_reconcile(self, project_name=None):
+        """Force full scan in next loop.
+
+        Args:
+            project_name (Optional[str]): Full scan only of this project,
+                all projects are scanned if not passed.
+        """
+        with self._lock:
+            self._full_reconcile_requests[project_name] = time.time()
+
+    def needs_full_reconcile(self, project_name):
+        """Full scan of project should be done.
+
+        Returns:
+            bool: Full scan was requested, was never done or is outdated.
+        """
+        with self._lock:
+            last_time = self._last_full_reconcile.get(project_name)
+            requested_time = max(
+                self._full_reconcile_requests.get(project_name, 0),
+                self._full_reconcile_requests.get(None, 0)
+            )
+        if last_time is None or last_time <= requested_time:
+            return True
+        return time.time() - last_time >= self._full_reconcile_interval
+
+    def mark_full_reconciled(self, project_name):
+        """Full scan of project is being done.
+
+        Pending representations of project are discarded as full scan
+        contains them.
+
+        Args:
+            project_name (str): Project name.
+        """
+        with self._lock:
+            self._last_full_reconcile[project_name] = time.time()
+            self._pending.pop(project_name, None)
+
+    def get_lookback_start_id(self):
+        """Lowest representation id which can be polled as new.
+
+        Returns:
+            ObjectId: Id with creation time at start of lookback window.
+        """
+        start = datetime.datetime.utcnow() - datetime.timedelta(
+            seconds=self._lookback
+        )
+        return ObjectId.from_datetime(start)
+
+    def add_polled(self, project_name, representation_ids):
+        """Queue polled representations which were not seen yet.
+
+        Ids outside of lookback window are forgotten.
+
+        Args:
+            project_name (str): Project name.
+            representation_ids (Iterable[ObjectId]): Representations
+                created in lookback window.
+
+        Returns:
+            set[ObjectId]: Newly queued representation ids.
+        """
+        start_time = self.get_lookback_start_id().generation_time
+        with self._lock:
+            seen = {
+                repre_id
+                for repre_id in self._seen[project_name]
+                if repre_id.generation_time >= start_time
+            }
+            new_ids = set(representation_ids) - seen
+            seen |= new_ids
+            self._seen[project_name] = seen
+            if new_ids:
+                self._pending[project_name].update(new_ids)
+        return new_ids
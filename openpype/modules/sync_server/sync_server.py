@@ -1,6 +1,8 @@
 """Python 3 only implementation."""
 import os
+import socket
 import asyncio
+import functools
 import threading
 import concurrent.futures
 from time import sleep
@@ -13,11 +15,28 @@ from openpype.modules.base import ModulesManager
 from openpype.pipeline import Anatomy
 from openpype.pipeline.load.utils import get_representation_path_with_anatomy
 
+from .scheduler import (
+    TransferScheduler,
+    SiteCircuitBreaker,
+    get_retry_delay
+)
 from .utils import SyncStatus, ResumableError
 
+log = Logger.get_logger("SyncServer")
+
+# errors which may not happen when transfer is retried
+TRANSIENT_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    socket.timeout,
+    EOFError,
+    ResumableError
+)
+
 
 async def upload(module, project_name, file, representation, provider_name,
-                 remote_site_name, tree=None, preset=None):
+                 remote_site_name, tree=None, preset=None,
+                 bandwidth_limiter=None):
     """
         Upload single 'file' of a 'representation' to 'provider'.
         Source url is taken from 'file' portion, where {root} placeholder
@@ -41,6 +60,7 @@ async def upload(module, project_name, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        bandwidth_limiter (TokenBucket): limits transfer rate of site
 
     """
     # create ids sequentially, upload file in parallel later
@@ -69,17 +89,34 @@ async def upload(module, project_name, file, representation, provider_name,
             raise NotADirectoryError(err)
 
     loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
-                                         remote_handler.upload_file,
-                                         local_file_path,
-                                         remote_file_path,
-                                         module,
-                                         project_name,
-                                         file,
-                                         representation,
-                                         remote_site_name,
-                                         True
-                                         )
+    content_hash = file_id = None
+    if preset and preset.get("content_dedup"):
+        content_hash, file_id = await loop.run_in_executor(
+            None,
+            _copy_existing_content,
+            module,
+            remote_handler,
+            local_file_path,
+            remote_file_path,
+            remote_site_name
+        )
+
+    if file_id is None:
+        remote_handler.bandwidth_limiter = bandwidth_limiter
+        file_id = await loop.run_in_executor(None,
+                                             remote_handler.upload_file,
+                                             local_file_path,
+                                             remote_file_path,
+                                             module,
+                                             project_name,
+                                             file,
+                                             representation,
+                                             remote_site_name,
+                                             True
+                                             )
+        if content_hash:
+            _index_remote_file(module, remote_handler, content_hash,
+                               remote_file_path, remote_site_name)
 
     module.handle_alternate_site(project_name, representation,
                                  remote_site_name,
@@ -89,7 +126,8 @@ async def upload(module, project_name, file, representation, provider_name,
 
 
 async def download(module, project_name, file, representation, provider_name,
-                   remote_site_name, tree=None, preset=None):
+                   remote_site_name, tree=None, preset=None,
+                   bandwidth_limiter=None):
     """
         Downloads file to local folder denoted in representation.Context.
 
@@ -103,6 +141,7 @@ async def download(module, project_name, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        bandwidth_limiter (TokenBucket): limits transfer rate of site
 
         Returns:
         (string) - 'name' of local file
@@ -125,6 +164,7 @@ async def download(module, project_name, file, representation, provider_name,
     local_site = module.get_active_site(project_name)
 
     loop = asyncio.get_running_loop()
+    remote_handler.bandwidth_limiter = bandwidth_limiter
     file_id = await loop.run_in_executor(None,
                                          remote_handler.download_file,
                                          remote_file_path,
@@ -143,6 +183,68 @@ async def download(module, project_name, file, representation, provider_name,
     return file_id
 
 
+def _copy_existing_content(module, remote_handler, local_file_path,
+                           remote_file_path, remote_site_name):
+    """
+        Use file with the same content already present on remote site.
+
+        Runs in executor, content hash of local file might be calculated.
+
+    Args:
+        module(SyncServerModule): object to run SyncServerModule API
+        remote_handler(AbstractProvider): implementation
+        local_file_path (string): resolved local path
+        remote_file_path (string): resolved target path on remote site
+        remote_site_name (string): remote site
+    Returns:
+        (tuple) - content hash of the file and file_id of file on remote
+            site or None if file must be uploaded
+    """
+    hash_index = module.hash_index
+    content_hash = hash_index.get_content_hash(local_file_path)
+    try:
+        existing_path = hash_index.get_path(remote_site_name, content_hash,
+                                            remote_handler.get_file_stat)
+        if not existing_path:
+            return content_hash, None
+
+        file_id = remote_handler.copy_remote_file(existing_path,
+                                                  remote_file_path)
+    except NotImplementedError:
+        return content_hash, None
+    except (FileNotFoundError, OSError):
+        log.debug("Indexed file {} is not available".format(existing_path),
+                  exc_info=True)
+        hash_index.remove_path(remote_site_name, content_hash)
+        return content_hash, None
+
+    log.debug("Content of {} already on {}, reused {}".format(
+        local_file_path, remote_site_name, existing_path))
+    _index_remote_file(module, remote_handler, content_hash,
+                       remote_file_path, remote_site_name)
+    return content_hash, file_id
+
+
+def _index_remote_file(module, remote_handler, content_hash,
+                       remote_file_path, remote_site_name):
+    """
+        Store content of file written to remote site to hash index.
+
+        Entries of other content stored under the same path are removed.
+    """
+    hash_index = module.hash_index
+    try:
+        stat = remote_handler.get_file_stat(remote_file_path)
+    except NotImplementedError:
+        stat = None
+
+    if stat is None:
+        hash_index.remove_file(remote_site_name, remote_file_path)
+    else:
+        hash_index.add_path(remote_site_name, content_hash,
+                            remote_file_path, stat)
+
+
 def resolve_paths(module, file_path, project_name,
                   remote_site_name=None, remote_handler=None):
     """
@@ -297,7 +399,11 @@ class SyncServerThread(threading.Thread):
         self.module = module
         self.loop = None
         self.is_running = False
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        # one more worker for long running tasks
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=module.MAX_TRANSFERS + 1)
+        self.scheduler = TransferScheduler(module.MAX_TRANSFERS)
+        self.circuit_breaker = SiteCircuitBreaker()
         self.timer = None
 
     def run(self):
@@ -310,6 +416,7 @@ class SyncServerThread(threading.Thread):
             self.loop.set_default_executor(self.executor)
 
             asyncio.ensure_future(self.check_shutdown(), loop=self.loop)
+            asyncio.ensure_future(self.scheduler.run(), loop=self.loop)
             asyncio.ensure_future(self.sync_loop(), loop=self.loop)
             self.log.info("Sync Server Started")
             self.loop.run_forever()
@@ -342,115 +449,14 @@ class SyncServerThread(threading.Thread):
                 project_name = None
                 enabled_projects = self.module.get_enabled_projects()
                 for project_name in enabled_projects:
-                    preset = self.module.sync_project_settings[project_name]
-
-                    local_site, remote_site = self._working_sites(project_name,
-                                                                  preset)
-                    if not all([local_site, remote_site]):
-                        continue
-
-                    sync_repres = self.module.get_sync_representations(
-                        project_name,
-                        local_site,
-                        remote_site
-                    )
-
-                    task_files_to_process = []
-                    files_processed_info = []
-                    # process only unique file paths in one batch
-                    # multiple representation could have same file path
-                    # (textures),
-                    # upload process can find already uploaded file and
-                    # reuse same id
-                    processed_file_path = set()
-
-                    site_preset = preset.get('sites')[remote_site]
-                    remote_provider = \
-                        self.module.get_provider_for_site(site=remote_site)
-                    handler = lib.factory.get_provider(remote_provider,
-                                                       project_name,
-                                                       remote_site,
-                                                       presets=site_preset)
-                    limit = lib.factory.get_provider_batch_limit(
-                        remote_provider)
-                    # first call to get_provider could be expensive, its
-                    # building folder tree structure in memory
-                    # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
-                    for sync in sync_repres:
-                        if limit <= 0:
-                            continue
-                        files = sync.get("files") or []
-                        if files:
-                            for file in files:
-                                # skip already processed files
-                                file_path = file.get('path', '')
-                                if file_path in processed_file_path:
-                                    continue
-                                status = self.module.check_status(
-                                    file,
-                                    local_site,
-                                    remote_site,
-                                    preset.get('config'))
-                                if status == SyncStatus.DO_UPLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        upload(self.module,
-                                               project_name,
-                                               file,
-                                               sync,
-                                               remote_provider,
-                                               remote_site,
-                                               tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
-                                    # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-                                if status == SyncStatus.DO_DOWNLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        download(self.module,
-                                                 project_name,
-                                                 file,
-                                                 sync,
-                                                 remote_provider,
-                                                 remote_site,
-                                                 tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-
-                    self.log.debug("Sync tasks count {}".format(
-                        len(task_files_to_process)
-                    ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
+                    try:
+                        self._process_project(project_name)
+                    except Exception:
+                        # do not stop sync of other projects
+                        self.log.warning(
+                            "Failed to process {}, trying next loop".format(
+                                project_name),
+                            exc_info=True)
 
                 duration = time.time() - start_time
                 self.log.debug("One loop took {:.2f}s".format(duration))
@@ -473,10 +479,123 @@ class SyncServerThread(threading.Thread):
                     "ResumableError in sync loop, trying next loop",
                     exc_info=True)
             except Exception:
-                self.stop()
                 self.log.warning(
-                    "Unhandled except. in sync loop, stopping server",
+                    "Unhandled except. in sync loop, trying next loop",
                     exc_info=True)
+                await asyncio.sleep(self.module.get_loop_delay(None))
+
+    def _process_project(self, project_name):
+        """Schedule transfers of files of 'project_name' to be synced."""
+        preset = self.module.sync_project_settings[project_name]
+
+        local_site, remote_site = self._working_sites(project_name,
+                                                      preset)
+        if not all([local_site, remote_site]):
+            return
+
+        # results of finished transfers must be in DB before
+        # the query so they're not transferred again
+        self.scheduler.release_finished()
+        self.module.flush_db_updates()
+        sync_repres = self._get_sync_representations(
+            project_name,
+            local_site,
+            remote_site
+        )
+
+        # process only unique file paths in one batch
+        # multiple representation could have same file path
+        # (textures),
+        # upload process can find already uploaded file and
+        # reuse same id
+        processed_file_path = set()
+
+        site_preset = preset.get('sites')[remote_site]
+        remote_provider = \
+            self.module.get_provider_for_site(site=remote_site)
+        self._set_transfer_limits(remote_provider, remote_site,
+                                  site_preset)
+        handler = lib.factory.get_provider(remote_provider,
+                                           project_name,
+                                           remote_site,
+                                           presets=site_preset)
+        limit = lib.factory.get_provider_batch_limit(
+            remote_provider)
+        bandwidth_limiter = self.scheduler.get_bandwidth_limiter(
+            remote_site)
+        submitted_count = 0
+        # first call to get_provider could be expensive, its
+        # building folder tree structure in memory
+        # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+        for sync in sync_repres:
+            # representation still waits for sync, check it
+            # again in next loop
+            self.module.sync_queue.add(project_name,
+                                       [sync["_id"]])
+            if limit <= 0:
+                continue
+            files = sync.get("files") or []
+            for file in files:
+                # skip already processed files
+                file_path = file.get('path', '')
+                if file_path in processed_file_path:
+                    continue
+                status = self.module.check_status(
+                    file,
+                    local_site,
+                    remote_site,
+                    preset.get('config'))
+                if status == SyncStatus.DO_UPLOAD:
+                    func = upload
+                    site = remote_site
+                elif status == SyncStatus.DO_DOWNLOAD:
+                    func = download
+                    site = local_site
+                else:
+                    continue
+
+                processed_file_path.add(file_path)
+                key = (project_name, file["_id"], site)
+                # file is transferred or waiting for transfer
+                if self.scheduler.is_scheduled(key):
+                    continue
+
+                tree = handler.get_tree()
+                limit -= 1
+                submitted_count += 1
+                self.scheduler.submit(
+                    key,
+                    sync.get("priority",
+                             self.module.DEFAULT_PRIORITY),
+                    remote_site,
+                    remote_provider,
+                    functools.partial(
+                        func,
+                        self.module,
+                        project_name,
+                        file,
+                        sync,
+                        remote_provider,
+                        remote_site,
+                        tree,
+                        site_preset,
+                        bandwidth_limiter
+                    ),
+                    functools.partial(
+                        self._on_transfer_done,
+                        key,
+                        project_name,
+                        file,
+                        sync,
+                        site,
+                        remote_site,
+                        preset.get("config")
+                    )
+                )
+
+        self.log.debug("Sync tasks count {}".format(
+            submitted_count
+        ))
 
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
@@ -500,6 +619,11 @@ class SyncServerThread(threading.Thread):
         results = await asyncio.gather(*tasks, return_exceptions=True)
         self.log.debug(
             f'Finished awaiting cancelled tasks, results: {results}...')
+        try:
+            self.module.flush_db_updates()
+        except Exception:
+            self.log.warning("Failed to write status updates",
+                             exc_info=True)
         await self.loop.shutdown_asyncgens()
         # to really make sure everything else has time to stop
         self.executor.shutdown(wait=True)
@@ -517,6 +641,107 @@ class SyncServerThread(threading.Thread):
             self.timer.cancel()
             self.timer = None
 
+    def _set_transfer_limits(self, provider, site_name, site_preset):
+        """Set concurrency and bandwidth limits of site to scheduler.
+
+        Site settings 'max_transfers' and 'bandwidth_limit' (in MB/s) are
+        defined in system settings of each site. Value 0 means limit of
+        provider is used for transfers and bandwidth is not limited.
+        """
+        provider_limit = lib.factory.get_provider_max_transfers(provider)
+        self.scheduler.set_provider_limit(provider, provider_limit)
+        site_limit = site_preset.get("max_transfers") or provider_limit
+        self.scheduler.set_site_limit(site_name, site_limit)
+        bandwidth_limit = site_preset.get("bandwidth_limit") or 0
+        self.scheduler.set_bandwidth_limit(
+            site_name, float(bandwidth_limit) * 1024 * 1024)
+
+    def _on_transfer_done(self, key, project_name, file, representation,
+                          site, remote_site, config_preset, result):
+        """Store result of transfer finished by scheduler.
+
+        Transient failures (connection, timeout) are retried with
+        exponential backoff until 'retry_cnt' tries are used, repeated
+        failures of remote site stop its usage for a while.
+        """
+        error = None
+        file_id = result
+        if isinstance(result, BaseException):
+            error = str(result)
+            file_id = None
+        self.module.update_db(project_name,
+                              file_id,
+                              file,
+                              representation,
+                              site,
+                              error)
+
+        if error is None:
+            self.circuit_breaker.record_success(remote_site)
+        elif isinstance(result, TRANSIENT_ERRORS):
+            self.circuit_breaker.record_failure(remote_site)
+            # file doc is not queried again before retry
+            _, site_rec = self.module._get_site_rec(
+                file.get("sites", []), site)
+            tries = 1
+            if site_rec is not None:
+                tries = site_rec.get("tries", 0) + 1
+                site_rec["tries"] = tries
+            if (
+                tries < int(config_preset["retry_cnt"])
+                and self.circuit_breaker.allows(remote_site)
+            ):
+                delay = get_retry_delay(tries,
+                                        self.module.RETRY_BASE_DELAY,
+                                        self.module.RETRY_MAX_DELAY)
+                self.log.debug("Retrying {} in {:.1f}s".format(
+                    file.get("path"), delay))
+                self.scheduler.resubmit(key, delay)
+                return
+
+        if not self.scheduler.has_pending():
+            # all transfers finished, write statuses and check for more
+            self.module.flush_db_updates()
+            self.module.hash_index.save()
+            self.reset_timer()
+
+    def _get_sync_representations(self, project_name, local_site,
+                                  remote_site):
+        """Representations that should be synced in this loop.
+
+        Full scan of all representations is done only if it is requested or
+        outdated, otherwise are checked only changed representations from
+        'sync_queue' and newly published representations.
+        """
+        sync_queue = self.module.sync_queue
+        if sync_queue.needs_full_reconcile(project_name):
+            self.log.debug(
+                "Checking all representations of {}".format(project_name))
+            sync_queue.mark_full_reconciled(project_name)
+            return self.module.get_sync_representations(
+                project_name, local_site, remote_site
+            )
+
+        sync_queue.add_polled(
+            project_name,
+            self.module.get_new_representation_ids(
+                project_name, sync_queue.get_lookback_start_id()
+            )
+        )
+        representation_ids = sync_queue.pop(project_name)
+
+        if not representation_ids:
+            return []
+
+        self.log.debug("Checking {} changed representations of {}".format(
+            len(representation_ids), project_name))
+        return self.module.get_sync_representations(
+            project_name,
+            local_site,
+            remote_site,
+            representation_ids=representation_ids
+        )
+
     def _working_sites(self, project_name, sync_config):
         if self.module.is_project_paused(project_name):
             self.log.debug("Both sites same, skipping")
@@ -529,18 +754,29 @@ class SyncServerThread(threading.Thread):
                 local_site, remote_site))
             return None, None
 
-        local_site_config = sync_config.get('sites')[local_site]
-        remote_site_config = sync_config.get('sites')[remote_site]
-        if not all([_site_is_working(self.module, project_name, local_site,
-                                     local_site_config),
-                    _site_is_working(self.module, project_name, remote_site,
-                                     remote_site_config)]):
-            self.log.debug(
-                "Some of the sites {} - {} in {} is not working properly".format(  # noqa
-                    local_site, remote_site, project_name
-                )
-            )
+        for site_name in (local_site, remote_site):
+            if not self.circuit_breaker.allows(site_name):
+                self.log.debug("Site {} is failing, skipping {}".format(
+                    site_name, project_name))
+                return None, None
 
-            return None, None
+            site_config = sync_config.get('sites')[site_name]
+            try:
+                is_working = _site_is_working(self.module, project_name,
+                                              site_name, site_config)
+            except Exception:
+                self.log.warning(
+                    "Failed to check site {}".format(site_name),
+                    exc_info=True)
+                is_working = False
+
+            if not is_working:
+                self.circuit_breaker.record_failure(site_name)
+                self.log.debug(
+                    "Some of the sites {} - {} in {} is not working properly".format(  # noqa
+                        local_site, remote_site, project_name
+                    )
+                )
+                return None, None
 
         return local_site, remote_site
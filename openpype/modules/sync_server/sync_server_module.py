@@ -9,6 +9,7 @@ from collections import deque, defaultdict
 
 import click
 from bson.objectid import ObjectId
+from pymongo import UpdateOne
 
 from openpype.client import (
     get_projects,
@@ -33,6 +34,9 @@ from openpype.settings.constants import (
 
 from .providers.local_drive import LocalDriveHandler
 from .providers import lib
+from .sync_queue import SyncQueue
+from .update_buffer import SyncUpdateBuffer
+from .hash_index import ContentHashIndex
 
 from .utils import (
     time_function,
@@ -107,6 +111,20 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
     DEFAULT_SITE = 'studio'
     LOCAL_SITE = 'local'
     LOG_PROGRESS_SEC = 5  # how often log progress to DB
+    # how often are all representations of a project checked, changes
+    # made in between are picked from queue of changed representations
+    FULL_RECONCILE_SEC = 600
+    # representations created in this time are polled on each loop, covers
+    # publishes which integrate files longer than that
+    NEW_REPRESENTATIONS_LOOKBACK_SEC = 3600
+    # max number of waiting status updates before bulk write to DB
+    DB_UPDATE_BATCH_SIZE = 500
+    # max number of concurrently transferred files for all sites, limits
+    # for providers are set in 'providers.lib'
+    MAX_TRANSFERS = 8
+    # backoff of transient failures in seconds, doubled with each try
+    RETRY_BASE_DELAY = 5
+    RETRY_MAX_DELAY = 300
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
 
     name = "sync_server"
@@ -138,6 +156,14 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         # list of long blocking tasks
         self.long_running_tasks = deque()
+        # representations changed since last loop
+        self.sync_queue = SyncQueue(
+            self.FULL_RECONCILE_SEC, self.NEW_REPRESENTATIONS_LOOKBACK_SEC
+        )
+        # status updates written in bulk, used only by running server
+        self._update_buffer = None
+        # content of files on sites, used if site has 'content_dedup'
+        self._hash_index = None
         # projects that long tasks are running on
         self.projects_processed = set()
 
@@ -202,7 +228,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                                           priority=priority)
 
         if reset_timer:
-            self.reset_timer()
+            self.reset_timer(project_name, [representation_id])
 
     def remove_site(self, project_name, representation_id, site_name,
                     remove_local_files=False):
@@ -1116,20 +1142,30 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
     #
     #     return editable
 
-    def reset_timer(self):
+    def reset_timer(self, project_name=None, representation_ids=None):
         """
             Called when waiting for next loop should be skipped.
 
             In case of user's involvement (reset site), start that right away.
+
+            Args:
+                project_name (str): project of changed representations
+                representation_ids (list): changed representations, full
+                    check of all representations is triggered if not passed
         """
 
         if not self.enabled:
             return
 
         if self.sync_server_thread is None:
-            self._reset_timer_with_rest_api()
+            self._reset_timer_with_rest_api(project_name, representation_ids)
+            return
+
+        if project_name and representation_ids:
+            self.sync_queue.add(project_name, representation_ids)
         else:
-            self.sync_server_thread.reset_timer()
+            self.sync_queue.request_full_reconcile(project_name)
+        self.sync_server_thread.reset_timer()
 
     def is_representation_on_site(
         self, project_name, representation_id, site_name, max_retries=None
@@ -1173,7 +1209,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         return on_site
 
-    def _reset_timer_with_rest_api(self):
+    def _reset_timer_with_rest_api(self, project_name=None,
+                                   representation_ids=None):
         # POST to webserver sites to add to representations
         webserver_url = os.environ.get("OPENPYPE_WEBSERVER_URL")
         if not webserver_url:
@@ -1193,7 +1230,14 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             )
             return
 
-        requests.post(rest_api_url)
+        data = {}
+        if project_name:
+            data["project_name"] = project_name
+        if representation_ids:
+            data["representation_ids"] = [
+                str(repre_id) for repre_id in representation_ids
+            ]
+        requests.post(rest_api_url, json=data)
 
     def get_enabled_projects(self):
         """Returns list of projects which have SyncServer enabled."""
@@ -1416,6 +1460,12 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         self.lock = threading.Lock()
 
+        self._update_buffer = SyncUpdateBuffer(
+            lambda project_name: self.connection.database[project_name],
+            max_size=self.DB_UPDATE_BATCH_SIZE,
+            max_age=self.LOG_PROGRESS_SEC
+        )
+
         self.sync_server_thread = SyncServerThread(self)
 
     def tray_start(self):
@@ -1492,6 +1542,17 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         """
         return self._anatomies.get('project_name') or Anatomy(project_name)
 
+    @property
+    def hash_index(self):
+        """Index of file contents synchronized to sites.
+
+        Returns:
+            ContentHashIndex
+        """
+        if self._hash_index is None:
+            self._hash_index = ContentHashIndex()
+        return self._hash_index
+
     @property
     def connection(self):
         if self._connection is None:
@@ -1681,8 +1742,28 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         return sites.get(site, 'N/A')
 
+    def get_new_representation_ids(self, project_name, start_id):
+        """
+            Returns ids of representations created since 'start_id'.
+
+            ObjectId contains creation time, so querying by '_id' is cheap
+            way how to find newly published representations.
+        Args:
+            project_name (string):
+            start_id (ObjectId): id with creation time from which are
+                representations returned
+        Returns:
+            (list) of ObjectId sorted from oldest
+        """
+        repre_docs = self.connection.database[project_name].find(
+            {"type": "representation", "_id": {"$gte": start_id}},
+            {"_id": True}
+        ).sort("_id", 1)
+        return [repre_doc["_id"] for repre_doc in repre_docs]
+
     @time_function
-    def get_sync_representations(self, project_name, active_site, remote_site):
+    def get_sync_representations(self, project_name, active_site, remote_site,
+                                 representation_ids=None):
         """
             Get representations that should be synced, these could be
             recognised by presence of document in 'files.sites', where key is
@@ -1698,6 +1779,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                 'local_0' when working from home, 'studio' when working in the
                 studio (default)
             remote_site (string): identifier of remote site I want to sync to
+            representation_ids (iterable): limit query only to these
+                representations, all representations are checked if None
 
         Returns:
             (list) of dictionaries
@@ -1746,6 +1829,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                 ]}
             ]
         }
+        if representation_ids is not None:
+            match["_id"] = {"$in": list(representation_ids)}
 
         aggr = [
             {"$match": match},
@@ -1878,14 +1963,18 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         update = {}
         if new_file_id:
+            update_kind = SyncUpdateBuffer.STATUS
             update["$set"] = self._get_success_dict(new_file_id)
             # reset previous errors if any
             update["$unset"] = self._get_error_dict("", "", "")
         elif progress is not None:
+            update_kind = SyncUpdateBuffer.PROGRESS
             update["$set"] = self._get_progress_dict(progress)
         elif priority is not None:
+            update_kind = SyncUpdateBuffer.PRIORITY
             update["$set"] = self._get_priority_dict(priority, file_id)
         else:
+            update_kind = SyncUpdateBuffer.STATUS
             tries = self._get_tries_count(file, site)
             tries += 1
 
@@ -1895,14 +1984,27 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             {'s.name': site}
         ]
         if file_id:
-            arr_filter.append({'f._id': ObjectId(file_id)})
+            file_id = ObjectId(file_id)
+            arr_filter.append({'f._id': file_id})
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
+        if self._update_buffer is not None:
+            self._update_buffer.add(
+                project_name,
+                representation_id,
+                file_id,
+                site,
+                update_kind,
+                UpdateOne(
+                    query, update, upsert=True, array_filters=arr_filter
+                )
+            )
+        else:
+            self.connection.database[project_name].update_one(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            )
 
         if progress is not None or priority is not None:
             return
@@ -1925,6 +2027,17 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             )
         )
 
+    def flush_db_updates(self, project_name=None):
+        """
+            Writes waiting status updates from 'update_db' to DB.
+
+            Args:
+                project_name (str): write only updates of project, all
+                    waiting updates are written if not passed
+        """
+        if self._update_buffer is not None:
+            self._update_buffer.flush(project_name)
+
     def _get_file_info(self, files, _id):
         """
             Return record from list of records which name matches to 'provider'
@@ -2038,6 +2151,9 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             self._add_site(project_name, representation, elem, site_name,
                            force=force)
 
+        # check changed representation in next loop
+        self.sync_queue.add(project_name, [representation["_id"]])
+
     def _update_site(self, project_name, representation_id,
                      update, arr_filter):
         """
@@ -2049,6 +2165,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             "_id": ObjectId(representation_id)
         }
 
+        # waiting status updates must not override this change
+        self.flush_db_updates(project_name)
         self.connection.database[project_name].update_one(
             query,
             update,
@@ -2243,6 +2361,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
                 try:
                     self.log.debug("Removing {}".format(local_file_path))
                     os.remove(local_file_path)
+                    self.hash_index.remove_file(site_name, local_file_path)
                 except IndexError:
                     msg = "No file set for {}".format(representation_id)
                     self.log.debug(msg)
@@ -924,6 +924,7 @@ class SyncRepresentationSummaryModel(_SyncRepresentationModel):
                                        representation,
                                        get_local_site_id(),
                                        priority=value)
+            self.sync_server.flush_db_updates(self.project)
         self.is_editing = False
 
         # all other approaches messed up selection to 0th index
@@ -1368,6 +1369,7 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
             self.sync_server.update_db(self.project, None, updated_file,
                                        representation, get_local_site_id(),
                                        priority=value)
+            self.sync_server.flush_db_updates(self.project)
         self.is_editing = False
         # all other approaches messed up selection to 0th index
         self.timer.setInterval(0)
@@ -0,0 +1,168 @@
+import time
+import threading
+from collections import OrderedDict
+
+from pymongo.errors import BulkWriteError
+
+from openpype.lib import Logger
+
+
+class SyncUpdateBuffer:
+    """Coalesces sync status updates and writes them in bulk.
+
+    Each update is stored under a key identifying target site record of a
+    file and kind of the update. Newer update of same key replaces older
+    one, so only last progress value is written. Success or error of a file
+    also drops waiting progress update of the same file as it would be
+    overridden anyway.
+
+    Buffered updates are written with 'bulk_write' per project when
+    'max_size' updates are waiting, when oldest update is older than
+    'max_age' seconds or when 'flush' is called. Updates which failed to
+    be written are returned to buffer, unless newer update replaced them
+    meanwhile, and are written with next flush.
+
+    Args:
+        get_collection (Callable[[str], Collection]): Returns collection
+            for project name.
+        max_size (int): Number of waiting updates triggering write.
+        max_age (float): Seconds after which waiting updates are written.
+    """
+
+    STATUS = "status"
+    PROGRESS = "progress"
+    PRIORITY = "priority"
+
+    def __init__(self, get_collection, max_size=500, max_age=5):
+        self._get_collection = get_collection
+        self._max_size = max_size
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._updates = OrderedDict()
+        self._first_update_time = None
+        self._log = None
+
+    @property
+    def log(self):
+        if self._log is None:
+            self._log = Logger.get_logger(self.__class__.__name__)
+        return self._log
+
+    def add(self, project_name, representation_id, file_id, site_name,
+            kind, operation):
+        """Add update to buffer.
+
+        Args:
+            project_name (str): Project name.
+            representation_id (ObjectId): Updated representation.
+            file_id (Union[ObjectId, None]): Updated file, None if all
+                files of representation are updated.
+            site_name (str): Updated site.
+            kind (str): One of 'STATUS', 'PROGRESS' or 'PRIORITY'.
+            operation (UpdateOne): Write operation.
+        """
+        target = (project_name, representation_id, file_id, site_name)
+        key = target + (kind, )
+        with self._lock:
+            if kind == self.STATUS:
+                # progress is reset by success or error
+                self._updates.pop(target + (self.PROGRESS, ), None)
+            # keep order of updates, replaced update moves to the end
+            self._updates.pop(key, None)
+            self._updates[key] = operation
+            if self._first_update_time is None:
+                self._first_update_time = time.time()
+
+            should_flush = (
+                len(self._updates) >= self._max_size
+                or time.time() - self._first_update_time >= self._max_age
+            )
+
+        if should_flush:
+            try:
+                self.flush()
+            except Exception:
+                # updates are kept in buffer for next flush
+                self.log.warning(
+                    "Failed to write sync updates", exc_info=True)
+
+    def flush(self, project_name=None):
+        """Write waiting updates to database.
+
+        Args:
+            project_name (Optional[str]): Write only updates of project,
+                all updates are written if not passed.
+        """
+        # flush lock keeps order of writes from multiple threads
+        with self._flush_lock:
+            items_by_project = OrderedDict()
+            with self._lock:
+                for key in list(self._updates.keys()):
+                    if project_name and key[0] != project_name:
+                        continue
+                    items_by_project.setdefault(key[0], []).append(
+                        (key, self._updates.pop(key))
+                    )
+                if not self._updates:
+                    self._first_update_time = None
+
+            projects_items = list(items_by_project.items())
+            for idx, (_project_name, items) in enumerate(projects_items):
+                self.log.debug("Writing {} updates to {}".format(
+                    len(items), _project_name))
+                try:
+                    self._get_collection(_project_name).bulk_write(
+                        [operation for _, operation in items], ordered=True
+                    )
+
+                except BulkWriteError as exc:
+                    # ordered write stops on first invalid operation,
+                    # operations before it were written
+                    write_errors = exc.details.get("writeErrors") or []
+                    failed_idx = 0
+                    if write_errors:
+                        failed_idx = write_errors[0]["index"] + 1
+                    self._requeue(items[failed_idx:], projects_items[idx + 1:])
+                    raise
+
+                except Exception:
+                    self._requeue(items, projects_items[idx + 1:])
+                    raise
+
+    def _requeue(self, items, projects_items):
+        """Return not written updates to buffer.
+
+        Updates which were replaced by newer update during write are
+        skipped.
+
+        Args:
+            items (list[tuple[tuple, UpdateOne]]): Keys and operations.
+            projects_items (list[tuple[str, list]]): Keys and operations
+                of projects which were not written at all.
+        """
+        all_items = list(items)
+        for _, project_items in projects_items:
+            all_items.extend(project_items)
+
+        with self._lock:
+            updates = OrderedDict()
+            for key, operation in all_items:
+                target = key[:-1]
+                kind = key[-1]
+                if key in self._updates:
+                    continue
+                if (
+                    kind == self.PROGRESS
+                    and target + (self.STATUS, ) in self._updates
+                ):
+                    continue
+                updates[key] = operation
+
+            if not updates:
+                return
+            # older updates are written first
+            updates.update(self._updates)
+            self._updates = updates
+            # don't retry on each added update
+            self._first_update_time = time.time()
@@ -1,12 +1,15 @@
 import os
 import re
 import copy
+import hashlib
 import platform
 import collections
 import numbers
 
 import six
 import time
+import appdirs
+from bson.json_util import dumps, loads, JSONOptions
 
 from openpype import AYON_SERVER_ENABLED
 from openpype.settings.lib import (
@@ -17,6 +20,8 @@ from openpype.settings.constants import (
 )
 from openpype.client import get_project, get_ayon_server_api_connection
 from openpype.lib import Logger, get_local_site_id
+from openpype.lib.local_settings import get_ayon_appdirs
+from openpype.lib.python_2_comp import replace_file
 from openpype.lib.path_templates import (
     TemplateUnsolved,
     TemplateResult,
@@ -406,20 +411,183 @@ class CacheItem:
             return True
         return (time.time() - self._cached) > self._lifetime
 
-    def update_data(self, data):
+    def update_data(self, data, age=0):
         """Update cache of data.
 
         Args:
             data (Any): Data to cache.
+            age (Optional[float]): How many seconds ago were the data
+                received, e.g. when taken from other cache.
         """
 
         self._data = data
-        self._cached = time.time()
+        self._cached = time.time() - age
+
+
+class ProjectDocFileCache(object):
+    """Project documents cached in files shared by processes on machine.
+
+    Processes started at the same time, e.g. render tasks on farm, would
+    query the same project document from database. Queried document is
+    stored to a file and is used by other processes until the file is older
+    than lifetime. Files are keyed by database (or server) and project name,
+    and contain version of the cache format.
+
+    Lifetime can be changed with 'OPENPYPE_ANATOMY_CACHE_LIFETIME'
+    environment variable. Value '0' disables the cache.
+
+    Args:
+        root (Optional[str]): Directory where cache files are stored.
+        lifetime (Optional[float]): Seconds for which is cached document
+            used. Value from environment is used if not passed.
+    """
+
+    version = 1
+    default_lifetime = 10
+    lifetime_env_key = "OPENPYPE_ANATOMY_CACHE_LIFETIME"
+
+    def __init__(self, root=None, lifetime=None):
+        self._root = root
+        self._lifetime = lifetime
+
+    @property
+    def root(self):
+        if self._root is None:
+            if AYON_SERVER_ENABLED:
+                self._root = get_ayon_appdirs("anatomy_cache")
+            else:
+                self._root = os.path.join(
+                    appdirs.user_data_dir("openpype", "pypeclub"),
+                    "anatomy_cache"
+                )
+        return self._root
+
+    @property
+    def lifetime(self):
+        if self._lifetime is not None:
+            return self._lifetime
+
+        value = os.environ.get(self.lifetime_env_key)
+        if not value:
+            return self.default_lifetime
+        try:
+            return float(value)
+        except ValueError:
+            log.warning("Invalid value of {} \"{}\"".format(
+                self.lifetime_env_key, value
+            ))
+        return self.default_lifetime
+
+    @staticmethod
+    def _get_source_key():
+        """Database or server from which project documents are received."""
+        if AYON_SERVER_ENABLED:
+            return os.environ.get("AYON_SERVER_URL") or ""
+        return "{}|{}".format(
+            os.environ.get("OPENPYPE_MONGO") or "",
+            os.environ.get("AVALON_DB") or "avalon"
+        )
+
+    def _get_filepath(self, project_name):
+        key = "{}|{}".format(self._get_source_key(), project_name)
+        return os.path.join(
+            self.root,
+            "{}.json".format(hashlib.sha1(key.encode("utf-8")).hexdigest())
+        )
+
+    def get(self, project_name):
+        """Cached project document.
+
+        Args:
+            project_name (str): Project name.
+
+        Returns:
+            Union[dict[str, Any], None]: Project document or None if is not
+                cached or cache is outdated.
+        """
+        return self.get_with_age(project_name)[0]
+
+    def get_with_age(self, project_name):
+        """Cached project document with age of the cache file.
+
+        Age should be passed to in-process cache so the document is not used
+        longer than lifetime after it was queried.
+
+        Args:
+            project_name (str): Project name.
+
+        Returns:
+            tuple[Union[dict[str, Any], None], float]: Project document or
+                None if is not cached or cache is outdated, and age of
+                cached document in seconds.
+        """
+        lifetime = self.lifetime
+        if lifetime <= 0:
+            return None, 0
+
+        filepath = self._get_filepath(project_name)
+        try:
+            modified = os.path.getmtime(filepath)
+        except OSError:
+            return None, 0
+
+        age = max(time.time() - modified, 0)
+        if age > lifetime:
+            return None, 0
+
+        try:
+            with open(filepath, "r") as stream:
+                data = loads(
+                    stream.read(), json_options=JSONOptions(tz_aware=False)
+                )
+        except (IOError, OSError, ValueError):
+            return None, 0
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != self.version
+            or data.get("project_name") != project_name
+        ):
+            return None, 0
+        return data.get("document"), age
+
+    def set(self, project_name, project_doc):
+        """Store project document for other processes.
+
+        Args:
+            project_name (str): Project name.
+            project_doc (dict[str, Any]): Project document.
+        """
+        if self.lifetime <= 0 or not project_doc:
+            return
+
+        filepath = self._get_filepath(project_name)
+        # Other processes may read the file at the same time
+        tmp_path = "{}.{}.tmp".format(filepath, os.getpid())
+        try:
+            if not os.path.exists(self.root):
+                os.makedirs(self.root)
+            with open(tmp_path, "w") as stream:
+                stream.write(dumps({
+                    "version": self.version,
+                    "project_name": project_name,
+                    "document": project_doc
+                }))
+            replace_file(tmp_path, filepath)
+
+        except (IOError, OSError, TypeError, ValueError):
+            log.debug(
+                "Failed to cache project document to {}".format(filepath),
+                exc_info=True
+            )
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
 
 class Anatomy(BaseAnatomy):
     _sync_server_addon_cache = CacheItem()
     _project_cache = collections.defaultdict(CacheItem)
+    _project_doc_file_cache = ProjectDocFileCache()
     _default_site_id_cache = collections.defaultdict(CacheItem)
     _root_overrides_cache = collections.defaultdict(
         lambda: collections.defaultdict(CacheItem)
@@ -435,17 +603,27 @@ class Anatomy(BaseAnatomy):
                 " to load data for specific project."
             ))
 
-        project_doc = self.get_project_doc_from_cache(project_name)
+        # Data of project document are copied by base class
+        project_doc = self._get_cached_project_doc(project_name)
         root_overrides = self._get_site_root_overrides(project_name, site_name)
 
         super(Anatomy, self).__init__(project_doc, root_overrides)
 
     @classmethod
     def get_project_doc_from_cache(cls, project_name):
+        return copy.deepcopy(cls._get_cached_project_doc(project_name))
+
+    @classmethod
+    def _get_cached_project_doc(cls, project_name):
         project_cache = cls._project_cache[project_name]
         if project_cache.is_outdated:
-            project_cache.update_data(get_project(project_name))
-        return copy.deepcopy(project_cache.data)
+            file_cache = cls._project_doc_file_cache
+            project_doc, age = file_cache.get_with_age(project_name)
+            if project_doc is None:
+                project_doc = get_project(project_name)
+                file_cache.set(project_name, project_doc)
+            project_cache.update_data(project_doc, age)
+        return project_cache.data
 
     @classmethod
     def get_sync_server_addon(cls):
@@ -640,6 +818,22 @@ class AnatomyStringTemplate(StringTemplate):
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def format_batch(self, data, items):
+        """Format template for each item, 'root' key is added only once.
+
+        Args:
+            data (dict[str, Any]): Formatting data shared by all items.
+            items (Iterable[dict[str, Any]]): Values changed for each item.
+
+        Returns:
+            list[AnatomyTemplateResult]: Formatting result for each item.
+        """
+
+        if not data.get("root"):
+            data = copy.deepcopy(data)
+            data["root"] = self.anatomy_templates.anatomy.roots
+        return super(AnatomyStringTemplate, self).format_batch(data, items)
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
@@ -1,7 +1,11 @@
 import os
 
 from openpype.settings import get_project_settings
-from openpype.lib import filter_profiles, prepare_template_data
+from openpype.lib import (
+    ProfileMatcher,
+    get_profile_matcher,
+    prepare_template_data,
+)
 from openpype.pipeline import legacy_io
 
 from .constants import DEFAULT_SUBSET_TEMPLATE
@@ -46,6 +50,9 @@ def get_subset_name_template(
             project. Settings are queried if not passed.
     """
 
+    # Matcher is shared only for prepared settings, queried settings are
+    #   new objects on each call
+    shared_settings = project_settings is not None
     if project_settings is None:
         project_settings = get_project_settings(project_name)
     tools_settings = project_settings["global"]["tools"]
@@ -57,7 +64,11 @@ def get_subset_name_template(
         "task_types": task_type
     }
 
-    matching_profile = filter_profiles(profiles, filtering_criteria)
+    if shared_settings:
+        matcher = get_profile_matcher(profiles)
+    else:
+        matcher = ProfileMatcher(profiles, cache_size=0)
+    matching_profile = matcher.match(filtering_criteria)
     template = None
     if matching_profile:
         template = matching_profile["template"]
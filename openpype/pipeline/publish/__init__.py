@@ -41,6 +41,10 @@ from .lib import (
     get_plugin_settings,
     get_publish_instance_label,
     get_publish_instance_families,
+
+    get_publish_max_workers,
+    is_plugin_concurrent,
+    process_instances_concurrently,
 )
 
 from .abstract_expected_files import ExpectedFiles
@@ -90,6 +94,10 @@ __all__ = (
     "get_publish_instance_label",
     "get_publish_instance_families",
 
+    "get_publish_max_workers",
+    "is_plugin_concurrent",
+    "process_instances_concurrently",
+
     "ExpectedFiles",
 
     "RenderInstance",
@@ -1,20 +1,27 @@
 import os
 import sys
+import time
+import collections
 import inspect
 import copy
+import logging
 import tempfile
+import threading
 import xml.etree.ElementTree
 
 import pyblish.util
 import pyblish.plugin
 import pyblish.api
+import pyblish.lib
 
 from openpype.lib import (
     Logger,
     import_filepath,
-    filter_profiles,
+    ProfileMatcher,
+    get_profile_matcher,
     is_func_signature_supported,
 )
+from openpype.lib.python_2_comp import ThreadPoolExecutor
 from openpype.settings import (
     get_project_settings,
     get_system_settings,
@@ -179,8 +186,8 @@ def get_publish_template_name(
         task_type (str): Task type on which is instance working.
         project_settings (Dict[str, Any]): Prepared project settings.
         hero (bool): Template is for hero version publishing.
-        logger (logging.Logger): Custom logger used for 'filter_profiles'
-            function.
+        logger (logging.Logger): Custom logger used for profiles
+            filtering.
 
     Returns:
         str: Template name which should be used for integration.
@@ -195,17 +202,27 @@ def get_publish_template_name(
     }
     if hero:
         default_template = DEFAULT_HERO_PUBLISH_TEMPLATE
-        profiles = get_hero_template_name_profiles(
-            project_name, project_settings, logger
-        )
-
+        profiles_key = "hero_template_name_profiles"
+        get_profiles_func = get_hero_template_name_profiles
     else:
-        profiles = get_template_name_profiles(
-            project_name, project_settings, logger
-        )
         default_template = DEFAULT_PUBLISH_TEMPLATE
+        profiles_key = "template_name_profiles"
+        get_profiles_func = get_template_name_profiles
+
+    # Use profiles from prepared settings without copy so matcher is
+    #   shared for all calls with the same settings
+    profiles = None
+    if project_settings:
+        profiles = project_settings["global"]["tools"]["publish"][profiles_key]
 
-    profile = filter_profiles(profiles, filter_criteria, logger=logger)
+    if profiles:
+        matcher = get_profile_matcher(profiles)
+    else:
+        matcher = ProfileMatcher(
+            get_profiles_func(project_name, project_settings, logger),
+            cache_size=0
+        )
+    profile = matcher.match(filter_criteria, logger=logger)
     if profile:
         template = profile["template_name"]
     return template or default_template
@@ -556,6 +573,190 @@ def remote_publish(log):
         raise RuntimeError("Fatal Error: {}".format(error_message))
 
 
+class _ThreadRecordsHandler(logging.Handler):
+    """Collect pyblish log records separately for each registered thread.
+
+    Same as 'pyblish.lib.MessageHandler' but records are stored to list of
+    thread which emitted them, so records of instances processed at the
+    same time are not mixed.
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self._records_by_thread = {}
+
+    def register_thread(self, records):
+        self._records_by_thread[threading.current_thread().ident] = records
+
+    def unregister_thread(self):
+        self._records_by_thread.pop(threading.current_thread().ident, None)
+
+    def emit(self, record):
+        if not record.name.startswith("pyblish"):
+            return
+        records = self._records_by_thread.get(record.thread)
+        if records is not None:
+            records.append(record)
+
+
+def get_publish_max_workers(project_settings=None):
+    """Max number of instances processed concurrently by one plugin.
+
+    Concurrent processing is opt-in and is enabled by project settings
+    'global/tools/publish/max_workers' or by environment variable
+    'OPENPYPE_PUBLISH_MAX_WORKERS' which has priority. Only plugins with
+    'concurrent_instances' set to 'True' are processed concurrently.
+
+    Args:
+        project_settings (Optional[dict[str, Any]]): Prepared project
+            settings. Only environment variable is used if not passed.
+
+    Returns:
+        int: Max number of workers, '1' if concurrency is disabled.
+    """
+    value = os.environ.get("OPENPYPE_PUBLISH_MAX_WORKERS")
+    if not value and project_settings:
+        value = (
+            project_settings
+            ["global"]
+            ["tools"]
+            ["publish"]
+            .get("max_workers")
+        )
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return 1
+
+
+def is_plugin_concurrent(plugin):
+    """Plugin can process multiple instances at the same time.
+
+    Plugin must be instance plugin which does not touch host and shared
+    data, e.g. does subprocess work on files of the instance.
+
+    Args:
+        plugin (pyblish.api.Plugin): Plugin class.
+
+    Returns:
+        bool: Instances can be processed concurrently by the plugin.
+    """
+    return bool(
+        plugin.__instanceEnabled__
+        and getattr(plugin, "concurrent_instances", False)
+    )
+
+
+def process_instances_concurrently(
+    plugin, context, instances, max_workers=None, stop_callback=None
+):
+    """Process instances by instance plugin concurrently.
+
+    Replacement of 'pyblish.plugin.process' for multiple instances. Results
+    have the same structure, are stored to context and emitted in order
+    of passed instances, after all instances are processed. Log records
+    are collected for each instance separately. Records logged by threads
+    created by the plugin itself are not collected.
+
+    Instances are submitted only when a worker is free. Before each
+    submission is called 'stop_callback' with results of already processed
+    instances, remaining instances are not processed if it returns 'True'.
+
+    Args:
+        plugin (pyblish.api.InstancePlugin): Plugin class which has
+            'concurrent_instances' set to 'True'.
+        context (pyblish.api.Context): Publish context.
+        instances (list[pyblish.api.Instance]): Instances to process.
+        max_workers (Optional[int]): Max number of instances processed at
+            the same time. Value of 'get_publish_max_workers' is used
+            if not passed.
+        stop_callback (Optional[Callable[[list[dict[str, Any]]], bool]]):
+            Processing of remaining instances is stopped when returns
+            'True'.
+
+    Returns:
+        list[dict[str, Any]]: Pyblish result for each processed instance.
+    """
+    if max_workers is None:
+        max_workers = get_publish_max_workers(
+            context.data.get("project_settings"))
+    max_workers = max(1, min(max_workers, len(instances)))
+
+    handler = _ThreadRecordsHandler()
+    pyblish_log = logging.getLogger("pyblish.plugin")
+
+    def _process(instance):
+        result = {
+            "success": False,
+            "plugin": plugin,
+            "instance": instance,
+            "action": None,
+            "error": None,
+            "records": [],
+            "duration": None,
+            "progress": 0,
+            "context": context,
+        }
+        handler.register_thread(result["records"])
+        start = time.time()
+        try:
+            plugin().process(instance)
+            result["success"] = True
+        except Exception as error:
+            pyblish.lib.extract_traceback(error, plugin.__module__)
+            result["error"] = error
+            pyblish_log.exception(error.formatted_traceback)
+        finally:
+            handler.unregister_thread()
+        result["duration"] = (time.time() - start) * 1000  # ms
+        return result
+
+    def _should_stop(results):
+        return stop_callback is not None and stop_callback(results)
+
+    results = []
+    with pyblish.plugin.logger(handler):
+        if ThreadPoolExecutor is None or max_workers < 2:
+            for instance in instances:
+                if _should_stop(results):
+                    break
+                results.append(_process(instance))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = collections.deque()
+                stopped = False
+                for instance in instances:
+                    if len(futures) >= max_workers:
+                        results.append(futures.popleft().result())
+                    if _should_stop(results):
+                        stopped = True
+                        break
+                    futures.append(executor.submit(_process, instance))
+
+                for future in futures:
+                    # Cancel instances which did not start yet on stop
+                    if stopped and future.cancel():
+                        continue
+                    results.append(future.result())
+
+    if "results" not in context.data:
+        context.data["results"] = []
+
+    for result in results:
+        error = result["error"]
+        if error is not None:
+            pyblish.lib.emit(
+                "pluginFailed",
+                plugin=plugin,
+                context=context,
+                instance=result["instance"],
+                error=error
+            )
+        context.data["results"].append(result)
+        pyblish.lib.emit("pluginProcessed", result=result)
+    return results
+
+
 def get_errored_instances_from_context(context, plugin=None):
     """Collect failed instances from pyblish context.
 
@@ -812,9 +1013,11 @@ def get_custom_staging_dir_info(project_name, host_name, family, task_name,
         "task_types": task_type,
         "subsets": subset_name
     }
-    profile = filter_profiles(custom_staging_dir_profiles,
-                              filtering_criteria,
-                              logger=log)
+    if project_settings:
+        matcher = get_profile_matcher(custom_staging_dir_profiles)
+    else:
+        matcher = ProfileMatcher(custom_staging_dir_profiles, cache_size=0)
+    profile = matcher.match(filtering_criteria, logger=log)
 
     if not profile or not profile["active"]:
         return None, None
@@ -10,7 +10,7 @@ import six
 import pyblish.api
 
 from openpype import resources, PACKAGE_DIR
-from openpype.pipeline import publish
+from openpype.pipeline import publish, KnownPublishError
 from openpype.lib import (
     run_openpype_process,
 
@@ -18,7 +18,8 @@ from openpype.lib import (
     convert_input_paths_for_ffmpeg,
     should_convert_for_ffmpeg
 )
-from openpype.lib.profiles_filtering import filter_profiles
+from openpype.lib.profiles_filtering import get_profile_matcher
+from openpype.lib.burnin_worker import get_burnin_worker, BurninWorkerError
 from openpype.pipeline.publish.lib import add_repre_files_for_cleanup
 
 
@@ -58,6 +59,8 @@ class ExtractBurnin(publish.Extractor):
     ]
 
     optional = True
+    # Instances can be processed concurrently (subprocess work only)
+    concurrent_instances = True
 
     positions = [
         "top_left", "top_centered", "top_right",
@@ -76,6 +79,8 @@ class ExtractBurnin(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Create burnins in long-lived process instead of process per burnin
+    use_burnin_worker = False
 
     def process(self, instance):
         if not self.profiles:
@@ -160,8 +165,9 @@ class ExtractBurnin(publish.Extractor):
             "task_types": task_type,
             "subset": subset
         }
-        profile = filter_profiles(self.profiles, filtering_criteria,
-                                  logger=self.log)
+        profile = get_profile_matcher(self.profiles).match(
+            filtering_criteria, logger=self.log
+        )
 
         if not profile:
             self.log.debug((
@@ -266,6 +272,7 @@ class ExtractBurnin(publish.Extractor):
             first_output = True
 
             files_to_delete = []
+            burnin_jobs = []
 
             repre_burnin_options = copy.deepcopy(burnin_options)
             # Use fps from representation for output in options
@@ -329,39 +336,25 @@ class ExtractBurnin(publish.Extractor):
                     "script_data: {}".format(json.dumps(script_data, indent=4))
                 )
 
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Store dumped json to temporary file
-                temporary_json_file = tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                )
-                temporary_json_file.write(dumped_script_data)
-                temporary_json_file.close()
-                temporary_json_filepath = temporary_json_file.name.replace(
-                    "\\", "/"
-                )
-
-                # Prepare subprocess arguments
-                args = list(executable_args)
-                args.append(temporary_json_filepath)
-                self.log.debug("Executing: {}".format(" ".join(args)))
-
-                # Run burnin script
-                process_kwargs = {
-                    "logger": self.log
-                }
+                burnin_jobs.append({
+                    "script_data": script_data,
+                    "new_repre": new_repre,
+                    "full_input_paths": list(temp_data["full_input_paths"]),
+                })
 
-                run_openpype_process(*args, **process_kwargs)
-                # Remove the temporary json
-                os.remove(temporary_json_filepath)
+            self._create_burnins(
+                [job["script_data"] for job in burnin_jobs],
+                executable_args
+            )
 
-                for filepath in temp_data["full_input_paths"]:
+            for job in burnin_jobs:
+                for filepath in job["full_input_paths"]:
                     filepath = filepath.replace("\\", "/")
                     if filepath not in files_to_delete:
                         files_to_delete.append(filepath)
 
                 # Add new representation to instance
+                new_repre = job["new_repre"]
                 instance.data["representations"].append(new_repre)
 
                 add_repre_files_for_cleanup(instance, new_repre)
@@ -386,6 +379,68 @@ class ExtractBurnin(publish.Extractor):
                     os.remove(filepath)
                     self.log.debug("Removed: \"{}\"".format(filepath))
 
+    def _create_burnins(self, scripts_data, executable_args):
+        """Create burnins using burnin worker or burnin script.
+
+        Burnin worker creates burnins of all definitions concurrently in
+        long-lived process. Burnin script is used for each burnin if worker
+        is disabled or is not available.
+        """
+        if self.use_burnin_worker:
+            try:
+                results = get_burnin_worker().process(
+                    scripts_data, logger=self.log
+                )
+            except BurninWorkerError:
+                self.log.warning(
+                    "Burnin worker is not available. Using burnin script.",
+                    exc_info=True
+                )
+                results = [{"worker_failed": True} for _ in scripts_data]
+
+            fallback_scripts_data = []
+            for script_data, result in zip(scripts_data, results):
+                if result["worker_failed"]:
+                    fallback_scripts_data.append(script_data)
+                elif not result["success"]:
+                    raise KnownPublishError(
+                        "Failed to create burnin \"{}\".\n{}".format(
+                            script_data["output"], result["error"]
+                        )
+                    )
+            scripts_data = fallback_scripts_data
+
+        for script_data in scripts_data:
+            self._run_burnin_script(script_data, executable_args)
+
+    def _run_burnin_script(self, script_data, executable_args):
+        # Dump data to string
+        dumped_script_data = json.dumps(script_data)
+
+        # Store dumped json to temporary file
+        temporary_json_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        temporary_json_file.write(dumped_script_data)
+        temporary_json_file.close()
+        temporary_json_filepath = temporary_json_file.name.replace(
+            "\\", "/"
+        )
+
+        # Prepare subprocess arguments
+        args = list(executable_args)
+        args.append(temporary_json_filepath)
+        self.log.debug("Executing: {}".format(" ".join(args)))
+
+        # Run burnin script
+        process_kwargs = {
+            "logger": self.log
+        }
+
+        run_openpype_process(*args, **process_kwargs)
+        # Remove the temporary json
+        os.remove(temporary_json_filepath)
+
     def _get_burnin_options(self):
         # Prepare burnin options
         burnin_options = copy.deepcopy(self.default_options)
@@ -1,5 +1,9 @@
 import os
 import copy
+import math
+import threading
+import multiprocessing
+
 import clique
 import pyblish.api
 
@@ -10,11 +14,13 @@ from openpype.lib import (
 )
 
 from openpype.lib.transcoding import (
-    convert_colorspace,
+    convert_colorspace_batch,
+    get_oiio_info_for_input,
     get_transcode_temp_directory,
 )
 
-from openpype.lib.profiles_filtering import filter_profiles
+from openpype.lib.profiles_filtering import get_profile_matcher
+from openpype.lib.python_2_comp import ThreadPoolExecutor
 
 
 class ExtractOIIOTranscode(publish.Extractor):
@@ -56,6 +62,8 @@ class ExtractOIIOTranscode(publish.Extractor):
     order = pyblish.api.ExtractorOrder + 0.019
 
     optional = True
+    # Instances can be processed concurrently (subprocess work only)
+    concurrent_instances = True
 
     # Supported extensions
     supported_exts = ["exr", "jpg", "jpeg", "png", "dpx"]
@@ -64,6 +72,10 @@ class ExtractOIIOTranscode(publish.Extractor):
     profiles = None
     options = None
 
+    # Max concurrently converted chunks of frames, CPU count divided by
+    #   count of concurrently processed instances if not set
+    max_workers = None
+
     def process(self, instance):
         if not self.profiles:
             self.log.debug("No profiles present for color transcode")
@@ -81,6 +93,10 @@ class ExtractOIIOTranscode(publish.Extractor):
         if not profile:
             return
 
+        # Other instances may be converted at the same time
+        publish_workers = publish.get_publish_max_workers(
+            instance.context.data.get("project_settings"))
+
         new_representations = []
         repres = instance.data["representations"]
         for idx, repre in enumerate(list(repres)):
@@ -98,18 +114,19 @@ class ExtractOIIOTranscode(publish.Extractor):
                 self.log.warning("Config file doesn't exist, skipping")
                 continue
 
+            if isinstance(repre["files"], list):
+                files_to_convert = list(repre["files"])
+            else:
+                files_to_convert = [repre["files"]]
+
+            # all outputs are converted together after they're prepared
+            conversion_outputs = []
             for output_name, output_def in profile.get("outputs", {}).items():
                 new_repre = copy.deepcopy(repre)
 
-                original_staging_dir = new_repre["stagingDir"]
                 new_staging_dir = get_transcode_temp_directory()
                 new_repre["stagingDir"] = new_staging_dir
 
-                if isinstance(new_repre["files"], list):
-                    files_to_convert = copy.deepcopy(new_repre["files"])
-                else:
-                    files_to_convert = [new_repre["files"]]
-
                 output_extension = output_def["extension"]
                 output_extension = output_extension.replace('.', '')
                 self._rename_in_representation(new_repre,
@@ -141,25 +158,14 @@ class ExtractOIIOTranscode(publish.Extractor):
                 additional_command_args = (output_def["oiiotool_args"]
                                            ["additional_command_args"])
 
-                files_to_convert = self._translate_to_sequence(
-                    files_to_convert)
-                for file_name in files_to_convert:
-                    input_path = os.path.join(original_staging_dir,
-                                              file_name)
-                    output_path = self._get_output_file_path(input_path,
-                                                             new_staging_dir,
-                                                             output_extension)
-                    convert_colorspace(
-                        input_path,
-                        output_path,
-                        config_path,
-                        source_colorspace,
-                        target_colorspace,
-                        view,
-                        display,
-                        additional_command_args,
-                        self.log
-                    )
+                conversion_outputs.append({
+                    "staging_dir": new_staging_dir,
+                    "extension": output_extension,
+                    "target_colorspace": target_colorspace,
+                    "view": view,
+                    "display": display,
+                    "additional_command_args": additional_command_args,
+                })
 
                 # cleanup temporary transcoded files
                 for file_name in new_repre["files"]:
@@ -192,6 +198,15 @@ class ExtractOIIOTranscode(publish.Extractor):
                 new_representations.append(new_repre)
                 added_representations = True
 
+            self._convert_files(
+                repre["stagingDir"],
+                files_to_convert,
+                conversion_outputs,
+                config_path,
+                source_colorspace,
+                publish_workers
+            )
+
             if added_representations:
                 self._mark_original_repre_for_deletion(repre, profile,
                                                        added_review)
@@ -257,38 +272,129 @@ class ExtractOIIOTranscode(publish.Extractor):
             renamed_files.append(file_name)
         new_repre["files"] = renamed_files
 
-    def _translate_to_sequence(self, files_to_convert):
-        """Returns original list or list with filename formatted in single
-        sequence format.
+    def _convert_files(self, staging_dir, files_to_convert, outputs,
+                       config_path, source_colorspace, publish_workers=1):
+        """Convert files to all outputs at once.
+
+        Input is probed only once and each chunk of frames is decoded only
+        once for all outputs. Chunks are converted concurrently.
 
-        Uses clique to find frame sequence, in this case it merges all frames
-        into sequence format (FRAMESTART-FRAMEEND#) and returns it.
+        Args:
+            staging_dir (str): Directory of files to convert.
+            files_to_convert (list[str]): File names.
+            outputs (list[dict[str, Any]]): Prepared conversion outputs.
+            config_path (str): Path to OCIO config.
+            source_colorspace (str): Colorspace of files.
+            publish_workers (int): Count of instances which may be
+                converted at the same time sharing CPUs.
+        """
+        if not outputs:
+            return
+
+        input_info = get_oiio_info_for_input(
+            os.path.join(staging_dir, files_to_convert[0]), logger=self.log)
+
+        cpu_count = max(1, multiprocessing.cpu_count() // publish_workers)
+        max_workers = self.max_workers or cpu_count
+        chunks = self._translate_to_sequence_chunks(
+            files_to_convert, max_workers)
+        workers = max(1, min(max_workers, len(chunks)))
+        threads = None
+        if workers > 1:
+            threads = max(1, cpu_count // workers)
+
+        failed_event = threading.Event()
+
+        def _convert(file_name):
+            # skip conversions not started before first failure
+            if failed_event.is_set():
+                return
+            input_path = os.path.join(staging_dir, file_name)
+            conversion_outputs = []
+            for output in outputs:
+                conversion_output = copy.copy(output)
+                conversion_output["output_path"] = self._get_output_file_path(
+                    input_path,
+                    conversion_output.pop("staging_dir"),
+                    conversion_output.pop("extension")
+                )
+                conversion_outputs.append(conversion_output)
+            try:
+                convert_colorspace_batch(
+                    input_path,
+                    conversion_outputs,
+                    config_path,
+                    source_colorspace,
+                    input_info=input_info,
+                    threads=threads,
+                    logger=self.log
+                )
+            except Exception:
+                failed_event.set()
+                raise
+
+        if ThreadPoolExecutor is None or workers < 2:
+            for file_name in chunks:
+                _convert(file_name)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_convert, file_name)
+                for file_name in chunks
+            ]
+        for future in futures:
+            future.result()
+
+    def _translate_to_sequence_chunks(self, files_to_convert, chunks_count):
+        """Returns original list or list of frame ranges in sequence format.
+
+        Uses clique to find frame sequence, in this case it merges
+        contiguous frames into sequence format (FRAMESTART-FRAMEEND#) split
+        to about 'chunks_count' chunks which can be converted in parallel.
         If sequence not found, it returns original list
 
         Args:
             files_to_convert (list): list of file names
+            chunks_count (int): Preferred number of chunks.
         Returns:
-            (list) of [file.1001-1010#.exr] or [fileA.exr, fileB.exr]
+            (list) of [file.1001-1010#.exr, file.1011-1020#.exr]
+                or [fileA.exr, fileB.exr]
         """
         pattern = [clique.PATTERNS["frames"]]
         collections, remainder = clique.assemble(
             files_to_convert, patterns=pattern,
             assume_padded_when_ambiguous=True)
 
-        if collections:
-            if len(collections) > 1:
-                raise ValueError(
-                    "Too many collections {}".format(collections))
-
-            collection = collections[0]
-            frames = list(collection.indexes)
-            frame_str = "{}-{}#".format(frames[0], frames[-1])
-            file_name = "{}{}{}".format(collection.head, frame_str,
-                                        collection.tail)
-
-            files_to_convert = [file_name]
-
-        return files_to_convert
+        if not collections:
+            return files_to_convert
+
+        if len(collections) > 1:
+            raise ValueError(
+                "Too many collections {}".format(collections))
+
+        collection = collections[0]
+        # '#' is 4 digits padding, '@' single digit
+        padding = "#"
+        if collection.padding != 4:
+            padding = "@" * max(collection.padding, 1)
+
+        frames = sorted(collection.indexes)
+        chunk_size = max(1, int(math.ceil(len(frames) / float(chunks_count))))
+        ranges = []
+        range_start = previous = frames[0]
+        for frame in frames[1:]:
+            if frame != previous + 1 or frame - range_start >= chunk_size:
+                ranges.append((range_start, previous))
+                range_start = frame
+            previous = frame
+        ranges.append((range_start, previous))
+
+        return [
+            "{}{}-{}{}{}".format(
+                collection.head, start, end, padding, collection.tail)
+            for start, end in ranges
+        ]
 
     def _get_output_file_path(self, input_path, output_dir,
                               output_extension):
@@ -316,8 +422,9 @@ class ExtractOIIOTranscode(publish.Extractor):
             "task_types": task_type,
             "subsets": subset
         }
-        profile = filter_profiles(self.profiles, filtering_criteria,
-                                  logger=self.log)
+        profile = get_profile_matcher(self.profiles).match(
+            filtering_criteria, logger=self.log
+        )
 
         if not profile:
             self.log.debug((
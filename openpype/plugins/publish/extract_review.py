@@ -3,6 +3,7 @@ import re
 import copy
 import json
 import shutil
+import tempfile
 import subprocess
 from abc import ABCMeta, abstractmethod
 
@@ -13,16 +14,19 @@ import pyblish.api
 
 from openpype.lib import (
     get_ffmpeg_tool_args,
-    filter_profiles,
+    get_profile_matcher,
+    create_hard_link,
     path_to_subprocess_arg,
     run_subprocess,
 )
 from openpype.lib.transcoding import (
     IMAGE_EXTENSIONS,
+    MEDIA_INFO_CACHE,
     get_ffprobe_streams,
     should_convert_for_ffmpeg,
     get_review_layer_name,
     convert_input_paths_for_ffmpeg,
+    stream_converted_frames_to_ffmpeg,
     get_transcode_temp_directory,
 )
 from openpype.pipeline.publish import (
@@ -74,8 +78,25 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     alpha_exts = ["exr", "png", "dpx"]
 
+    # Instances can be processed concurrently (subprocess work only)
+    concurrent_instances = True
+
     # Preset attributes
     profiles = None
+    # Encode outputs sharing input by single ffmpeg process
+    single_pass_outputs = False
+    # Stream frames converted for ffmpeg to its input instead of converting
+    #   whole sequence to temp directory first
+    stream_converted_inputs = False
+    # Store information about media files in staging dirs to temp directory
+    #   so following publish of the same files doesn't read them again
+    persist_media_info = False
+    # Extract thumbnail from decoded frames of review output which can be
+    #   reused by 'ExtractThumbnail'
+    review_thumbnail = {
+        "enabled": False,
+        "duration_split": 0.5
+    }
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -83,9 +104,25 @@ class ExtractReview(pyblish.api.InstancePlugin):
         if not instance.data.get("review", True):
             return
 
+        # Reuse information about media files read by previous publish
+        staging_dirs = set()
+        if self.persist_media_info:
+            staging_dirs = {
+                repre["stagingDir"]
+                for repre in instance.data["representations"]
+                if repre.get("stagingDir")
+            }
+        for staging_dir in staging_dirs:
+            MEDIA_INFO_CACHE.load(staging_dir)
+
         # Run processing
         self.main_process(instance)
 
+        for staging_dir in staging_dirs:
+            MEDIA_INFO_CACHE.save(staging_dir)
+        self.log.debug("Media info cache hits: {}, misses: {}".format(
+            MEDIA_INFO_CACHE.hits, MEDIA_INFO_CACHE.misses))
+
         # Make sure cleanup happens and pop representations with "delete" tag.
         for repre in tuple(instance.data["representations"]):
             tags = repre.get("tags") or []
@@ -109,8 +146,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
         self.log.debug("Host: \"{}\"".format(host_name))
         self.log.debug("Family: \"{}\"".format(family))
 
-        profile = filter_profiles(
-            self.profiles,
+        profile = get_profile_matcher(self.profiles).match(
             {
                 "hosts": host_name,
                 "families": family,
@@ -282,12 +318,23 @@ class ExtractReview(pyblish.api.InstancePlugin):
             # Do conversion if needed
             #   - change staging dir of source representation
             #   - must be set back after output definitions processing
+            stream_input_paths = None
             if do_convert:
                 new_staging_dir = get_transcode_temp_directory()
                 repre["stagingDir"] = new_staging_dir
 
+                # Only first frame is converted to get information about
+                #   input, other frames are converted during encoding
+                convert_input_paths = input_filepaths
+                if (
+                    self.stream_converted_inputs
+                    and self.input_is_sequence(repre)
+                ):
+                    stream_input_paths = input_filepaths
+                    convert_input_paths = [first_input_path]
+
                 convert_input_paths_for_ffmpeg(
-                    input_filepaths,
+                    convert_input_paths,
                     new_staging_dir,
                     self.log
                 )
@@ -298,7 +345,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     repre,
                     src_repre_staging_dir,
                     filtered_output_defs,
-                    layer_name
+                    layer_name,
+                    stream_input_paths
                 )
 
             finally:
@@ -317,9 +365,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
         repre,
         src_repre_staging_dir,
         output_definitions,
-        layer_name
+        layer_name,
+        stream_input_paths=None
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
+        jobs = []
         for _output_def in output_definitions:
             output_def = copy.deepcopy(_output_def)
             # Make sure output definition has "tags" key
@@ -395,7 +445,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             })
 
             try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
+                ffmpeg_args_parts = self._ffmpeg_argument_parts(
                     output_def,
                     instance,
                     new_repre,
@@ -404,6 +454,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     layer_name,
                 )
             except ZeroDivisionError:
+                self._remove_files_to_clean(files_to_clean)
                 # TODO recalculate width and height using OIIO before
                 #   conversion
                 if 'exr' in temp_data["origin_repre"]["ext"]:
@@ -414,43 +465,345 @@ class ExtractReview(pyblish.api.InstancePlugin):
                         ),
                         exc_info=True
                     )
-                    return
+                    # render outputs prepared so far
+                    break
                 raise NotImplementedError
 
-            subprcs_cmd = " ".join(ffmpeg_args)
+            stream_frame_paths = None
+            if stream_input_paths:
+                stream_frame_paths = self._get_stream_frame_paths(
+                    stream_input_paths,
+                    temp_data["input_start_number"],
+                    temp_data["input_frames_len"]
+                )
 
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+            jobs.append({
+                "output_def": output_def,
+                "new_repre": new_repre,
+                "temp_data": temp_data,
+                "output_name": output_name,
+                "output_ext": output_ext,
+                "ffmpeg_args_parts": ffmpeg_args_parts,
+                "stream_frame_paths": stream_frame_paths,
+                "files_to_clean": files_to_clean,
+            })
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+        thumbnail_job = self._get_review_thumbnail_job(instance, jobs)
+        thumbnail_path = None
+        inputs_converted = not stream_input_paths
+        try:
+            for job_group in self._group_output_jobs(jobs):
+                thumbnail_output = None
+                if thumbnail_job in job_group:
+                    thumbnail_path, thumbnail_output = (
+                        self._prepare_review_thumbnail(instance, thumbnail_job)
+                    )
 
+                subprcs_cmd = None
+                input_args = job_group[0]["ffmpeg_args_parts"][0]
+                stream_frame_paths = max(
+                    (job["stream_frame_paths"] or [] for job in job_group),
+                    key=len
+                )
+                if stream_frame_paths:
+                    subprcs_cmd = " ".join(self._get_group_ffmpeg_args(
+                        job_group,
+                        self._get_stream_input_args(input_args),
+                        thumbnail_output
+                    ))
+                    self.log.debug("Executing with streamed input: {}".format(
+                        subprcs_cmd
+                    ))
+                    try:
+                        stream_converted_frames_to_ffmpeg(
+                            subprcs_cmd,
+                            stream_frame_paths,
+                            logger=self.log,
+                            shell=True
+                        )
+                    except Exception:
+                        self.log.warning(
+                            (
+                                "Streaming of converted frames failed."
+                                " Converting whole input to temp directory."
+                            ),
+                            exc_info=True
+                        )
+                        subprcs_cmd = None
+
+                if subprcs_cmd is None:
+                    if not inputs_converted:
+                        convert_input_paths_for_ffmpeg(
+                            stream_input_paths,
+                            repre["stagingDir"],
+                            self.log
+                        )
+                        inputs_converted = True
+
+                    subprcs_cmd = " ".join(self._get_group_ffmpeg_args(
+                        job_group, input_args, thumbnail_output
+                    ))
+
+                    # run subprocess
+                    self.log.debug("Executing: {}".format(subprcs_cmd))
+
+                    run_subprocess(
+                        subprcs_cmd, shell=True, logger=self.log
+                    )
+
+                for job in job_group:
+                    self._add_output_representation(
+                        instance, job, subprcs_cmd
+                    )
+
+                if thumbnail_output and os.path.exists(thumbnail_path):
+                    self.log.debug("Review thumbnail created: {}".format(
+                        thumbnail_path
+                    ))
+                    instance.data["reviewThumbnailPath"] = thumbnail_path
+                    instance.data["reviewThumbnailDurationSplit"] = (
+                        self.review_thumbnail.get("duration_split", 0.5)
+                    )
+
+        finally:
             # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
-
-            new_repre.update({
-                "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
-                "outputName": output_name,
-                "outputDef": output_def,
-                "frameStartFtrack": temp_data["output_frame_start"],
-                "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
-            })
+            for job in jobs:
+                self._remove_files_to_clean(job["files_to_clean"])
 
-            # Force to pop these key if are in new repre
-            new_repre.pop("thumbnail", None)
-            if "clean_name" in new_repre.get("tags", []):
-                new_repre.pop("outputName")
+    def _remove_files_to_clean(self, filepaths):
+        """Remove files added to fill gaps.
 
-            # adding representation
-            self.log.debug(
-                "Adding new representation: {}".format(new_repre)
+        Failed removal is only logged so it doesn't hide original error.
+        """
+        for filepath in filepaths:
+            try:
+                os.unlink(filepath)
+            except OSError:
+                if os.path.lexists(filepath):
+                    self.log.warning(
+                        "Failed to remove {}".format(filepath),
+                        exc_info=True
+                    )
+
+    def _get_group_ffmpeg_args(
+        self, job_group, input_args, thumbnail_output=None
+    ):
+        if len(job_group) == 1 and not thumbnail_output:
+            _, video_filters, audio_filters, output_args = (
+                job_group[0]["ffmpeg_args_parts"]
+            )
+            return self.ffmpeg_full_args(
+                input_args, video_filters, audio_filters, output_args
             )
-            instance.data["representations"].append(new_repre)
 
-            add_repre_files_for_cleanup(instance, new_repre)
+        outputs = [
+            (
+                job["ffmpeg_args_parts"][1],
+                job["ffmpeg_args_parts"][3],
+                self._get_job_audio_map(job)
+            )
+            for job in job_group
+        ]
+        if thumbnail_output:
+            outputs.append(thumbnail_output)
+        return self.ffmpeg_multi_output_args(input_args, outputs)
+
+    def _get_review_thumbnail_job(self, instance, jobs):
+        """Output from which decoded frames thumbnail is extracted.
+
+        Output tagged for review is preferred. Output must be possible
+        to encode with other outputs (see '_job_can_share_decode').
+
+        Returns:
+            Union[dict, None]: Job of output or None if thumbnail should
+                not be extracted.
+        """
+        if not (self.review_thumbnail or {}).get("enabled"):
+            return None
+
+        # Thumbnail was already extracted from other representation
+        if instance.data.get("reviewThumbnailPath"):
+            return None
+
+        jobs = [job for job in jobs if self._job_can_share_decode(job)]
+        for job in jobs:
+            if "review" in job["new_repre"]["tags"]:
+                return job
+        if jobs:
+            return jobs[0]
+        return None
+
+    def _prepare_review_thumbnail(self, instance, job):
+        """Output arguments of thumbnail tapped from output of the job.
+
+        Only single frame is passed to filters of the output, so the
+        thumbnail looks the same as the output (resolution, letter box,
+        lut etc.).
+
+        Returns:
+            tuple[str, tuple[list, list, None]]: Path to thumbnail and
+                video filters and output arguments of thumbnail.
+        """
+        temp_data = job["temp_data"]
+        duration_split = self.review_thumbnail.get("duration_split", 0.5)
+        frame = int(float(temp_data["output_frames_len"]) * duration_split)
+        frame = min(max(0, frame), temp_data["output_frames_len"] - 1)
+
+        # Create temp directory for thumbnail
+        dst_staging = tempfile.mkdtemp(prefix="pyblish_tmp_")
+        instance.context.data["cleanupFullPaths"].append(dst_staging)
+        filename = os.path.splitext(
+            os.path.basename(temp_data["full_input_path_single_file"])
+        )[0]
+        thumbnail_path = os.path.join(
+            dst_staging, "{}_thumb.jpg".format(filename)
+        )
+
+        video_filters = ["trim=start_frame={}:end_frame={}".format(
+            frame, frame + 1
+        )]
+        video_filters.extend(job["ffmpeg_args_parts"][1])
+        output_args = [
+            "-frames:v 1",
+            "-q:v 2",
+            "-y",
+            path_to_subprocess_arg(thumbnail_path)
+        ]
+        return thumbnail_path, (video_filters, output_args, None)
+
+    def _get_stream_input_args(self, input_args):
+        """Change input arguments to read video input from stdin.
+
+        First input is the video input, sequence specific arguments
+        of image demuxer are not available for pipe.
+        """
+        stream_input_args = []
+        video_input_found = False
+        for arg in input_args:
+            if video_input_found:
+                stream_input_args.append(arg)
+
+            elif arg.startswith("-i "):
+                video_input_found = True
+                stream_input_args.extend(["-f exr_pipe", "-i pipe:0"])
+
+            elif not arg.startswith("-start_number "):
+                stream_input_args.append(arg)
+        return stream_input_args
+
+    def _get_stream_frame_paths(self, input_paths, start_frame, frames_len):
+        """Paths to frames in order they're streamed to ffmpeg.
+
+        Missing frames are filled with previous existing frame.
+
+        Returns:
+            Union[list[str], None]: Paths to frames or None if input paths
+                are not a sequence, inputs are converted to temp directory
+                in that case.
+        """
+        collections, _ = clique.assemble(input_paths)
+        if len(collections) != 1:
+            self.log.debug(
+                "Input paths are not a single sequence, can't be streamed")
+            return None
+        collection = collections[0]
+        paths_by_frame = dict(zip(sorted(collection.indexes), collection))
+        frames = sorted(paths_by_frame.keys())
+
+        frame_paths = []
+        previous_path = paths_by_frame[frames[0]]
+        for frame in range(start_frame, start_frame + frames_len):
+            previous_path = paths_by_frame.get(frame, previous_path)
+            frame_paths.append(previous_path)
+        return frame_paths
+
+    def _add_output_representation(self, instance, job, subprcs_cmd):
+        temp_data = job["temp_data"]
+        output_name = job["output_name"]
+        new_repre = job["new_repre"]
+        new_repre.update({
+            "fps": temp_data["fps"],
+            "name": "{}_{}".format(output_name, job["output_ext"]),
+            "outputName": output_name,
+            "outputDef": job["output_def"],
+            "frameStartFtrack": temp_data["output_frame_start"],
+            "frameEndFtrack": temp_data["output_frame_end"],
+            "ffmpeg_cmd": subprcs_cmd
+        })
+
+        # Force to pop these key if are in new repre
+        new_repre.pop("thumbnail", None)
+        if "clean_name" in new_repre.get("tags", []):
+            new_repre.pop("outputName")
+
+        # adding representation
+        self.log.debug(
+            "Adding new representation: {}".format(new_repre)
+        )
+        instance.data["representations"].append(new_repre)
+
+        add_repre_files_for_cleanup(instance, new_repre)
+
+    def _group_output_jobs(self, jobs):
+        """Group outputs which can be encoded by single ffmpeg process.
+
+        Outputs are grouped only if 'single_pass_outputs' is enabled. Group
+        contains outputs with the same input arguments (input and frame
+        range) whose filters can be used in one filter graph.
+
+        Returns:
+            list[list[dict]]: Groups of jobs in order of output definitions.
+        """
+        if not self.single_pass_outputs:
+            return [[job] for job in jobs]
+
+        groups = []
+        groups_by_input = {}
+        for job in jobs:
+            if not self._job_can_share_decode(job):
+                groups.append([job])
+                continue
+
+            input_key = tuple(job["ffmpeg_args_parts"][0])
+            group = groups_by_input.get(input_key)
+            if group is None:
+                group = []
+                groups_by_input[input_key] = group
+                groups.append(group)
+            group.append(job)
+        return groups
+
+    def _job_can_share_decode(self, job):
+        _, video_filters, audio_filters, output_args = (
+            job["ffmpeg_args_parts"]
+        )
+        # Labeled filters (e.g. background color) would collide in
+        #   shared filter graph
+        if any("[" in video_filter for video_filter in video_filters):
+            return False
+
+        # Audio is mapped from single audio input without filters
+        if audio_filters:
+            return False
+
+        for arg in output_args:
+            if arg.startswith(("-filter_complex", "-lavfi", "-map")):
+                return False
+        return True
+
+    def _get_job_audio_map(self, job):
+        """Audio stream mapped to output encoded with other outputs.
+
+        Explicitly mapped video disables automatic stream selection of
+        ffmpeg, so audio which would be selected automatically is mapped.
+        """
+        temp_data = job["temp_data"]
+        if temp_data["output_ext_is_image"]:
+            return None
+        # Audio from instance is the second input
+        if temp_data["with_audio"]:
+            return "1:a?"
+        return "0:a?"
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -582,6 +935,30 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 process.
             temp_data (dict): Base data for successful process.
         """
+        return self.ffmpeg_full_args(*self._ffmpeg_argument_parts(
+            output_def,
+            instance,
+            new_repre,
+            temp_data,
+            fill_data,
+            layer_name
+        ))
+
+    def _ffmpeg_argument_parts(
+        self,
+        output_def,
+        instance,
+        new_repre,
+        temp_data,
+        fill_data,
+        layer_name
+    ):
+        """Prepares ffmpeg arguments split by their purpose.
+
+        Returns:
+            tuple[list, list, list, list]: Input arguments, video filters,
+                audio filters and output arguments with output filepath.
+        """
 
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
@@ -635,6 +1012,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             )
 
         duration_seconds = float(output_frames_len / temp_data["fps"])
+        temp_data["output_frames_len"] = output_frames_len
 
         # Define which layer should be used
         if layer_name:
@@ -650,6 +1028,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
             ffmpeg_input_args.extend([
                 "-start_number", str(start_number)
             ])
+            temp_data["input_start_number"] = start_number
+            temp_data["input_frames_len"] = output_frames_len
 
             # TODO add fps mapping `{fps: fraction}` ?
             # - e.g.: {
@@ -761,7 +1141,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        ffmpeg_output_args = self._move_output_filters(
+            ffmpeg_video_filters,
+            ffmpeg_audio_filters,
+            ffmpeg_output_args
+        )
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -809,6 +1194,32 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self._move_output_filters(
+            video_filters, audio_filters, output_args
+        )
+
+        all_args = [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+        ]
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def _move_output_filters(self, video_filters, audio_filters, output_args):
+        """Move filters from output arguments to list they belong to.
+
+        Returns:
+            list: Output arguments without filters.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -825,20 +1236,43 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     output_args.remove(arg)
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
+        return output_args
+
+    def ffmpeg_multi_output_args(self, input_args, outputs):
+        """Arguments of single ffmpeg process encoding multiple outputs.
 
+        Input is decoded once and split to filter chain of each output.
+
+        Args:
+            input_args (list): Input arguments shared by all outputs.
+            outputs (list[tuple[list, list, Union[str, None]]]): Video
+                filters, output arguments with output filepath and audio
+                stream specifier, for each output.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
         all_args = [
             subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
         ]
         all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
 
-        if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
+        filter_graph = ["[0:v]split={}{}".format(
+            len(outputs),
+            "".join("[in{}]".format(idx) for idx in range(len(outputs)))
+        )]
+        for idx, (video_filters, _, _) in enumerate(outputs):
+            filter_graph.append("[in{0}]{1}[out{0}]".format(
+                idx, ",".join(video_filters) or "null"
+            ))
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(filter_graph)))
 
-        all_args.extend(output_args)
+        for idx, (_, output_args, audio_map) in enumerate(outputs):
+            all_args.extend(["-map", "\"[out{}]\"".format(idx)])
+            if audio_map:
+                all_args.extend(["-map", audio_map])
+            all_args.extend(output_args)
 
         return all_args
 
@@ -846,9 +1280,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
+        This will take nearest frame file and link it with so as to fill
         gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        hole ahead. Hardlink is used if possible, then symlink, file is
+        copied only if none of them can be created.
 
         Args:
             files (list): List of representation files.
@@ -858,7 +1293,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         Returns:
             list of added files. Those should be cleaned after work
-                is done.
+                is done. Files which already exist (e.g. filled for
+                previous output) are not added.
 
         Raises:
             KnownPublishError: if more than one collection is obtained.
@@ -892,11 +1328,38 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            if os.path.lexists(hole_fpath):
+                continue
+
+            self._link_gap_file(src_fpath, hole_fpath)
             added_files.append(hole_fpath)
 
         return added_files
 
+    def _link_gap_file(self, src_fpath, dst_fpath):
+        try:
+            create_hard_link(src_fpath, dst_fpath)
+            return
+        except Exception:
+            self.log.debug(
+                "Failed to create hardlink {} -> {}".format(
+                    src_fpath, dst_fpath),
+                exc_info=True
+            )
+
+        # Symlinks may require privileges on Windows
+        try:
+            os.symlink(os.path.abspath(src_fpath), dst_fpath)
+            return
+        except Exception:
+            self.log.debug(
+                "Failed to create symlink {} -> {}".format(
+                    src_fpath, dst_fpath),
+                exc_info=True
+            )
+
+        speedcopy.copyfile(src_fpath, dst_fpath)
+
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
 
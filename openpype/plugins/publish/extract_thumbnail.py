@@ -37,6 +37,8 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         "nuke",
     ]
     enabled = False
+    # Instances can be processed concurrently (subprocess work only)
+    concurrent_instances = True
 
     integrate_thumbnail = False
     target_size = {
@@ -108,6 +110,10 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         if explicit_repres:
             filtered_repres = explicit_repres
         else:
+            # Reuse thumbnail extracted by 'ExtractReview' from frames it
+            #   already decoded
+            if self._add_review_thumbnail(instance):
+                return
             filtered_repres = self._get_filtered_repres(instance)
 
         if not filtered_repres:
@@ -206,36 +212,9 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
             else:
                 repre_name = "thumbnail"
 
-            # add thumbnail path to instance data for integrator
-            instance_thumb_path = instance.data.get("thumbnailPath")
-            if (
-                not instance_thumb_path
-                or not os.path.isfile(instance_thumb_path)
-            ):
-                self.log.debug(
-                    "Adding thumbnail path to instance data: {}".format(
-                        full_output_path
-                    )
-                )
-                instance.data["thumbnailPath"] = full_output_path
-
-            new_repre_tags = ["thumbnail"]
-            # for workflows which needs to have thumbnails published as
-            # separate representations `delete` tag should not be added
-            if not self.integrate_thumbnail:
-                new_repre_tags.append("delete")
-
-            new_repre = {
-                "name": repre_name,
-                "ext": "jpg",
-                "files": jpeg_file,
-                "stagingDir": dst_staging,
-                "thumbnail": True,
-                "tags": new_repre_tags
-            }
-
-            # adding representation
-            instance.data["representations"].append(new_repre)
+            new_repre = self._add_thumbnail_representation(
+                instance, repre_name, full_output_path
+            )
 
             if explicit_repres:
                 # this key will then align assetVersion ftrack thumbnail sync
@@ -254,6 +233,94 @@ class ExtractThumbnail(pyblish.api.InstancePlugin):
         if not thumbnail_created:
             self.log.warning("Thumbnail has not been created.")
 
+    def _add_review_thumbnail(self, instance):
+        """Use thumbnail extracted by 'ExtractReview' if possible.
+
+        Thumbnail of review is created from review output after its color
+        conversion, so it can't be used when ffmpeg input arguments are
+        set. It also must be taken from frame defined by 'duration_split'.
+        Target size, background color and ffmpeg output arguments are
+        applied to the thumbnail.
+        """
+        thumbnail_path = instance.data.get("reviewThumbnailPath")
+        if not thumbnail_path or not os.path.isfile(thumbnail_path):
+            return False
+
+        ffmpeg_args = self.ffmpeg_args or {}
+        if ffmpeg_args.get("input"):
+            self.log.debug(
+                "Thumbnail of review is not used, ffmpeg input arguments"
+                " are set."
+            )
+            return False
+
+        review_duration_split = instance.data.get(
+            "reviewThumbnailDurationSplit")
+        if review_duration_split != self.duration_split:
+            self.log.debug(
+                "Thumbnail of review is not used, it was created from"
+                " different frame."
+            )
+            return False
+
+        if (
+            self.target_size.get("type") != "source"
+            or ffmpeg_args.get("output")
+        ):
+            dst_staging = tempfile.mkdtemp(prefix="pyblish_tmp_")
+            instance.context.data["cleanupFullPaths"].append(dst_staging)
+            dst_path = os.path.join(
+                dst_staging, os.path.basename(thumbnail_path)
+            )
+            if not self._create_thumbnail_ffmpeg(thumbnail_path, dst_path):
+                return False
+            thumbnail_path = dst_path
+
+        new_repre = self._add_thumbnail_representation(
+            instance, "thumbnail", thumbnail_path
+        )
+        self.log.debug(
+            "Adding thumbnail representation extracted by review: {}".format(
+                new_repre)
+        )
+        return True
+
+    def _add_thumbnail_representation(
+        self, instance, repre_name, thumbnail_path
+    ):
+        # add thumbnail path to instance data for integrator
+        instance_thumb_path = instance.data.get("thumbnailPath")
+        if (
+            not instance_thumb_path
+            or not os.path.isfile(instance_thumb_path)
+        ):
+            self.log.debug(
+                "Adding thumbnail path to instance data: {}".format(
+                    thumbnail_path
+                )
+            )
+            instance.data["thumbnailPath"] = thumbnail_path
+
+        new_repre_tags = ["thumbnail"]
+        # for workflows which needs to have thumbnails published as
+        # separate representations `delete` tag should not be added
+        if not self.integrate_thumbnail:
+            new_repre_tags.append("delete")
+
+        dst_staging, jpeg_file = os.path.split(thumbnail_path)
+        new_repre = {
+            "name": repre_name,
+            "ext": "jpg",
+            "files": jpeg_file,
+            "stagingDir": dst_staging,
+            "thumbnail": True,
+            "tags": new_repre_tags
+        }
+
+        # adding representation
+        instance.data["representations"].append(new_repre)
+        return new_repre
+
     def _is_review_instance(self, instance):
         # TODO: We should probably handle "not creating" of thumbnail
         #   other way then checking for "review" key on instance data?
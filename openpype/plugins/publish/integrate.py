@@ -147,6 +147,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
     default_template_name = "publish"
 
+    # Maximum number of files transferred concurrently
+    transfer_max_workers = 8
+
     # Representation context keys that should always be written to
     # the database even if not used by the destination template
     db_representation_context_keys = [
@@ -177,9 +180,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_max_workers
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -281,7 +287,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
             for src, dst in prepared["transfers"]:
                 # todo: add support for hardlink transfers
-                file_transactions.add(src, dst)
+                file_transactions.add(
+                    src, dst, mode=FileTransaction.MODE_CLONE
+                )
 
             prepared_representations.append(prepared)
 
@@ -320,6 +328,8 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "Backed up existing files: {}".format(file_transactions.backups))
         self.log.debug(
             "Transferred files: {}".format(file_transactions.transferred))
+        self.log.debug(
+            "Transfer methods: {}".format(file_transactions.transfer_methods))
         self.log.debug("Retrieving Representation Site Sync information ...")
 
         # Get the accessible sites for Site Sync
@@ -389,6 +399,25 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         self.log.debug("{}".format(op_session.to_data()))
         op_session.commit()
 
+        # Updated representations keep their ids and would be found by
+        # sync server only with next full scan
+        if sync_server_module is not None and sync_server_module.enabled:
+            updated_repre_ids = [
+                prepared["representation"]["_id"]
+                for prepared in prepared_representations
+                if prepared["repre_doc_update_data"] is not None
+            ]
+            if updated_repre_ids:
+                try:
+                    sync_server_module.reset_timer(
+                        project_name, updated_repre_ids
+                    )
+                except Exception:
+                    self.log.warning(
+                        "Failed to notify sync server about updated"
+                        " representations.", exc_info=True
+                    )
+
         # Backwards compatibility used in hero integration.
         # todo: can we avoid the need to store this?
         instance.data["published_representations"] = {
@@ -736,22 +765,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            index_key = "udim" if is_udim else "frame"
+            dst_filepaths = path_template_obj.format_strict_batch(
+                template_data,
+                [{index_key: index} for index in destination_indexes]
+            )
+            self.log.debug(
+                "Template filled: {}".format(str(dst_filepaths[0]))
+            )
+            repre_context = dst_filepaths[0].used_values
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
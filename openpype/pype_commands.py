@@ -293,6 +293,11 @@ class PypeCommands:
         version_packer = VersionRepacker(directory)
         version_packer.process()
 
+    def create_modules_manifest(self, filepath=None):
+        from openpype.modules.base import create_modules_manifest
+
+        create_modules_manifest(filepath)
+
     def pack_project(self, project_name, dirpath, database_only):
         from openpype.lib.project_backpack import pack_project
 
@@ -0,0 +1,107 @@
+"""Long-lived process creating burnins.
+
+Alternative to running 'otio_burnin.py' for each burnin definition. Modules
+are imported only once and jobs are processed concurrently.
+
+Jobs are read from stdin as json lines '{"id": <id>, "data": <data>}' where
+data have same structure as input json of 'otio_burnin.py'. Result of each
+job is written to stdout as json line
+'{"id": <id>, "success": <bool>, "error": <str>, "output": <str>}'.
+Worker ends when stdin is closed.
+"""
+import sys
+import json
+import threading
+import traceback
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+from openpype.scripts.otio_burnin import burnins_from_data
+
+
+class ThreadOutput(object):
+    """Replacement of 'sys.stdout' capturing prints of each job separately.
+
+    Prints outside of job are written to passed stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def start_capture(self):
+        self._local.chunks = []
+
+    def stop_capture(self):
+        chunks = getattr(self._local, "chunks", None) or []
+        self._local.chunks = None
+        return "".join(chunks)
+
+    def write(self, text):
+        chunks = getattr(self._local, "chunks", None)
+        if chunks is None:
+            self._stream.write(text)
+        else:
+            chunks.append(text)
+
+    def flush(self):
+        self._stream.flush()
+
+
+def process_job(job, output, results_stream, results_lock):
+    result = {"id": job.get("id"), "success": True, "error": None}
+    output.start_capture()
+    try:
+        in_data = job["data"]
+        burnins_from_data(
+            in_data["input"],
+            in_data["output"],
+            in_data["burnin_data"],
+            codec_data=in_data.get("codec"),
+            options=in_data.get("options"),
+            burnin_values=in_data.get("values"),
+            full_input_path=in_data.get("full_input_path"),
+            first_frame=in_data.get("first_frame"),
+            source_ffmpeg_cmd=in_data.get("ffmpeg_cmd")
+        )
+    except Exception:
+        result["success"] = False
+        result["error"] = traceback.format_exc()
+    result["output"] = output.stop_capture()
+
+    with results_lock:
+        results_stream.write(json.dumps(result) + "\n")
+        results_stream.flush()
+
+
+def main(max_workers=None):
+    # Keep stdout only for results
+    results_stream = sys.stdout
+    output = ThreadOutput(sys.stderr)
+    sys.stdout = output
+    results_lock = threading.Lock()
+
+    if not max_workers:
+        max_workers = multiprocessing.cpu_count()
+
+    print("* Burnin worker started")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            executor.submit(
+                process_job,
+                json.loads(line),
+                output,
+                results_stream,
+                results_lock
+            )
+    print("* Burnin worker has finished")
+
+
+if __name__ == "__main__":
+    _max_workers = None
+    if len(sys.argv) > 1 and sys.argv[-1].isdigit():
+        _max_workers = int(sys.argv[-1])
+    main(_max_workers)
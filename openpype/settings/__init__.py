@@ -24,6 +24,9 @@ from .lib import (
     get_current_project_settings,
     get_anatomy_settings,
     get_local_settings,
+    get_system_settings_snapshot,
+    get_project_settings_snapshot,
+    SettingsSnapshot,
 )
 from .entities import (
     SystemSettings,
@@ -56,6 +59,9 @@ __all__ = (
     "get_current_project_settings",
     "get_anatomy_settings",
     "get_local_settings",
+    "get_system_settings_snapshot",
+    "get_project_settings_snapshot",
+    "SettingsSnapshot",
 
     "SystemSettings",
     "ProjectSettings",
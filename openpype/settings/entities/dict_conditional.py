@@ -787,7 +787,7 @@ class SyncServerProviders(DictConditionalEntity):
         provider_code_to_label = {}
         providers = lib_providers.factory.providers
         for provider_code, provider_info in providers.items():
-            provider, _ = provider_info
+            provider = provider_info[0]
             provider_code_to_label[provider_code] = provider.LABEL
 
         system_settings_schema = (
@@ -809,6 +809,29 @@ class SyncServerProviders(DictConditionalEntity):
                     "object_type": "text"
                 }
             )
+            configurables.extend([
+                {
+                    "type": "number",
+                    "key": "max_transfers",
+                    "label": "Max concurrent transfers (0 = provider default)",
+                    "minimum": 0,
+                    "default": 0
+                },
+                {
+                    "type": "number",
+                    "key": "bandwidth_limit",
+                    "label": "Bandwidth limit MB/s (0 = unlimited)",
+                    "minimum": 0,
+                    "decimal": 1,
+                    "default": 0
+                },
+                {
+                    "type": "boolean",
+                    "key": "content_dedup",
+                    "label": "Reuse already uploaded content",
+                    "default": False
+                }
+            ])
             label = provider_code_to_label.get(provider_code) or provider_code
 
             enum_children.append({
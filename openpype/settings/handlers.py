@@ -294,6 +294,23 @@ class SettingsHandler(object):
         """
         pass
 
+    def get_overrides_revision(self, settings_type, project_name=None):
+        """Revision of overrides which is changed when overrides change.
+
+        Settings merged from overrides can be reused until revision changes.
+
+        Args:
+            settings_type (str): Type of settings 'system_settings',
+                'project_settings' or 'project_anatomy'.
+            project_name (Optional[str]): Project name or None for studio
+                overrides.
+
+        Returns:
+            Union[int, None]: Revision or None if handler does not cache
+                overrides.
+        """
+        return None
+
     # Getters for specific version overrides
     @abstractmethod
     def get_studio_system_settings_overrides_for_version(self, version):
@@ -554,6 +571,15 @@ class LocalSettingsHandler:
         """Studio overrides of system settings."""
         pass
 
+    def get_local_settings_revision(self):
+        """Revision of local settings which is changed when they change.
+
+        Returns:
+            Union[int, None]: Revision or None if handler does not cache
+                local settings.
+        """
+        return None
+
 
 class CacheValues:
     cache_lifetime = 10
@@ -563,6 +589,8 @@ class CacheValues:
         self.creation_time = None
         self.version = None
         self.last_saved_info = None
+        # Changed when data or version change
+        self.revision = 0
 
     def data_copy(self):
         if not self.data:
@@ -573,6 +601,7 @@ class CacheValues:
         self.data = data
         self.creation_time = datetime.datetime.now()
         self.version = version
+        self.revision += 1
 
     def update_last_saved_info(self, last_saved_info):
         self.last_saved_info = last_saved_info
@@ -587,7 +616,10 @@ class CacheValues:
                 if value:
                     data = json.loads(value)
 
+        if data != self.data or version != self.version:
+            self.revision += 1
         self.data = data
+        self.creation_time = datetime.datetime.now()
         self.version = version
 
     def to_json_string(self):
@@ -601,7 +633,7 @@ class CacheValues:
         return delta > self.cache_lifetime
 
     def set_outdated(self):
-        self.create_time = None
+        self.creation_time = None
 
 
 class MongoSettingsHandler(SettingsHandler):
@@ -1346,6 +1378,14 @@ class MongoSettingsHandler(SettingsHandler):
 
     def get_studio_system_settings_overrides(self, return_version):
         """Studio overrides of system settings."""
+        self._update_system_settings_cache()
+        cache = self.system_settings_cache
+        data = cache.data_copy()
+        if return_version:
+            return data, cache.version
+        return data
+
+    def _update_system_settings_cache(self):
         if self.system_settings_cache.is_outdated:
             globals_document = self.get_global_settings_doc()
             document, version = self._get_system_settings_overrides_doc()
@@ -1364,12 +1404,6 @@ class MongoSettingsHandler(SettingsHandler):
                 last_saved_info
             )
 
-        cache = self.system_settings_cache
-        data = cache.data_copy()
-        if return_version:
-            return data, cache.version
-        return data
-
     def _get_system_settings_overrides_doc(self):
         document = (
             self._get_studio_system_settings_overrides_for_version()
@@ -1394,6 +1428,14 @@ class MongoSettingsHandler(SettingsHandler):
         return self.system_settings_cache.last_saved_info.copy()
 
     def _get_project_settings_overrides(self, project_name, return_version):
+        self._update_project_settings_cache(project_name)
+        cache = self.project_settings_cache[project_name]
+        data = cache.data_copy()
+        if return_version:
+            return data, cache.version
+        return data
+
+    def _update_project_settings_cache(self, project_name):
         if self.project_settings_cache[project_name].is_outdated:
             document, version = self._get_project_settings_overrides_doc(
                 project_name
@@ -1408,12 +1450,6 @@ class MongoSettingsHandler(SettingsHandler):
                 last_saved_info
             )
 
-        cache = self.project_settings_cache[project_name]
-        data = cache.data_copy()
-        if return_version:
-            return data, cache.version
-        return data
-
     def _get_project_settings_overrides_doc(self, project_name):
         document = self._get_project_settings_overrides_for_version(
             project_name
@@ -1499,6 +1535,14 @@ class MongoSettingsHandler(SettingsHandler):
         return output
 
     def _get_project_anatomy_overrides(self, project_name, return_version):
+        self._update_project_anatomy_cache(project_name)
+        cache = self.project_anatomy_cache[project_name]
+        data = cache.data_copy()
+        if return_version:
+            return data, cache.version
+        return data
+
+    def _update_project_anatomy_cache(self, project_name):
         if self.project_anatomy_cache[project_name].is_outdated:
             if project_name is None:
                 document = self._get_project_anatomy_overrides_for_version()
@@ -1517,16 +1561,24 @@ class MongoSettingsHandler(SettingsHandler):
 
             else:
                 project_doc = get_project(project_name)
-                self.project_anatomy_cache[project_name].update_data(
-                    self.project_doc_to_anatomy_data(project_doc),
+                self.project_anatomy_cache[project_name].update_from_document(
+                    {"data": self.project_doc_to_anatomy_data(project_doc)},
                     self._current_version
                 )
 
-        cache = self.project_anatomy_cache[project_name]
-        data = cache.data_copy()
-        if return_version:
-            return data, cache.version
-        return data
+    def get_overrides_revision(self, settings_type, project_name=None):
+        if settings_type == SYSTEM_SETTINGS_KEY:
+            self._update_system_settings_cache()
+            return self.system_settings_cache.revision
+
+        if settings_type == PROJECT_SETTINGS_KEY:
+            self._update_project_settings_cache(project_name)
+            return self.project_settings_cache[project_name].revision
+
+        if settings_type == PROJECT_ANATOMY_KEY:
+            self._update_project_anatomy_cache(project_name)
+            return self.project_anatomy_cache[project_name].revision
+        return None
 
     def get_studio_project_anatomy_overrides(self, return_version):
         """Studio overrides of default project anatomy data."""
@@ -1852,6 +1904,14 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
 
     def get_local_settings(self):
         """Local settings for local site id."""
+        self._update_local_settings_cache()
+        return self.local_settings_cache.data_copy()
+
+    def get_local_settings_revision(self):
+        self._update_local_settings_cache()
+        return self.local_settings_cache.revision
+
+    def _update_local_settings_cache(self):
         if self.local_settings_cache.is_outdated:
             document = self.collection.find_one({
                 "type": LOCAL_SETTING_KEY,
@@ -1859,5 +1919,3 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
             })
 
             self.local_settings_cache.update_from_document(document, None)
-
-        return self.local_settings_cache.data_copy()
@@ -4,6 +4,10 @@ import functools
 import logging
 import platform
 import copy
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 
 from openpype import AYON_SERVER_ENABLED
 
@@ -41,6 +45,10 @@ DEFAULTS_DIR = os.path.join(
 # Variable where cache of default settings are stored
 _DEFAULT_SETTINGS = None
 
+# Merged settings by settings type and arguments with revisions of their
+#   sources, the values are shared and must not be changed
+_SETTINGS_SNAPSHOTS = {}
+
 # Handler of studio overrides
 _SETTINGS_HANDLER = None
 
@@ -61,6 +69,29 @@ def clear_metadata_from_settings(values):
             clear_metadata_from_settings(item)
 
 
+def _clear_metadata_shared(value):
+    """Value without metadata keys, parts without metadata are not copied."""
+    if isinstance(value, dict):
+        output = {}
+        changed = False
+        for key, item in value.items():
+            if key in METADATA_KEYS:
+                changed = True
+                continue
+            new_item = _clear_metadata_shared(item)
+            if new_item is not item:
+                changed = True
+            output[key] = new_item
+        if changed:
+            return output
+
+    elif isinstance(value, list):
+        output = [_clear_metadata_shared(item) for item in value]
+        if any(new is not old for new, old in zip(output, value)):
+            return output
+    return value
+
+
 def calculate_changes(old_value, new_value):
     changes = {}
     for key, value in new_value.items():
@@ -539,6 +570,7 @@ def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    _SETTINGS_SNAPSHOTS.clear()
 
 
 def _get_default_settings():
@@ -589,10 +621,15 @@ def get_default_settings():
     Returns:
         dict: Loaded default settings.
     """
+    return copy.deepcopy(_get_default_settings_data())
+
+
+def _get_default_settings_data():
+    """Default settings shared by all callers, must not be changed."""
     global _DEFAULT_SETTINGS
     if _DEFAULT_SETTINGS is None:
         _DEFAULT_SETTINGS = _get_default_settings()
-    return copy.deepcopy(_DEFAULT_SETTINGS)
+    return _DEFAULT_SETTINGS
 
 
 def load_json_file(fpath):
@@ -719,6 +756,45 @@ def apply_overrides(source_data, override_data):
     return merge_overrides(_source_data, override_data)
 
 
+def _apply_overrides_shared(source_dict, override_dict):
+    """Apply overrides without changing source data.
+
+    Same as 'merge_overrides' but only dictionaries changed by overrides are
+    copied, other values are shared with source data.
+    """
+    if not override_dict:
+        return source_dict
+
+    overridden_keys = set(override_dict.get(M_OVERRIDDEN_KEY) or [])
+    output = dict(source_dict)
+    for key, value in override_dict.items():
+        if key == M_OVERRIDDEN_KEY:
+            continue
+
+        if (
+            key not in overridden_keys
+            and isinstance(value, dict)
+            and isinstance(output.get(key), dict)
+        ):
+            value = _apply_overrides_shared(output[key], value)
+        output[key] = value
+    return output
+
+
+def _copy_settings_path(settings, keys):
+    """Copy dictionaries on path to value so the value can be changed."""
+    output = dict(settings)
+    parent = output
+    for key in keys:
+        value = parent.get(key)
+        if not isinstance(value, dict):
+            break
+        value = dict(value)
+        parent[key] = value
+        parent = value
+    return output
+
+
 def apply_local_settings_on_system_settings(system_settings, local_settings):
     """Apply local settings on studio system settings.
 
@@ -922,72 +998,285 @@ def apply_local_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
-def _get_system_settings(clear_metadata=True, exclude_locals=None):
-    """System settings with applied studio overrides."""
-    default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
+class SettingsSnapshot(Mapping):
+    """Read-only settings shared by all callers of the same settings.
+
+    Nested dictionaries are returned as 'SettingsSnapshot' and lists as
+    tuples so values can't be changed by accident. Use 'copy' to get
+    mutable copy of values.
+
+    Args:
+        data (dict[str, Any]): Settings data which must not be changed.
+    """
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return _to_read_only(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return "<{}> {}".format(self.__class__.__name__, self._data)
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def copy(self):
+        """Mutable copy of settings.
+
+        Returns:
+            dict[str, Any]: Copy of settings data.
+        """
+        return copy.deepcopy(self._data)
+
+
+def _to_read_only(value):
+    if isinstance(value, dict):
+        return SettingsSnapshot(value)
+    if isinstance(value, list):
+        return tuple(_to_read_only(item) for item in value)
+    return value
+
+
+@require_handler
+def _get_overrides_revision(settings_type, project_name=None):
+    return _SETTINGS_HANDLER.get_overrides_revision(
+        settings_type, project_name
+    )
+
+
+@require_local_handler
+def _get_local_settings_revision():
+    return _LOCAL_SETTINGS_HANDLER.get_local_settings_revision()
+
+
+def _get_settings_snapshot(key, sources, create_func):
+    """Settings merged only once for the same revisions of sources.
+
+    Args:
+        key (tuple): Settings type with arguments of settings function.
+        sources (tuple): Revisions of overrides and local settings used
+            to create the settings.
+        create_func (Callable[[], dict]): Function creating settings.
+
+    Returns:
+        dict[str, Any]: Settings data which must not be changed.
+    """
+    # Handler does not know when overrides change
+    if None in sources:
+        return create_func()
+
+    item = _SETTINGS_SNAPSHOTS.get(key)
+    if item is not None and item[0] == sources:
+        return item[1]
+
+    data = create_func()
+    _SETTINGS_SNAPSHOTS[key] = (sources, data)
+    return data
+
+
+def _get_system_settings_data(clear_metadata, exclude_locals):
+    # Default behavior is based on `clear_metadata` value
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    sources = (_get_overrides_revision(SYSTEM_SETTINGS_KEY), )
+    if not exclude_locals:
+        sources += (_get_local_settings_revision(), )
+
+    return _get_settings_snapshot(
+        (SYSTEM_SETTINGS_KEY, clear_metadata, exclude_locals),
+        sources,
+        lambda: _create_system_settings(clear_metadata, exclude_locals)
+    )
+
+
+def _create_system_settings(clear_metadata, exclude_locals):
+    default_values = _get_default_settings_data()[SYSTEM_SETTINGS_KEY]
     studio_values = get_studio_system_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+    result = _apply_overrides_shared(default_values, studio_values)
 
     # Clear overrides metadata from settings
     if clear_metadata:
-        clear_metadata_from_settings(result)
+        result = _clear_metadata_shared(result)
 
     # Apply local settings
-    # Default behavior is based on `clear_metadata` value
+    if not exclude_locals:
+        # TODO local settings may be required to apply for environments
+        local_settings = get_local_settings()
+        if local_settings:
+            result = dict(result)
+            result["applications"] = copy.deepcopy(result["applications"])
+            apply_local_settings_on_system_settings(result, local_settings)
+
+    return result
+
+
+def _get_system_settings(clear_metadata=True, exclude_locals=None):
+    """System settings with applied studio overrides."""
+    return copy.deepcopy(
+        _get_system_settings_data(clear_metadata, exclude_locals)
+    )
+
+
+def _get_default_project_settings_data(clear_metadata, exclude_locals):
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    sources = (_get_overrides_revision(PROJECT_SETTINGS_KEY), )
+    if not exclude_locals:
+        sources += (_get_local_settings_revision(), )
+
+    return _get_settings_snapshot(
+        (PROJECT_SETTINGS_KEY, None, clear_metadata, exclude_locals),
+        sources,
+        lambda: _create_project_settings(None, clear_metadata, exclude_locals)
+    )
+
+
+def _get_project_settings_data(project_name, clear_metadata, exclude_locals):
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    sources = (
+        _get_overrides_revision(PROJECT_SETTINGS_KEY),
+        _get_overrides_revision(PROJECT_SETTINGS_KEY, project_name),
+    )
+    if not exclude_locals:
+        sources += (_get_local_settings_revision(), )
+
+    return _get_settings_snapshot(
+        (PROJECT_SETTINGS_KEY, project_name, clear_metadata, exclude_locals),
+        sources,
+        lambda: _create_project_settings(
+            project_name, clear_metadata, exclude_locals
+        )
+    )
+
+
+def _create_project_settings(project_name, clear_metadata, exclude_locals):
+    if project_name is None:
+        default_values = _get_default_settings_data()[PROJECT_SETTINGS_KEY]
+        override_values = get_studio_project_settings_overrides()
+    else:
+        default_values = _get_default_project_settings_data(False, True)
+        override_values = get_project_settings_overrides(project_name)
+
+    result = _apply_overrides_shared(default_values, override_values)
+
+    # Clear overrides metadata from settings
+    if clear_metadata:
+        result = _clear_metadata_shared(result)
+
+    # Apply local settings
     if not exclude_locals:
-        # TODO local settings may be required to apply for environments
         local_settings = get_local_settings()
-        apply_local_settings_on_system_settings(result, local_settings)
+        if local_settings:
+            result = _copy_settings_path(
+                result, ["global", "sync_server", "config"]
+            )
+            apply_local_settings_on_project_settings(
+                result, local_settings, project_name
+            )
 
     return result
 
 
 def get_default_project_settings(clear_metadata=True, exclude_locals=None):
     """Project settings with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_SETTINGS_KEY]
-    studio_values = get_studio_project_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
+    return copy.deepcopy(
+        _get_default_project_settings_data(clear_metadata, exclude_locals)
+    )
 
-    # Apply local settings
+
+def _get_anatomy_settings_data(
+    project_name, site_name, clear_metadata, exclude_locals
+):
     if exclude_locals is None:
         exclude_locals = not clear_metadata
 
+    sources = (_get_overrides_revision(PROJECT_ANATOMY_KEY), )
+    if project_name is not None:
+        sources += (
+            _get_overrides_revision(PROJECT_ANATOMY_KEY, project_name),
+        )
+
     if not exclude_locals:
-        local_settings = get_local_settings()
-        apply_local_settings_on_project_settings(
-            result, local_settings, None
+        # Active site is taken from project settings
+        sources += (
+            _get_local_settings_revision(),
+            _get_overrides_revision(PROJECT_SETTINGS_KEY),
         )
-    return result
+        if project_name is not None:
+            sources += (
+                _get_overrides_revision(PROJECT_SETTINGS_KEY, project_name),
+            )
 
+    return _get_settings_snapshot(
+        (
+            PROJECT_ANATOMY_KEY,
+            project_name,
+            site_name,
+            clear_metadata,
+            exclude_locals
+        ),
+        sources,
+        lambda: _create_anatomy_settings(
+            project_name, site_name, clear_metadata, exclude_locals
+        )
+    )
 
-def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
-    """Project anatomy data with applied studio's default project overrides."""
-    default_values = get_default_settings()[PROJECT_ANATOMY_KEY]
-    studio_values = get_studio_project_anatomy_overrides()
 
-    result = apply_overrides(default_values, studio_values)
+def _create_anatomy_settings(
+    project_name, site_name, clear_metadata, exclude_locals
+):
+    if project_name is None:
+        default_values = _get_default_settings_data()[PROJECT_ANATOMY_KEY]
+        studio_values = get_studio_project_anatomy_overrides()
+        result = _apply_overrides_shared(default_values, studio_values)
+    else:
+        studio_overrides = _get_anatomy_settings_data(None, None, False, True)
+        project_overrides = get_project_anatomy_overrides(
+            project_name
+        )
+        result = dict(studio_overrides)
+        if project_overrides:
+            for key, value in project_overrides.items():
+                result[key] = value
+
     # Clear overrides metadata from settings
     if clear_metadata:
-        clear_metadata_from_settings(result)
+        result = _clear_metadata_shared(result)
 
     # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
     if not exclude_locals:
         local_settings = get_local_settings()
-        apply_local_settings_on_anatomy_settings(
-            result, local_settings, None
-        )
+        if local_settings:
+            result = dict(result)
+            result["roots"] = copy.deepcopy(result["roots"])
+            apply_local_settings_on_anatomy_settings(
+                result, local_settings, project_name, site_name
+            )
+
     return result
 
 
+def get_default_anatomy_settings(clear_metadata=True, exclude_locals=None):
+    """Project anatomy data with applied studio's default project overrides."""
+    return copy.deepcopy(
+        _get_anatomy_settings_data(None, None, clear_metadata, exclude_locals)
+    )
+
+
 def get_anatomy_settings(
     project_name, site_name=None, clear_metadata=True, exclude_locals=None
 ):
@@ -998,30 +1287,9 @@ def get_anatomy_settings(
             "`get_default_anatomy_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_anatomy_settings(False)
-    project_overrides = get_project_anatomy_overrides(
-        project_name
-    )
-    result = copy.deepcopy(studio_overrides)
-    if project_overrides:
-        for key, value in project_overrides.items():
-            result[key] = value
-
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
-
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
-    if not exclude_locals:
-        local_settings = get_local_settings()
-        apply_local_settings_on_anatomy_settings(
-            result, local_settings, project_name, site_name
-        )
-
-    return result
+    return copy.deepcopy(_get_anatomy_settings_data(
+        project_name, site_name, clear_metadata, exclude_locals
+    ))
 
 
 def _get_project_settings(
@@ -1034,28 +1302,9 @@ def _get_project_settings(
             " Call `get_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
-    project_overrides = get_project_settings_overrides(
-        project_name
-    )
-
-    result = apply_overrides(studio_overrides, project_overrides)
-
-    # Clear overrides metadata from settings
-    if clear_metadata:
-        clear_metadata_from_settings(result)
-
-    # Apply local settings
-    if exclude_locals is None:
-        exclude_locals = not clear_metadata
-
-    if not exclude_locals:
-        local_settings = get_local_settings()
-        apply_local_settings_on_project_settings(
-            result, local_settings, project_name
-        )
-
-    return result
+    return copy.deepcopy(_get_project_settings_data(
+        project_name, clear_metadata, exclude_locals
+    ))
 
 
 def get_current_project_settings():
@@ -1142,3 +1391,39 @@ def get_project_settings(project_name, *args, **kwargs):
 
     default_settings = get_default_settings()[PROJECT_SETTINGS_KEY]
     return get_ayon_project_settings(default_settings, project_name)
+
+
+def get_system_settings_snapshot():
+    """Read-only system settings without copy of the values.
+
+    Faster alternative of 'get_system_settings' for read access. Settings
+    are merged only when studio overrides or local settings change.
+
+    Returns:
+        SettingsSnapshot: Read-only system settings.
+    """
+    if not AYON_SERVER_ENABLED:
+        return SettingsSnapshot(_get_system_settings_data(True, None))
+    return SettingsSnapshot(get_system_settings())
+
+
+def get_project_settings_snapshot(project_name):
+    """Read-only project settings without copy of the values.
+
+    Faster alternative of 'get_project_settings' for read access. Settings
+    are merged only when studio or project overrides or local settings
+    change.
+
+    Args:
+        project_name (str): Project name.
+
+    Returns:
+        SettingsSnapshot: Read-only project settings.
+    """
+    if not AYON_SERVER_ENABLED:
+        if not project_name:
+            raise ValueError("Must enter project name.")
+        return SettingsSnapshot(
+            _get_project_settings_data(project_name, True, None)
+        )
+    return SettingsSnapshot(get_project_settings(project_name))
@@ -42,7 +42,12 @@ from openpype.pipeline.create.context import (
     CreatorsOperationFailed,
     ConvertorsOperationFailed,
 )
-from openpype.pipeline.publish import get_publish_instance_label
+from openpype.pipeline.publish import (
+    get_publish_instance_label,
+    get_publish_max_workers,
+    is_plugin_concurrent,
+    process_instances_concurrently,
+)
 
 # Define constant for plugin orders offset
 PLUGIN_ORDER_OFFSET = 0.5
@@ -2444,6 +2449,32 @@ class PublisherController(BasePublisherController):
                     self._publish_report.set_plugin_skipped()
                     continue
 
+                max_workers = get_publish_max_workers(
+                    self._publish_context.data.get("project_settings")
+                )
+                if is_plugin_concurrent(plugin) and max_workers > 1:
+                    instances = [
+                        instance
+                        for instance in instances
+                        if instance.data.get("publish") is not False
+                    ]
+                    if len(instances) > 1:
+                        self._emit_event(
+                            "publish.process.instance.changed",
+                            {"instance_label": ", ".join(
+                                instance.data.get("label")
+                                or instance.data["name"]
+                                for instance in instances
+                            )}
+                        )
+                        yield MainThreadItem(
+                            self._process_concurrently_and_continue,
+                            plugin,
+                            instances,
+                            max_workers
+                        )
+                        continue
+
                 for instance in instances:
                     if instance.data.get("publish") is False:
                         continue
@@ -2500,7 +2531,43 @@ class PublisherController(BasePublisherController):
         result = pyblish.plugin.process(
             plugin, self._publish_context, instance
         )
+        self._add_process_result(result)
+
+        self._publish_next_process()
+
+    def _process_concurrently_and_continue(
+        self, plugin, instances, max_workers
+    ):
+        results = process_instances_concurrently(
+            plugin,
+            self._publish_context,
+            instances,
+            max_workers,
+            stop_callback=self._should_stop_concurrent_process
+        )
+        for result in results:
+            self._add_process_result(result)
+
+        self._publish_next_process()
 
+    def _should_stop_concurrent_process(self, results):
+        """Publishing was stopped or processed instances crashed."""
+        if not self.publish_is_running or self.publish_has_crashed:
+            return True
+
+        for result in results:
+            exception = result["error"]
+            if exception is None:
+                continue
+            # Validation errors don't stop other instances in validation
+            if not (
+                isinstance(exception, PublishValidationError)
+                and not self.publish_has_validated
+            ):
+                return True
+        return False
+
+    def _add_process_result(self, result):
         exception = result.get("error")
         if exception:
             has_validation_error = False
@@ -2526,8 +2593,6 @@ class PublisherController(BasePublisherController):
 
         self._publish_report.add_result(result)
 
-        self._publish_next_process()
-
 
 def collect_families_from_instances(instances, only_active=False):
     """Collect all families for passed publish instances.
@@ -448,9 +448,35 @@ class ExtractReviewProfileModel(BaseSettingsModel):
         return value
 
 
+class ExtractReviewThumbnailModel(BaseSettingsModel):
+    enabled: bool = Field(False)
+    duration_split: float = Field(
+        0.5,
+        title="Duration split",
+        ge=0.0,
+        le=1.0
+    )
+
+
 class ExtractReviewModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = Field(True)
+    single_pass_outputs: bool = Field(
+        False,
+        title="Encode outputs sharing input in single pass"
+    )
+    stream_converted_inputs: bool = Field(
+        False,
+        title="Stream converted input frames to ffmpeg"
+    )
+    persist_media_info: bool = Field(
+        False,
+        title="Keep media info of staging dirs for next publish"
+    )
+    review_thumbnail: ExtractReviewThumbnailModel = Field(
+        default_factory=ExtractReviewThumbnailModel,
+        title="Thumbnail from review output"
+    )
     profiles: list[ExtractReviewProfileModel] = Field(
         default_factory=list,
         title="Profiles"
@@ -548,6 +574,10 @@ class ExtractBurninProfile(BaseSettingsModel):
 class ExtractBurninModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = Field(True)
+    use_burnin_worker: bool = Field(
+        False,
+        title="Create burnins in long-lived process"
+    )
     options: ExtractBurninOptionsModel = Field(
         default_factory=ExtractBurninOptionsModel,
         title="Burnin formatting options"
@@ -862,6 +892,13 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractReview": {
         "enabled": True,
+        "single_pass_outputs": False,
+        "stream_converted_inputs": False,
+        "persist_media_info": False,
+        "review_thumbnail": {
+            "enabled": False,
+            "duration_split": 0.5
+        },
         "profiles": [
             {
                 "product_types": [],
@@ -956,6 +993,7 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractBurnin": {
         "enabled": True,
+        "use_burnin_worker": False,
         "options": {
             "font_size": 42,
             "font_color": [255, 255, 255, 1.0],
@@ -248,6 +248,16 @@ class PublishToolModel(BaseSettingsModel):
         default_factory=list,
         title="Custom Staging Dir Profiles"
     )
+    max_workers: int = Field(
+        1,
+        title="Max concurrently processed instances",
+        ge=1,
+        le=64,
+        description=(
+            "Instances processed at the same time by publish plugins which"
+            " support it. Value 1 disables concurrent processing."
+        )
+    )
 
 
 class GlobalToolsModel(BaseSettingsModel):
@@ -512,6 +522,7 @@ DEFAULT_TOOLS_VALUES = {
                 "task_names": [],
                 "template_name": "hero_simpleUnrealTextureHero"
             }
-        ]
+        ],
+        "max_workers": 1
     }
 }
@@ -0,0 +1,435 @@
+"""Benchmark of review and transcoding in publish.
+
+Generates synthetic image sequence and runs steps of publish hot path on
+it, each step is measured separately:
+- convert: 'convert_input_paths_for_ffmpeg' of whole sequence
+- colorspace: 'convert_colorspace' of whole sequence (requires OCIO config)
+- review: 'ExtractReview' with outputs from default settings
+- thumbnail: 'ExtractThumbnail' with default settings
+
+Plugins process minimal pyblish instance of 'review' family. Reported are
+wall time, count of subprocesses, bytes written to temp directory and peak
+memory of each step. Generated files are removed after the benchmark.
+
+Requires oiiotool and ffmpeg.
+
+Example:
+    python -m tests.benchmark.review --resolution 2048x1152 --frames 48 \
+        --compression dwaa
+"""
+import os
+import sys
+import copy
+import json
+import shutil
+import logging
+import argparse
+import tempfile
+import statistics
+
+from .sequences import generate_sequence
+from .metrics import StepMonitor
+
+STEPS = ["convert", "colorspace", "review", "thumbnail"]
+FRAME_START = 1001
+SEQUENCE_NAME = "beauty"
+
+
+def get_default_plugin_settings(plugin_name):
+    """Settings of publish plugin from default project settings."""
+    from openpype.settings.lib import load_openpype_default_settings
+
+    settings = load_openpype_default_settings()["project_settings"]["global"]
+    return settings["publish"][plugin_name]
+
+
+def create_plugin(plugin_class, settings):
+    """Create plugin with settings applied same way as during publishing."""
+    plugin = plugin_class()
+    for key, value in settings.items():
+        setattr(plugin, key, copy.deepcopy(value))
+    return plugin
+
+
+def create_instance(args, staging_dir, filenames, colorspace_data):
+    """Create minimal instance of 'review' family with sequence."""
+    import pyblish.api
+
+    width, height = args.resolution
+    frame_end = FRAME_START + args.frames - 1
+    context = pyblish.api.Context()
+    context.data.update({
+        "hostName": "shell",
+        "cleanupFullPaths": [],
+        "handleStart": 0,
+        "handleEnd": 0,
+    })
+    instance = context.create_instance("renderBenchmarkMain")
+    representation = {
+        "name": args.format,
+        "ext": args.format,
+        "files": list(filenames),
+        "stagingDir": staging_dir,
+        "frameStart": FRAME_START,
+        "frameEnd": frame_end,
+        "tags": ["review"],
+    }
+    if colorspace_data:
+        representation["colorspaceData"] = colorspace_data
+
+    instance.data.update({
+        "family": "review",
+        "families": ["review"],
+        "subset": "renderBenchmarkMain",
+        "frameStart": FRAME_START,
+        "frameEnd": frame_end,
+        "handleStart": 0,
+        "handleEnd": 0,
+        "fps": 25.0,
+        "resolutionWidth": width,
+        "resolutionHeight": height,
+        "pixelAspect": 1.0,
+        "anatomyData": {
+            "project": {"name": "benchmark", "code": "bench"},
+            "asset": "benchmark",
+            "subset": "renderBenchmarkMain",
+            "family": "review",
+        },
+        "representations": [representation],
+    })
+    return instance
+
+
+def run_convert(args, instance, log):
+    from openpype.lib import (
+        get_transcode_temp_directory,
+        convert_input_paths_for_ffmpeg,
+    )
+
+    repre = instance.data["representations"][0]
+    input_paths = [
+        os.path.join(repre["stagingDir"], filename)
+        for filename in repre["files"]
+    ]
+    output_dir = get_transcode_temp_directory()
+    try:
+        convert_input_paths_for_ffmpeg(input_paths, output_dir, log)
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def run_colorspace(args, instance, log):
+    from openpype.lib import convert_colorspace
+
+    repre = instance.data["representations"][0]
+    frame_range = "{}-{}#".format(repre["frameStart"], repre["frameEnd"])
+    filename = "{}.{}.{}".format(SEQUENCE_NAME, frame_range, args.format)
+    output_dir = tempfile.mkdtemp(prefix="op_colorspace_")
+    try:
+        convert_colorspace(
+            os.path.join(repre["stagingDir"], filename),
+            os.path.join(output_dir, filename),
+            args.ocio_config,
+            args.source_colorspace,
+            target_colorspace=args.target_colorspace,
+            logger=log
+        )
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def run_review(args, instance, log):
+    from openpype.plugins.publish.extract_review import ExtractReview
+
+    settings = get_default_plugin_settings("ExtractReview")
+    settings.pop("enabled", None)
+    settings["single_pass_outputs"] = args.single_pass_outputs
+    settings["stream_converted_inputs"] = args.stream_converted_inputs
+    settings["review_thumbnail"]["enabled"] = args.review_thumbnail
+    plugin = create_plugin(ExtractReview, settings)
+    plugin.process(instance)
+
+
+def run_thumbnail(args, instance, log):
+    from openpype.plugins.publish.extract_thumbnail import ExtractThumbnail
+
+    settings = get_default_plugin_settings("ExtractThumbnail")
+    settings.pop("enabled", None)
+    plugin = create_plugin(ExtractThumbnail, settings)
+    plugin.process(instance)
+
+
+STEP_FUNCTIONS = {
+    "convert": run_convert,
+    "colorspace": run_colorspace,
+    "review": run_review,
+    "thumbnail": run_thumbnail,
+}
+
+
+def run_round(args, steps, staging_dir, filenames, temp_root, log):
+    """Run all steps on new instance, steps share the instance.
+
+    Returns:
+        dict[str, dict[str, Any]]: Measured values by step name.
+    """
+    from openpype.lib.transcoding import MEDIA_INFO_CACHE
+
+    # Each round reads information about media files again
+    MEDIA_INFO_CACHE.clear()
+    media_info_dir = os.path.join(temp_root, "openpype_media_info")
+    if os.path.exists(media_info_dir):
+        shutil.rmtree(media_info_dir)
+
+    colorspace_data = None
+    if args.ocio_config:
+        colorspace_data = {
+            "colorspace": args.source_colorspace,
+            "config": {"path": args.ocio_config},
+        }
+    instance = create_instance(args, staging_dir, filenames, colorspace_data)
+
+    report = {}
+    for step in steps:
+        with StepMonitor(temp_root, args.interval) as monitor:
+            STEP_FUNCTIONS[step](args, instance, log)
+        report[step] = monitor.get_report()
+    return report
+
+
+def run_benchmark(args, log):
+    steps = list(args.steps)
+    if "colorspace" in steps and not args.ocio_config:
+        print("Skipping 'colorspace' step, OCIO config is not set")
+        steps.remove("colorspace")
+
+    root = tempfile.mkdtemp(prefix="op_review_benchmark_")
+    staging_dir = os.path.join(root, "staging")
+    temp_root = os.path.join(root, "temp")
+    os.makedirs(temp_root)
+    orig_tempdir = tempfile.tempdir
+    try:
+        width, height = args.resolution
+        filenames = generate_sequence(
+            staging_dir,
+            SEQUENCE_NAME,
+            args.format,
+            FRAME_START,
+            FRAME_START + args.frames - 1,
+            width,
+            height,
+            args.channels,
+            data_type=args.data_type,
+            compression=args.compression,
+            multipart=args.multipart,
+            logger=log
+        )
+        input_bytes = sum(
+            os.path.getsize(os.path.join(staging_dir, filename))
+            for filename in filenames
+        )
+        print("Generated {} frames ({:.1f} MB) in '{}'".format(
+            len(filenames), input_bytes / (1024 * 1024), staging_dir))
+
+        # Temp files of all steps are created in measured directory
+        tempfile.tempdir = temp_root
+        rounds = []
+        for _ in range(args.repeat):
+            rounds.append(run_round(
+                args, steps, staging_dir, list(filenames), temp_root, log
+            ))
+            # Outputs of previous round are not inputs of following round
+            for filename in os.listdir(staging_dir):
+                if filename not in filenames:
+                    path = os.path.join(staging_dir, filename)
+                    if os.path.isdir(path):
+                        shutil.rmtree(path)
+                    else:
+                        os.remove(path)
+
+    finally:
+        tempfile.tempdir = orig_tempdir
+        if args.keep:
+            print("Benchmark files kept in '{}'".format(root))
+        else:
+            shutil.rmtree(root)
+
+    return _get_report(args, steps, input_bytes, rounds)
+
+
+def _get_report(args, steps, input_bytes, rounds):
+    width, height = args.resolution
+    report = {
+        "resolution": "{}x{}".format(width, height),
+        "frames": args.frames,
+        "format": args.format,
+        "channels": args.channels,
+        "data_type": args.data_type,
+        "compression": args.compression,
+        "multipart": args.multipart,
+        "input_bytes": input_bytes,
+        "single_pass_outputs": args.single_pass_outputs,
+        "stream_converted_inputs": args.stream_converted_inputs,
+        "review_thumbnail": args.review_thumbnail,
+        "rounds": len(rounds),
+        "steps": {},
+    }
+    for step in steps:
+        step_rounds = [round_report[step] for round_report in rounds]
+        # Values of round with median wall time
+        wall_times = [item["wall_time"] for item in step_rounds]
+        median_time = statistics.median_low(wall_times)
+        step_report = dict(step_rounds[wall_times.index(median_time)])
+        step_report["wall_time_min"] = min(wall_times)
+        step_report["wall_time_max"] = max(wall_times)
+        report["steps"][step] = step_report
+    return report
+
+
+def _format_bytes(value):
+    if value is None:
+        return "-"
+    return "{:.1f} MB".format(value / (1024 * 1024))
+
+
+def print_report(report):
+    print((
+        "Input: {frames} frames {resolution} {format}, {channels} channels,"
+        " data type {data_type}, compression {compression},"
+        " multipart {multipart}"
+    ).format(**report))
+    print("Rounds: {}".format(report["rounds"]))
+    for step, values in report["steps"].items():
+        print((
+            "{}: {:.2f}s (min {:.2f}s, max {:.2f}s), {} subprocesses,"
+            " temp written {}, temp peak {}, peak RSS {},"
+            " max subprocess RSS {}"
+        ).format(
+            step,
+            values["wall_time"],
+            values["wall_time_min"],
+            values["wall_time_max"],
+            values["subprocesses"],
+            _format_bytes(values["temp_bytes_written"]),
+            _format_bytes(values["temp_peak_bytes"]),
+            _format_bytes(values["peak_rss"]),
+            _format_bytes(values["max_subprocess_rss"])
+        ))
+
+
+def _resolution(value):
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            "Resolution must be in format '<width>x<height>'")
+    return width, height
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmark.review",
+        description="Measure review and transcoding steps of publishing."
+    )
+    parser.add_argument(
+        "--steps", nargs="+", choices=STEPS, default=STEPS,
+        help="Measured steps."
+    )
+    parser.add_argument(
+        "--resolution", type=_resolution, default=(1920, 1080),
+        help="Resolution of frames, e.g. '1920x1080'."
+    )
+    parser.add_argument(
+        "--frames", type=int, default=24,
+        help="Number of frames."
+    )
+    parser.add_argument(
+        "--format", choices=["exr", "png"], default="exr",
+        help="Format of frames."
+    )
+    parser.add_argument(
+        "--channels", type=int, default=4,
+        help="Number of channels, more than 4 adds extra channels."
+    )
+    parser.add_argument(
+        "--data_type", default=None,
+        help="Data type of pixels, 'half' for exr, 'uint8' for png."
+    )
+    parser.add_argument(
+        "--compression", default=None,
+        help="Compression of exr frames, e.g. 'zip', 'piz' or 'dwaa'."
+    )
+    parser.add_argument(
+        "--multipart", action="store_true",
+        help="Exr frames have two parts."
+    )
+    parser.add_argument(
+        "--ocio_config", default=os.environ.get("OCIO"),
+        help="Path to OCIO config for 'colorspace' step, 'OCIO' by default."
+    )
+    parser.add_argument(
+        "--source_colorspace", default="ACES - ACEScg",
+        help="Colorspace of frames."
+    )
+    parser.add_argument(
+        "--target_colorspace", default="Output - Rec.709",
+        help="Target colorspace of 'colorspace' step."
+    )
+    parser.add_argument(
+        "--single_pass_outputs", action="store_true",
+        help="Use 'single_pass_outputs' of ExtractReview."
+    )
+    parser.add_argument(
+        "--stream_converted_inputs", action="store_true",
+        help="Use 'stream_converted_inputs' of ExtractReview."
+    )
+    parser.add_argument(
+        "--review_thumbnail", action="store_true",
+        help="Use 'review_thumbnail' of ExtractReview."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1,
+        help="Number of rounds, median of rounds is reported."
+    )
+    parser.add_argument(
+        "--interval", type=float, default=0.05,
+        help="Seconds between samples of temp files and memory."
+    )
+    parser.add_argument(
+        "--output", default=None,
+        help="Path to json file where report is stored."
+    )
+    parser.add_argument(
+        "--keep", action="store_true",
+        help="Keep generated files after benchmark."
+    )
+    parser.add_argument(
+        "--verbose", action="store_true",
+        help="Show log of publish plugins."
+    )
+    args = parser.parse_args(argv)
+    if args.data_type is None:
+        args.data_type = "half" if args.format == "exr" else "uint8"
+    if args.format != "exr":
+        args.compression = None
+        args.multipart = False
+    return args
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING
+    )
+    log = logging.getLogger("review_benchmark")
+
+    report = run_benchmark(args, log)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as stream:
+            json.dump(report, stream, indent=4)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Measurement of subprocesses, temp files and memory of benchmark step."""
+import os
+import time
+import platform
+import threading
+import subprocess
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def _get_process_tree_rss():
+    """RSS of current process and all its children in bytes."""
+    process = psutil.Process()
+    total = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+
+def _get_max_subprocess_rss():
+    """Peak RSS of largest finished subprocess in bytes."""
+    if resource is None:
+        return None
+    # 'ru_maxrss' is in kilobytes on linux and in bytes on macOS
+    value = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    if platform.system().lower() == "darwin":
+        return value
+    return value * 1024
+
+
+class StepMonitor(object):
+    """Measure one benchmark step.
+
+    Counts subprocesses started by any thread, samples size of files in
+    temp directory and RSS of process tree. Files created and removed
+    between two samples are not counted, same for memory peaks.
+
+    RSS of process tree is sampled only if 'psutil' is available. Peak RSS
+    of largest subprocess is high-water mark of whole benchmark, because
+    it can't be reset.
+
+    Args:
+        temp_dir (str): Directory where temp files are created.
+        interval (float): Seconds between samples.
+    """
+
+    def __init__(self, temp_dir, interval=0.05):
+        self._temp_dir = temp_dir
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._orig_popen = None
+        self._lock = threading.Lock()
+
+        self._start_time = None
+        self._start_sizes = {}
+        self._max_sizes = {}
+
+        self.wall_time = None
+        self.subprocesses = 0
+        self.temp_peak_bytes = 0
+        self.peak_rss = None
+
+    def __enter__(self):
+        self._start_sizes = self._get_temp_sizes()
+        self._max_sizes = dict(self._start_sizes)
+        self._patch_popen()
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample_loop)
+        self._thread.daemon = True
+        self._thread.start()
+        self._start_time = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.wall_time = time.time() - self._start_time
+        self._stop_event.set()
+        self._thread.join()
+        subprocess.Popen = self._orig_popen
+        self._sample()
+
+    @property
+    def temp_bytes_written(self):
+        """Bytes written to temp directory during step."""
+        return sum(
+            max(0, size - self._start_sizes.get(path, 0))
+            for path, size in self._max_sizes.items()
+        )
+
+    def get_report(self):
+        return {
+            "wall_time": self.wall_time,
+            "subprocesses": self.subprocesses,
+            "temp_bytes_written": self.temp_bytes_written,
+            "temp_peak_bytes": self.temp_peak_bytes,
+            "peak_rss": self.peak_rss,
+            "max_subprocess_rss": _get_max_subprocess_rss(),
+        }
+
+    def _patch_popen(self):
+        monitor = self
+        orig_popen = subprocess.Popen
+
+        class CountingPopen(orig_popen):
+            def __init__(self, *args, **kwargs):
+                super(CountingPopen, self).__init__(*args, **kwargs)
+                with monitor._lock:
+                    monitor.subprocesses += 1
+
+        self._orig_popen = orig_popen
+        subprocess.Popen = CountingPopen
+
+    def _get_temp_sizes(self):
+        sizes = {}
+        for root, _, filenames in os.walk(self._temp_dir):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                try:
+                    sizes[path] = os.path.getsize(path)
+                except OSError:
+                    pass
+        return sizes
+
+    def _sample(self):
+        sizes = self._get_temp_sizes()
+        self.temp_peak_bytes = max(
+            self.temp_peak_bytes, sum(sizes.values())
+        )
+        for path, size in sizes.items():
+            if size > self._max_sizes.get(path, 0):
+                self._max_sizes[path] = size
+
+        if psutil is not None:
+            rss = _get_process_tree_rss()
+            self.peak_rss = max(self.peak_rss or 0, rss)
+
+    def _sample_loop(self):
+        while not self._stop_event.wait(self._interval):
+            self._sample()
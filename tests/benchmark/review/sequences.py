@@ -0,0 +1,89 @@
+"""Synthetic image sequences used as input of review benchmark."""
+import os
+
+from openpype.lib import get_oiio_tool_args, run_subprocess
+
+# Names of first channels, other channels are named 'extra<index>'
+CHANNEL_NAMES = ["R", "G", "B", "A"]
+
+
+def get_channel_names(channels):
+    """Channel names of image with passed number of channels."""
+    names = list(CHANNEL_NAMES[:channels])
+    for idx in range(len(names), channels):
+        names.append("extra{}".format(idx))
+    return names
+
+
+def get_sequence_filenames(name, ext, frame_start, frame_end):
+    return [
+        "{}.{:0>4}.{}".format(name, frame, ext)
+        for frame in range(frame_start, frame_end + 1)
+    ]
+
+
+def generate_sequence(
+    output_dir,
+    name,
+    ext,
+    frame_start,
+    frame_end,
+    width,
+    height,
+    channels,
+    data_type=None,
+    compression=None,
+    multipart=False,
+    logger=None
+):
+    """Create image sequence with noise using oiiotool.
+
+    Each frame has different noise so encoders can't skip frames.
+
+    Args:
+        output_dir (str): Directory where frames are created.
+        name (str): Name of sequence used as prefix of filenames.
+        ext (str): Extension of frames without dot, e.g. 'exr' or 'png'.
+        frame_start (int): First frame of sequence.
+        frame_end (int): Last frame of sequence.
+        width (int): Width of frames.
+        height (int): Height of frames.
+        channels (int): Number of channels.
+        data_type (Optional[str]): Data type of pixels, e.g. 'half'.
+        compression (Optional[str]): Compression of frames, e.g. 'dwaa'.
+        multipart (bool): Frames have second part (subimage) with the same
+            channels, only for exr.
+        logger (Optional[logging.Logger]): Logger used for output.
+
+    Returns:
+        list[str]: Filenames of created frames.
+    """
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    channel_names = ",".join(get_channel_names(channels))
+    filenames = get_sequence_filenames(name, ext, frame_start, frame_end)
+    for frame, filename in zip(
+        range(frame_start, frame_end + 1), filenames
+    ):
+        args = get_oiio_tool_args("oiiotool")
+        parts = 2 if multipart else 1
+        for part in range(parts):
+            args.extend([
+                "--pattern",
+                "noise:type=uniform:min=0:max=1:seed={}".format(
+                    frame * parts + part),
+                "{}x{}".format(width, height),
+                str(channels),
+                "--chnames", channel_names,
+            ])
+        if multipart:
+            args.append("--siappend")
+
+        if data_type:
+            args.extend(["-d", data_type])
+        if compression:
+            args.extend(["--compression", compression])
+        args.extend(["-o", os.path.join(output_dir, filename)])
+        run_subprocess(args, logger=logger)
+    return filenames
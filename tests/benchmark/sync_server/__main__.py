@@ -0,0 +1,347 @@
+"""Throughput benchmark of sync server.
+
+Seeds disposable database with representations waiting for upload to
+mocked remote site, runs 'SyncServerThread' for fixed time and reports
+synchronized files and bytes per second, database commands per loop and
+loop latency. Database is dropped after the benchmark.
+
+Requires running MongoDB.
+
+Example:
+    python -m tests.benchmark.sync_server --representations 500 --files 10
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+import statistics
+import threading
+from collections import Counter
+
+import pymongo
+from pymongo import monitoring
+from bson.objectid import ObjectId
+
+REMOTE_SITE = "benchmark_remote"
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Counts database commands of all clients by command name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = Counter()
+
+    @property
+    def total(self):
+        with self._lock:
+            return sum(self._counts.values())
+
+    def get_counts(self):
+        with self._lock:
+            return dict(self._counts)
+
+    def started(self, event):
+        with self._lock:
+            self._counts[event.command_name] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def seed_project(database, project_name, local_site, representations,
+                 files, file_size):
+    """Create project with files published to local site only.
+
+    Returns:
+        int: Number of created files.
+    """
+    collection = database[project_name]
+    collection.insert_one({
+        "_id": ObjectId(),
+        "type": "project",
+        "name": project_name,
+        "data": {},
+        "config": {}
+    })
+
+    created_dt = datetime.datetime.now()
+    repre_docs = []
+    for repre_idx in range(representations):
+        file_docs = []
+        for file_idx in range(files):
+            file_docs.append({
+                "_id": ObjectId(),
+                "path": "{{root[work]}}/{}/repre_{}/file_{}.bin".format(
+                    project_name, repre_idx, file_idx),
+                "size": file_size,
+                "hash": "file_{}_{}|{}".format(
+                    repre_idx, file_idx, file_size),
+                "sites": [
+                    {"name": local_site, "created_dt": created_dt},
+                    {"name": REMOTE_SITE}
+                ]
+            })
+        repre_docs.append({
+            "_id": ObjectId(),
+            "type": "representation",
+            "parent": ObjectId(),
+            "name": "bin",
+            "context": {"project": {"name": project_name}},
+            "data": {},
+            "files": file_docs
+        })
+        if len(repre_docs) >= 1000:
+            collection.insert_many(repre_docs)
+            repre_docs = []
+
+    if repre_docs:
+        collection.insert_many(repre_docs)
+    return representations * files
+
+
+def count_synced_files(database, project_name):
+    """Files marked in database as synchronized to remote site."""
+    result = list(database[project_name].aggregate([
+        {"$match": {"type": "representation"}},
+        {"$unwind": "$files"},
+        {"$unwind": "$files.sites"},
+        {"$match": {
+            "files.sites.name": REMOTE_SITE,
+            "files.sites.created_dt": {"$exists": True}
+        }},
+        {"$count": "count"}
+    ]))
+    if not result:
+        return 0
+    return result[0]["count"]
+
+
+def run_benchmark(args, command_counter):
+    # imported after environment is prepared
+    from openpype.lib.local_settings import get_local_site_id
+    from openpype.modules.sync_server.providers import lib
+
+    from .providers import MockProvider, BenchmarkLocalDriveHandler
+    from .module import BenchmarkSyncServerModule
+
+    lib.factory.register_provider(
+        MockProvider.CODE,
+        MockProvider,
+        args.batch_limit,
+        args.provider_transfers
+    )
+    lib.factory.register_provider(
+        BenchmarkLocalDriveHandler.CODE,
+        BenchmarkLocalDriveHandler,
+        lib.factory.get_provider_batch_limit(BenchmarkLocalDriveHandler.CODE),
+        lib.factory.get_provider_max_transfers(
+            BenchmarkLocalDriveHandler.CODE)
+    )
+
+    client = pymongo.MongoClient(args.mongo_url)
+    database = client[args.database]
+    project_name = "sync_benchmark"
+    try:
+        file_count = seed_project(
+            database,
+            project_name,
+            get_local_site_id(),
+            args.representations,
+            args.files,
+            args.file_size
+        )
+        print("Seeded {} files in {} representations".format(
+            file_count, args.representations))
+
+        module = BenchmarkSyncServerModule(
+            project_name,
+            REMOTE_SITE,
+            {
+                "mock_latency": args.latency,
+                "mock_speed": args.speed,
+            },
+            {
+                "retry_cnt": 3,
+                "loop_delay": args.loop_delay
+            },
+            command_counter
+        )
+        start_commands = command_counter.get_counts()
+        module.server_init()
+        module.server_start()
+        start_time = time.time()
+        time.sleep(args.duration)
+        elapsed = time.time() - start_time
+        synced_files = module.synced_files
+        synced_bytes = module.synced_bytes
+        module.server_exit()
+        module.sync_server_thread.join()
+
+        end_commands = command_counter.get_counts()
+        commands = {
+            name: count - start_commands.get(name, 0)
+            for name, count in end_commands.items()
+            if count - start_commands.get(name, 0)
+        }
+        return _get_report(
+            args,
+            file_count,
+            elapsed,
+            synced_files,
+            synced_bytes,
+            count_synced_files(database, project_name),
+            module.loop_durations,
+            module.loop_commands,
+            commands
+        )
+
+    finally:
+        if not args.keep:
+            client.drop_database(args.database)
+
+
+def _get_report(args, file_count, elapsed, synced_files, synced_bytes,
+                synced_in_db, loop_durations, loop_commands, commands):
+    loops = len(loop_durations)
+    report = {
+        "representations": args.representations,
+        "files": file_count,
+        "duration": elapsed,
+        "synced_files": synced_files,
+        "synced_files_in_db": synced_in_db,
+        "files_per_sec": synced_files / elapsed,
+        "bytes_per_sec": synced_bytes / elapsed,
+        "loops": loops,
+        "loop_latency_mean": None,
+        "loop_latency_median": None,
+        "loop_latency_max": None,
+        "commands_per_loop": None,
+        "commands": commands,
+    }
+    if loops:
+        report.update({
+            "loop_latency_mean": statistics.mean(loop_durations),
+            "loop_latency_median": statistics.median(loop_durations),
+            "loop_latency_max": max(loop_durations),
+            "commands_per_loop": statistics.mean(loop_commands),
+        })
+    return report
+
+
+def print_report(report):
+    print("Synced files: {} of {} ({} in DB) in {:.1f}s".format(
+        report["synced_files"],
+        report["files"],
+        report["synced_files_in_db"],
+        report["duration"]
+    ))
+    print("Throughput: {:.1f} files/s, {:.2f} MB/s".format(
+        report["files_per_sec"],
+        report["bytes_per_sec"] / (1024 * 1024)
+    ))
+    if report["loops"]:
+        print((
+            "Loops: {}, latency mean {:.3f}s, median {:.3f}s, max {:.3f}s,"
+            " {:.1f} commands per loop"
+        ).format(
+            report["loops"],
+            report["loop_latency_mean"],
+            report["loop_latency_median"],
+            report["loop_latency_max"],
+            report["commands_per_loop"]
+        ))
+    else:
+        print("No loop finished, increase duration")
+    print("Database commands:")
+    for name, count in sorted(report["commands"].items()):
+        print("    {}: {}".format(name, count))
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmark.sync_server",
+        description="Measure throughput of sync server."
+    )
+    parser.add_argument(
+        "--mongo_url",
+        default=os.environ.get("OPENPYPE_MONGO") or
+        "mongodb://localhost:27017",
+        help="Url of MongoDB, 'OPENPYPE_MONGO' by default."
+    )
+    parser.add_argument(
+        "--database", default="sync_server_benchmark",
+        help="Name of disposable database."
+    )
+    parser.add_argument(
+        "--representations", type=int, default=200,
+        help="Number of seeded representations."
+    )
+    parser.add_argument(
+        "--files", type=int, default=10,
+        help="Number of files of each representation."
+    )
+    parser.add_argument(
+        "--file_size", type=int, default=10 * 1024 * 1024,
+        help="Size of each file in bytes."
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60,
+        help="Seconds the server runs."
+    )
+    parser.add_argument(
+        "--loop_delay", type=int, default=1,
+        help="Seconds between loops of the server."
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05,
+        help="Simulated seconds of each transfer."
+    )
+    parser.add_argument(
+        "--speed", type=float, default=0,
+        help="Simulated MB/s of remote site, 0 for unlimited."
+    )
+    parser.add_argument(
+        "--batch_limit", type=int, default=1000,
+        help="Files scheduled by mocked provider in one loop."
+    )
+    parser.add_argument(
+        "--provider_transfers", type=int, default=None,
+        help="Max concurrent transfers of mocked provider."
+    )
+    parser.add_argument(
+        "--output", default=None,
+        help="Path to json file where report is stored."
+    )
+    parser.add_argument(
+        "--keep", action="store_true",
+        help="Keep database after benchmark."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    os.environ["OPENPYPE_MONGO"] = args.mongo_url
+    os.environ["AVALON_DB"] = args.database
+    os.environ.setdefault("OPENPYPE_DATABASE_NAME", "openpype")
+
+    # must be registered before any client is created
+    command_counter = CommandCounter()
+    monitoring.register(command_counter)
+
+    report = run_benchmark(args, command_counter)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as stream:
+            json.dump(report, stream, indent=4)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Sync server module configured by benchmark instead of Settings."""
+import time
+import threading
+
+from openpype.lib.local_settings import get_local_site_id
+from openpype.modules.sync_server.sync_server_module import SyncServerModule
+
+from .providers import MockProvider
+
+
+class BenchmarkSyncServerModule(SyncServerModule):
+    """Sync server of single project uploading to mocked remote site.
+
+    Records duration and number of database commands of each loop and
+    files reported as synchronized.
+
+    Args:
+        project_name (str): Benchmarked project.
+        remote_site (str): Name of mocked remote site.
+        site_presets (dict): Presets of remote site.
+        config (dict): Sync config of project ('retry_cnt', 'loop_delay').
+        command_counter (CommandCounter): Counts database commands.
+    """
+
+    def __init__(self, project_name, remote_site, site_presets, config,
+                 command_counter):
+        self._benchmark_project = project_name
+        self._benchmark_remote_site = remote_site
+        self._benchmark_site_presets = site_presets
+        self._benchmark_config = config
+        self._command_counter = command_counter
+
+        self._stats_lock = threading.Lock()
+        self._loop_start = None
+        self.loop_durations = []
+        self.loop_commands = []
+        self.synced_files = 0
+        self.synced_bytes = 0
+
+        super(BenchmarkSyncServerModule, self).__init__(
+            None, {self.name: {"enabled": True}}
+        )
+
+    @property
+    def sync_system_settings(self):
+        return {
+            "enabled": True,
+            "sites": {
+                self._benchmark_remote_site: {
+                    "provider": MockProvider.CODE,
+                    "alternative_sites": []
+                }
+            }
+        }
+
+    def _prepare_sync_project_settings(self, exclude_locals):
+        config = {
+            "active_site": self.LOCAL_SITE,
+            "remote_site": self._benchmark_remote_site,
+            "always_accessible_on": []
+        }
+        config.update(self._benchmark_config)
+        local_site_config = {"enabled": True, "provider": "local_drive"}
+        return {
+            self._benchmark_project: {
+                "enabled": True,
+                "config": config,
+                "sites": {
+                    get_local_site_id(): local_site_config,
+                    self.LOCAL_SITE: local_site_config,
+                    self._benchmark_remote_site: dict(
+                        self._benchmark_site_presets,
+                        provider=MockProvider.CODE
+                    )
+                }
+            }
+        }
+
+    def get_enabled_projects(self):
+        # first call of each loop
+        self._loop_start = (time.time(), self._command_counter.total)
+        return [self._benchmark_project]
+
+    def get_loop_delay(self, project_name):
+        # called when loop finished
+        if self._loop_start is not None:
+            start_time, start_commands = self._loop_start
+            self._loop_start = None
+            self.loop_durations.append(time.time() - start_time)
+            self.loop_commands.append(
+                self._command_counter.total - start_commands)
+        return super(BenchmarkSyncServerModule, self).get_loop_delay(
+            project_name or self._benchmark_project)
+
+    def update_db(self, project_name, new_file_id, file, representation,
+                  site, error=None, progress=None, priority=None):
+        super(BenchmarkSyncServerModule, self).update_db(
+            project_name, new_file_id, file, representation, site,
+            error=error, progress=progress, priority=priority
+        )
+        if new_file_id and not error:
+            with self._stats_lock:
+                self.synced_files += 1
+                self.synced_bytes += file.get("size") or 0
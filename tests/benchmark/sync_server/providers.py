@@ -0,0 +1,104 @@
+"""Providers used by sync server benchmark.
+
+Benchmark measures synchronization loop of the server (queries, status
+updates, scheduling), not speed of real storages, so remote site is
+simulated and local paths are resolved without Anatomy.
+"""
+import time
+import tempfile
+
+from openpype.modules.sync_server.providers.abstract_provider import (
+    AbstractProvider
+)
+from openpype.modules.sync_server.providers.local_drive import (
+    LocalDriveHandler
+)
+
+
+class MockProvider(AbstractProvider):
+    """Remote site which doesn't store files anywhere.
+
+    Transfer only waits for time given by site presets, 'mock_latency' in
+    seconds per file and 'mock_speed' in MB/s, and reports progress in the
+    middle of the transfer as real providers do.
+    """
+    CODE = "benchmark_mock"
+    LABEL = "Benchmark mock"
+
+    def __init__(self, project_name, site_name, tree=None, presets=None):
+        super(MockProvider, self).__init__(
+            project_name, site_name, tree, presets)
+        presets = presets or {}
+        self.root = presets.get("root") or "/mock"
+        self.latency = float(presets.get("mock_latency") or 0)
+        self.speed = float(presets.get("mock_speed") or 0) * 1024 * 1024
+        self.active = True
+
+    def is_active(self):
+        return True
+
+    @classmethod
+    def get_system_settings_schema(cls):
+        return []
+
+    @classmethod
+    def get_project_settings_schema(cls):
+        return []
+
+    @classmethod
+    def get_local_settings_schema(cls):
+        return []
+
+    def upload_file(self, source_path, path,
+                    server, project_name, file, representation, site,
+                    overwrite=False):
+        return self._transfer(server, project_name, file, representation,
+                              site)
+
+    def download_file(self, source_path, local_path,
+                      server, project_name, file, representation, site,
+                      overwrite=False):
+        return self._transfer(server, project_name, file, representation,
+                              site)
+
+    def delete_file(self, path):
+        pass
+
+    def list_folder(self, folder_path):
+        return []
+
+    def create_folder(self, folder_path):
+        return folder_path
+
+    def get_tree(self):
+        return None
+
+    def get_roots_config(self, anatomy=None):
+        return {"root": {"work": self.root}}
+
+    def _transfer(self, server, project_name, file, representation, site):
+        duration = self.latency
+        if self.speed:
+            duration += (file.get("size") or 0) / self.speed
+
+        time.sleep(duration / 2)
+        server.update_db(project_name=project_name,
+                         new_file_id=None,
+                         file=file,
+                         representation=representation,
+                         site=site,
+                         progress=0.5)
+        time.sleep(duration / 2)
+        return "{}_{}".format(self.CODE, file["_id"])
+
+
+class BenchmarkLocalDriveHandler(LocalDriveHandler):
+    """Local drive with root in temp directory instead of Anatomy.
+
+    Server creates local handler without site presets so root is class
+    attribute.
+    """
+    root = tempfile.gettempdir()
+
+    def get_roots_config(self, anatomy=None):
+        return {"root": {"work": self.root}}
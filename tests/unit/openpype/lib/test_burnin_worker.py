@@ -0,0 +1,74 @@
+"""Test client of long-lived burnin process."""
+import sys
+import textwrap
+
+from openpype.lib import burnin_worker
+
+FAKE_WORKER = textwrap.dedent("""
+    import sys
+    import json
+
+    for line in sys.stdin:
+        job = json.loads(line)
+        data = job["data"]
+        if data.get("crash"):
+            sys.exit(1)
+        result = {
+            "id": job["id"],
+            "success": not data.get("fail"),
+            "error": "Failed" if data.get("fail") else None,
+            "output": data["output"],
+        }
+        sys.stdout.write(json.dumps(result) + "\\n")
+        sys.stdout.flush()
+""")
+
+
+def _get_worker(tmp_path, monkeypatch):
+    script_path = tmp_path / "fake_worker.py"
+    script_path.write_text(FAKE_WORKER)
+    monkeypatch.setattr(
+        burnin_worker,
+        "get_openpype_execute_args",
+        lambda *args: [sys.executable, str(script_path)]
+    )
+    monkeypatch.setattr(burnin_worker, "is_running_from_build", lambda: False)
+    return burnin_worker.BurninWorker()
+
+
+def test_worker_is_reused(tmp_path, monkeypatch):
+    worker = _get_worker(tmp_path, monkeypatch)
+    try:
+        results = worker.process([
+            {"output": "a.mov"},
+            {"output": "b.mov", "fail": True},
+        ])
+        process = worker._process
+        next_results = worker.process([{"output": "c.mov"}])
+    finally:
+        worker.stop()
+
+    assert [result["output"] for result in results] == ["a.mov", "b.mov"]
+    assert [result["success"] for result in results] == [True, False]
+    assert not any(result["worker_failed"] for result in results)
+    assert next_results[0]["success"]
+    assert process.poll() is not None
+
+
+def test_worker_crash_fails_pending_jobs(tmp_path, monkeypatch):
+    worker = _get_worker(tmp_path, monkeypatch)
+    try:
+        results = worker.process([
+            {"output": "a.mov"},
+            {"output": "b.mov", "crash": True},
+            {"output": "c.mov"},
+        ])
+        # new process is started for next jobs
+        next_results = worker.process([{"output": "d.mov"}])
+    finally:
+        worker.stop()
+
+    assert [result["worker_failed"] for result in results] == [
+        False, True, True
+    ]
+    assert next_results[0]["success"]
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Test suite for FileTransaction."""
+import os
+import hashlib
+
+import pytest
+
+from openpype.lib.file_transaction import FileTransaction
+
+
+def _create_sources(root, count, content=b"data"):
+    src_dir = root / "src"
+    src_dir.mkdir()
+    paths = []
+    for idx in range(count):
+        path = src_dir / "frame.{:04d}.exr".format(idx)
+        path.write_bytes(content + str(idx).encode())
+        paths.append(str(path))
+    return paths
+
+
+def test_parallel_transfer_with_checksums(tmp_path):
+    src_paths = _create_sources(tmp_path, 20)
+    dst_dir = tmp_path / "dst" / "v001"
+    transaction = FileTransaction(max_workers=4, checksum_algorithm="md5")
+    expected_dsts = []
+    for src_path in src_paths:
+        dst = str(dst_dir / os.path.basename(src_path))
+        transaction.add(src_path, dst)
+        expected_dsts.append(os.path.normpath(dst))
+
+    transaction.process()
+    transaction.finalize()
+
+    assert transaction.transferred == expected_dsts
+    checksums = transaction.checksums
+    for src_path, dst in zip(src_paths, expected_dsts):
+        with open(src_path, "rb") as stream:
+            content = stream.read()
+        with open(dst, "rb") as stream:
+            assert stream.read() == content
+        assert checksums[dst] == hashlib.md5(content).hexdigest()
+
+
+def test_parallel_transfer_failure_rollback(tmp_path):
+    src_paths = _create_sources(tmp_path, 10)
+    dst_dir = tmp_path / "dst"
+    dst_dir.mkdir()
+    # Existing file which should be restored on rollback
+    existing = dst_dir / os.path.basename(src_paths[0])
+    existing.write_bytes(b"original")
+
+    transaction = FileTransaction(max_workers=4)
+    for src_path in src_paths:
+        transaction.add(src_path, str(dst_dir / os.path.basename(src_path)))
+    transaction.add(
+        str(tmp_path / "src" / "missing.exr"), str(dst_dir / "missing.exr")
+    )
+
+    with pytest.raises(IOError):
+        transaction.process()
+    transaction.rollback()
+
+    assert sorted(os.listdir(str(dst_dir))) == [existing.name]
+    assert existing.read_bytes() == b"original"
+
+
+def test_clone_transfer_methods(tmp_path):
+    src_paths = _create_sources(tmp_path, 3, content=b"x" * 100000)
+    dst_dir = tmp_path / "dst"
+    transaction = FileTransaction()
+    for src_path in src_paths:
+        transaction.add(
+            src_path,
+            str(dst_dir / os.path.basename(src_path)),
+            mode=FileTransaction.MODE_CLONE
+        )
+    transaction.process()
+
+    methods = transaction.transfer_methods
+    assert len(methods) == len(src_paths)
+    for src_path in src_paths:
+        dst = os.path.normpath(str(dst_dir / os.path.basename(src_path)))
+        assert methods[dst] in (
+            "reflink", "copy_file_range", "sendfile", "copy"
+        )
+        with open(src_path, "rb") as src_stream:
+            with open(dst, "rb") as dst_stream:
+                assert src_stream.read() == dst_stream.read()
+
+
+def test_clone_uses_platform_copy(tmp_path, monkeypatch):
+    from openpype.lib import file_transaction
+
+    copied = []
+
+    def copyfile(src, dst):
+        copied.append(src)
+        with open(src, "rb") as src_stream:
+            with open(dst, "wb") as dst_stream:
+                dst_stream.write(src_stream.read())
+
+    monkeypatch.setattr(file_transaction, "CLONE_SUPPORTED", False)
+    monkeypatch.setattr(file_transaction, "copyfile", copyfile)
+    monkeypatch.setattr(
+        file_transaction, "clone_file",
+        lambda *args: pytest.fail("'clone_file' should not be used")
+    )
+
+    src_paths = _create_sources(tmp_path, 2)
+    dst_dir = tmp_path / "dst"
+    transaction = FileTransaction()
+    for src_path in src_paths:
+        transaction.add(
+            src_path,
+            str(dst_dir / os.path.basename(src_path)),
+            mode=FileTransaction.MODE_CLONE
+        )
+    transaction.process()
+
+    assert copied == src_paths
+    assert set(transaction.transfer_methods.values()) == {"copy"}
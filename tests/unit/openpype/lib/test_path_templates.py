@@ -0,0 +1,51 @@
+"""Test formatting of string templates."""
+import pytest
+
+from openpype.lib.path_templates import (
+    StringTemplate,
+    TemplateUnsolved,
+)
+
+TEMPLATE = (
+    "{root[work]}/{project[name]}/{asset}<_{output}>"
+    "/{subset}_v{version:0>3}.{frame:0>4}.{ext}"
+)
+
+
+def test_parts_are_shared_by_templates():
+    first = StringTemplate(TEMPLATE)
+    second = StringTemplate(TEMPLATE)
+    assert first._parts is second._parts
+    assert str(first) == TEMPLATE
+
+
+def test_format_batch_matches_format():
+    template = StringTemplate(TEMPLATE)
+    data = {
+        "root": {"work": "/mnt/work"},
+        "project": {"name": "demo"},
+        "asset": "sh010",
+        "subset": "renderMain",
+        "version": 3,
+        "ext": "exr",
+    }
+    items = [{"frame": frame} for frame in range(1001, 1004)]
+
+    results = template.format_batch(data, items)
+
+    assert results == [
+        "/mnt/work/demo/sh010/renderMain_v003.{}.exr".format(frame)
+        for frame in range(1001, 1004)
+    ]
+    for item, result in zip(items, results):
+        expected = template.format(dict(data, **item))
+        assert result.used_values == expected.used_values
+        assert result.solved
+    # Shared data are not changed
+    assert "frame" not in data
+
+
+def test_format_strict_batch_raises_unsolved():
+    template = StringTemplate("{asset}.{frame:0>4}.{ext}")
+    with pytest.raises(TemplateUnsolved):
+        template.format_strict_batch({"asset": "sh010"}, [{"frame": 1}])
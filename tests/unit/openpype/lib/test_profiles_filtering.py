@@ -0,0 +1,83 @@
+"""Test filtering of profiles."""
+from openpype.lib import profiles_filtering
+from openpype.lib.profiles_filtering import (
+    ProfileMatcher,
+    filter_profiles,
+    get_profile_matcher,
+)
+
+PROFILES = [
+    {"hosts": [], "families": ["render"], "tasks": [], "name": "render"},
+    {"hosts": ["maya"], "families": ["ren.*"], "tasks": [], "name": "maya"},
+    {"hosts": ["nuke"], "families": ["*"], "tasks": [], "name": "nuke"},
+    {
+        "hosts": ["maya", "nuke"],
+        "families": ["render"],
+        "tasks": ["comp"],
+        "name": "comp"
+    },
+    {"hosts": [""], "families": [], "tasks": [], "name": "invalid"},
+]
+
+
+def _match_name(matcher, key_values, keys_order=None):
+    profile = matcher.match(key_values, keys_order)
+    if profile is None:
+        return None
+    return profile["name"]
+
+
+def test_profile_matcher():
+    matcher = ProfileMatcher(PROFILES)
+
+    # exact and regex match have the same score
+    key_values = {"hosts": "maya", "families": "render", "tasks": "anim"}
+    assert _match_name(matcher, key_values) == "maya"
+    key_values = {"hosts": "maya", "families": "rendering", "tasks": "anim"}
+    assert _match_name(matcher, key_values) == "maya"
+    key_values = {"hosts": "maya", "families": "render", "tasks": "comp"}
+    assert _match_name(matcher, key_values) == "comp"
+
+    # order of keys decides which profile is used for the same score
+    key_values = {"hosts": "nuke", "families": "render", "tasks": "anim"}
+    assert _match_name(matcher, key_values) == "nuke"
+    assert _match_name(
+        matcher, key_values, ["families", "hosts"]
+    ) == "render"
+
+    # value which is not set matches only profiles without filter
+    key_values = {"hosts": None, "families": "render", "tasks": None}
+    assert _match_name(matcher, key_values) == "render"
+    key_values = {"hosts": "houdini", "families": "model", "tasks": None}
+    assert _match_name(matcher, key_values) is None
+
+
+def test_filter_profiles_matches_matcher():
+    matcher = ProfileMatcher(PROFILES)
+    for host_name in ("maya", "nuke", "houdini", None):
+        for family in ("render", "rendering", "model", ""):
+            for task_name in ("comp", "anim", None):
+                key_values = {
+                    "hosts": host_name,
+                    "families": family,
+                    "tasks": task_name
+                }
+                assert (
+                    filter_profiles(PROFILES, key_values)
+                    is matcher.match(key_values)
+                )
+
+
+def test_matcher_results_are_cached(monkeypatch):
+    matcher = get_profile_matcher(PROFILES)
+    assert get_profile_matcher(PROFILES) is matcher
+    assert get_profile_matcher(list(PROFILES)) is not matcher
+
+    key_values = {"hosts": "maya", "families": "render", "tasks": "comp"}
+    profile = matcher.match(key_values)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("Result should be cached")
+
+    monkeypatch.setattr(profiles_filtering, "_profile_exclusion", _fail)
+    assert matcher.match(key_values) is profile
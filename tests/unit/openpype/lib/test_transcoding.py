@@ -0,0 +1,219 @@
+"""Test conversion of input paths for ffmpeg."""
+import os
+import sys
+import time
+
+import pytest
+
+from openpype.lib import transcoding
+
+
+def test_conversion_jobs_use_frame_ranges():
+    input_paths = [
+        "/in/beauty.{}.exr".format(frame)
+        for frame in list(range(1001, 1011)) + [1020, 1021]
+    ]
+    input_paths.append("/in/single.exr")
+
+    jobs = transcoding._get_conversion_jobs(input_paths, "/out", 2)
+
+    assert jobs == [
+        ("/in/single.exr", "/out/single.exr", None),
+        ("/in/beauty.%04d.exr", "/out/beauty.%04d.exr", "1001-1006"),
+        ("/in/beauty.%04d.exr", "/out/beauty.%04d.exr", "1007-1010"),
+        ("/in/beauty.%04d.exr", "/out/beauty.%04d.exr", "1020-1021"),
+    ]
+
+
+def test_conversion_failure_removes_output(tmp_path, monkeypatch):
+    input_paths = [
+        str(tmp_path / "in" / "beauty.{}.exr".format(frame))
+        for frame in range(1001, 1009)
+    ]
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+
+    monkeypatch.setattr(
+        transcoding, "get_oiio_info_for_input",
+        lambda *args, **kwargs: {
+            "attribs": {"compression": "dwaa"},
+            "channelnames": ["R", "G", "B"],
+            "subimages": 1,
+        }
+    )
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args", lambda *args: list(args))
+
+    def run_subprocess(oiio_cmd, logger=None):
+        frames = oiio_cmd[oiio_cmd.index("--frames") + 1]
+        output_path = oiio_cmd[-1]
+        start, end = frames.split("-")
+        for frame in range(int(start), int(end) + 1):
+            (output_dir / os.path.basename(output_path % frame)).touch()
+        if frames == "1007-1008":
+            raise RuntimeError("Conversion failed")
+
+    monkeypatch.setattr(transcoding, "run_subprocess", run_subprocess)
+
+    with pytest.raises(RuntimeError):
+        transcoding.convert_input_paths_for_ffmpeg(
+            input_paths, str(output_dir), max_workers=4)
+
+    assert not list(output_dir.iterdir())
+
+
+def test_media_info_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        transcoding.tempfile, "gettempdir", lambda: str(tmp_path / "tmp"))
+    filepath = tmp_path / "beauty.1001.exr"
+    filepath.write_bytes(b"data")
+    other_filepath = tmp_path / "beauty.1002.exr"
+    other_filepath.write_bytes(b"data")
+
+    cache = transcoding.MediaInfoCache(max_items=1)
+    assert cache.get("oiio_info", str(filepath)) is None
+    cache.set("oiio_info", str(filepath), "<xml/>")
+    assert cache.get("oiio_info", str(filepath)) == "<xml/>"
+    assert cache.get("ffprobe", str(filepath)) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # changed file is read again
+    filepath.write_bytes(b"changed data")
+    assert cache.get("oiio_info", str(filepath)) is None
+    cache.set("oiio_info", str(filepath), "<changed/>")
+
+    # persisted between instances, oldest item is removed
+    cache.save(str(tmp_path))
+    cache.set("oiio_info", str(other_filepath), "<other/>")
+    assert cache.get("oiio_info", str(filepath)) is None
+
+    loaded_cache = transcoding.MediaInfoCache()
+    loaded_cache.load(str(tmp_path))
+    assert loaded_cache.get("oiio_info", str(filepath)) == "<changed/>"
+
+
+def test_media_info_cache_files_pruned(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        transcoding.tempfile, "gettempdir", lambda: str(tmp_path / "tmp"))
+    monkeypatch.setattr(transcoding.MediaInfoCache, "max_cache_files", 2)
+    cache = transcoding.MediaInfoCache()
+    now = time.time()
+    staging_dirs = []
+    for idx in range(3):
+        staging_dir = tmp_path / "staging_{}".format(idx)
+        staging_dir.mkdir()
+        filepath = staging_dir / "beauty.1001.exr"
+        filepath.write_bytes(b"data")
+        cache.set("oiio_info", str(filepath), "<xml/>")
+        cache.save(str(staging_dir))
+        # make order of cache files explicit
+        cache_filepath = cache._get_cache_filepath(str(staging_dir))
+        os.utime(cache_filepath, (now - 30 + idx, now - 30 + idx))
+        staging_dirs.append(staging_dir)
+
+    # only most recent files are kept
+    cache_dir = tmp_path / "tmp" / "openpype_media_info"
+    assert {path.name for path in cache_dir.iterdir()} == {
+        os.path.basename(cache._get_cache_filepath(str(staging_dir)))
+        for staging_dir in staging_dirs[1:]
+    }
+
+    # outdated files are removed
+    monkeypatch.setattr(
+        transcoding.MediaInfoCache, "cache_file_lifetime", 10)
+    cache._prune_cache_files()
+    assert not list(cache_dir.iterdir())
+
+
+def test_convert_colorspace_batch_single_decode(monkeypatch):
+    commands = []
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args", lambda *args: list(args))
+    monkeypatch.setattr(
+        transcoding, "run_subprocess",
+        lambda oiio_cmd, logger=None: commands.append(oiio_cmd))
+
+    transcoding.convert_colorspace_batch(
+        "/in/beauty.1001-1010#.exr",
+        [
+            {
+                "output_path": "/out/dpx/beauty.1001-1010#.dpx",
+                "target_colorspace": "Output - Rec.709",
+                "additional_command_args": ["-d", "uint10"],
+            },
+            {
+                "output_path": "/out/png/beauty.1001-1010#.png",
+                "target_colorspace": "Output - sRGB",
+            },
+            {
+                "output_path": "/out/tif/beauty.1001-1010#.tif",
+                "target_colorspace": "Output - sRGB",
+                "additional_command_args": ["-d", "uint16"],
+            },
+        ],
+        "/config.ocio",
+        "ACES - ACEScg",
+        input_info={"channelnames": ["R", "G", "B"], "subimages": 1},
+    )
+
+    # output arguments are kept for following outputs, so only one output
+    #   with additional arguments can be in single command
+    assert len(commands) == 2
+    first_cmd = commands[0]
+    assert first_cmd.count("/in/beauty.1001-1010#.exr") == 1
+    assert first_cmd.count("--dup") == 1
+    assert first_cmd[-7:] == [
+        "-d", "uint10",
+        "--colorconvert", "ACES - ACEScg", "Output - Rec.709",
+        "-o", "/out/dpx/beauty.1001-1010#.dpx"
+    ]
+    assert commands[1][-1] == "/out/tif/beauty.1001-1010#.tif"
+
+
+def test_stream_converted_frames_to_ffmpeg(tmp_path, monkeypatch):
+    input_paths = [
+        str(tmp_path / "beauty.{}.exr".format(frame))
+        for frame in (1001, 1002, 1002, 1003)
+    ]
+    temp_dir = tmp_path / "temp"
+    temp_dir.mkdir()
+    monkeypatch.setattr(
+        transcoding, "get_transcode_temp_directory", lambda: str(temp_dir))
+    monkeypatch.setattr(
+        transcoding, "get_oiio_info_for_input",
+        lambda *args, **kwargs: {
+            "attribs": {},
+            "channelnames": ["R", "G", "B"],
+            "subimages": 1,
+        }
+    )
+    monkeypatch.setattr(
+        transcoding, "get_oiio_tool_args", lambda *args: list(args))
+
+    def run_subprocess(oiio_cmd, logger=None):
+        input_path = oiio_cmd[oiio_cmd.index("--ch") - 1]
+        with open(oiio_cmd[-1], "w") as stream:
+            stream.write(os.path.basename(input_path) + "\n")
+
+    monkeypatch.setattr(transcoding, "run_subprocess", run_subprocess)
+
+    output_path = tmp_path / "output.txt"
+    ffmpeg_args = [
+        sys.executable, "-c",
+        (
+            "import sys;"
+            "open(sys.argv[1], 'wb').write(sys.stdin.buffer.read())"
+        ),
+        str(output_path)
+    ]
+    transcoding.stream_converted_frames_to_ffmpeg(
+        ffmpeg_args, input_paths, buffer_size=2)
+
+    # frames are streamed in order and removed after they were written
+    assert output_path.read_text().split() == [
+        "beauty.1001.exr",
+        "beauty.1002.exr",
+        "beauty.1002.exr",
+        "beauty.1003.exr",
+    ]
+    assert not temp_dir.exists()
@@ -0,0 +1,94 @@
+"""Test for index of synchronized file contents."""
+import os
+
+from openpype.modules.sync_server.hash_index import ContentHashIndex
+
+
+def _get_stat(path):
+    if not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def test_hash_index_persistence(tmp_path):
+    file_path = tmp_path / "texture.tx"
+    file_path.write_bytes(b"content")
+    remote_path = tmp_path / "remote.tx"
+    remote_path.write_bytes(b"content")
+
+    index = ContentHashIndex(str(tmp_path / "index"))
+    content_hash = index.get_content_hash(str(file_path))
+    index.add_path("gdrive", content_hash, str(remote_path),
+                   _get_stat(str(remote_path)))
+    index.save()
+
+    index = ContentHashIndex(str(tmp_path / "index"))
+    assert index.get_content_hash(str(file_path)) == content_hash
+    assert index.get_path("gdrive", content_hash, _get_stat) == (
+        str(remote_path)
+    )
+    assert index.get_path("studio", content_hash, _get_stat) is None
+
+    # content hash is calculated again for changed file
+    file_path.write_bytes(b"changed content")
+    assert index.get_content_hash(str(file_path)) != content_hash
+
+
+def test_changed_file_on_site_not_used(tmp_path):
+    remote_path = tmp_path / "remote.tx"
+    remote_path.write_bytes(b"content")
+    index = ContentHashIndex(str(tmp_path / "index"))
+    index.add_path("studio", "hash", str(remote_path),
+                   _get_stat(str(remote_path)))
+
+    remote_path.write_bytes(b"other content")
+    assert index.get_path("studio", "hash", _get_stat) is None
+    # entry was dropped
+    remote_path.write_bytes(b"content")
+    assert index.get_path("studio", "hash", _get_stat) is None
+
+
+def test_overwritten_path_removed(tmp_path):
+    remote_path = tmp_path / "remote.tx"
+    remote_path.write_bytes(b"content")
+    index = ContentHashIndex(str(tmp_path / "index"))
+    index.add_path("studio", "hash", str(remote_path),
+                   _get_stat(str(remote_path)))
+
+    remote_path.write_bytes(b"other content")
+    index.add_path("studio", "other_hash", str(remote_path),
+                   _get_stat(str(remote_path)))
+    assert index.get_path("studio", "hash", _get_stat) is None
+    assert index.get_path("studio", "other_hash", _get_stat) == (
+        str(remote_path)
+    )
+
+    index.remove_file("studio", str(remote_path))
+    assert index.get_path("studio", "other_hash", _get_stat) is None
+
+
+def test_content_hashes_limited(tmp_path, monkeypatch):
+    monkeypatch.setattr(ContentHashIndex, "max_content_hashes", 2)
+    index = ContentHashIndex(str(tmp_path / "index"))
+    paths = []
+    for idx in range(3):
+        file_path = tmp_path / "file_{}.tx".format(idx)
+        file_path.write_bytes(b"content")
+        paths.append(str(file_path))
+
+    index.get_content_hash(paths[0])
+    index.get_content_hash(paths[1])
+    # mark first file as recently used
+    index.get_content_hash(paths[0])
+    index.get_content_hash(paths[2])
+    # changed file replaces its previous entry
+    with open(paths[2], "wb") as stream:
+        stream.write(b"changed content")
+    index.get_content_hash(paths[2])
+    index.save()
+
+    index = ContentHashIndex(str(tmp_path / "index"))
+    assert list(index._get_content_hashes().keys()) == [
+        os.path.normpath(paths[0]), os.path.normpath(paths[2])
+    ]
@@ -0,0 +1,67 @@
+"""Test for copy of files by local drive provider."""
+import os
+
+from openpype.modules.sync_server.providers.local_drive import (
+    LocalDriveHandler
+)
+
+
+class BandwidthRecorder:
+    def __init__(self):
+        self.consumed = []
+
+    def consume(self, amount):
+        self.consumed.append(amount)
+
+
+def _get_handler(monkeypatch):
+    monkeypatch.setattr(LocalDriveHandler, "CHUNK_SIZE", 4)
+    return LocalDriveHandler("project", "studio")
+
+
+def test_copy_throttled_by_chunks(tmp_path, monkeypatch):
+    handler = _get_handler(monkeypatch)
+    handler.bandwidth_limiter = BandwidthRecorder()
+    source_path = tmp_path / "source.txt"
+    source_path.write_bytes(b"0123456789")
+    target_path = tmp_path / "target.txt"
+
+    handler._copy(str(source_path), str(target_path))
+
+    assert target_path.read_bytes() == b"0123456789"
+    assert handler.bandwidth_limiter.consumed == [4, 4, 2]
+
+
+def test_copy_resumes_partial_file(tmp_path, monkeypatch):
+    handler = _get_handler(monkeypatch)
+    source_path = tmp_path / "source.txt"
+    source_path.write_bytes(b"0123456789")
+    target_path = tmp_path / "target.txt"
+    partial_path = tmp_path / ("target.txt" + handler.PARTIAL_SUFFIX)
+    # interrupted copy, marker shows that copied part is not rewritten
+    partial_path.write_bytes(b"ABCD")
+
+    progress = []
+    handler._copy(str(source_path), str(target_path), progress.append)
+
+    assert target_path.read_bytes() == b"ABCD456789"
+    assert progress == [8, 10]
+    assert not partial_path.exists()
+
+
+def test_copy_restarts_outdated_partial_file(tmp_path, monkeypatch):
+    handler = _get_handler(monkeypatch)
+    source_path = tmp_path / "source.txt"
+    source_path.write_bytes(b"0123456789")
+    target_path = tmp_path / "target.txt"
+    target_path.write_bytes(b"old content")
+    partial_path = tmp_path / ("target.txt" + handler.PARTIAL_SUFFIX)
+    partial_path.write_bytes(b"ABCD")
+    # source was changed after copy was interrupted
+    source_mtime = source_path.stat().st_mtime
+    os.utime(str(partial_path), (source_mtime - 10, source_mtime - 10))
+
+    handler._copy(str(source_path), str(target_path))
+
+    assert target_path.read_bytes() == b"0123456789"
+    assert not partial_path.exists()
@@ -0,0 +1,30 @@
+"""Providers must stay importable by Python 2 hosts."""
+import ast
+import glob
+import os
+
+import pytest
+
+import openpype.modules.sync_server.providers as providers
+
+
+PROVIDER_FILES = sorted(
+    glob.glob(os.path.join(os.path.dirname(providers.__file__), "*.py"))
+)
+
+
+@pytest.mark.parametrize("filepath", PROVIDER_FILES,
+                         ids=[os.path.basename(p) for p in PROVIDER_FILES])
+def test_provider_does_not_use_nonlocal(filepath):
+    with open(filepath, "r") as stream:
+        tree = ast.parse(stream.read(), filepath)
+
+    nonlocal_lines = [
+        node.lineno
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Nonlocal)
+    ]
+    assert not nonlocal_lines, (
+        "'nonlocal' is not Python 2 compatible, used on lines {}".format(
+            nonlocal_lines)
+    )
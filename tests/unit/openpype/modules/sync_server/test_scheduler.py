@@ -0,0 +1,99 @@
+"""Test for priority transfer scheduler of sync server."""
+import asyncio
+
+from openpype.modules.sync_server.scheduler import (
+    TransferScheduler,
+    SiteCircuitBreaker,
+    get_retry_delay
+)
+
+
+def test_priority_and_site_limit():
+    started = []
+    results = {}
+
+    async def transfer(name):
+        started.append(name)
+        await asyncio.sleep(0.01)
+        return name
+
+    async def main():
+        scheduler = TransferScheduler(max_transfers=2)
+        scheduler.set_site_limit("slow", 1)
+        runner = asyncio.ensure_future(scheduler.run())
+        for name, priority, site in (
+            ("low", 10, "fast"),
+            ("slow_1", 50, "slow"),
+            ("slow_2", 50, "slow"),
+            ("high", 90, "fast"),
+        ):
+            scheduler.submit(
+                name, priority, site, "provider",
+                lambda name=name: transfer(name),
+                lambda result, name=name: results.update({name: result})
+            )
+        # same key is not scheduled twice
+        assert not scheduler.submit(
+            "high", 90, "fast", "provider", None, None)
+
+        while scheduler.has_pending():
+            await asyncio.sleep(0.005)
+        runner.cancel()
+        return scheduler.release_finished()
+
+    released = asyncio.run(main())
+
+    assert started[:2] == ["high", "slow_1"]
+    assert started.index("slow_2") > started.index("slow_1")
+    assert results == {name: name for name in started}
+    assert released == set(started)
+
+
+def test_resubmit_after_failure():
+    attempts = []
+    results = []
+
+    async def transfer():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("lost")
+        return "done"
+
+    async def main():
+        scheduler = TransferScheduler(max_transfers=1)
+        runner = asyncio.ensure_future(scheduler.run())
+
+        def on_done(result):
+            results.append(result)
+            if isinstance(result, Exception):
+                assert scheduler.resubmit("file", 0.01)
+
+        scheduler.submit("file", 50, "site", "provider", transfer, on_done)
+        while scheduler.has_pending():
+            await asyncio.sleep(0.005)
+        runner.cancel()
+        return scheduler.release_finished()
+
+    released = asyncio.run(main())
+
+    assert len(attempts) == 3
+    assert results[-1] == "done"
+    assert released == {"file"}
+
+
+def test_circuit_breaker():
+    breaker = SiteCircuitBreaker(failure_threshold=2, base_cooldown=60)
+    breaker.record_failure("site")
+    assert breaker.allows("site")
+    breaker.record_failure("site")
+    assert not breaker.allows("site")
+    assert breaker.allows("other_site")
+    breaker.record_success("site")
+    assert breaker.allows("site")
+
+
+def test_retry_delay():
+    for tries in range(1, 10):
+        delay = get_retry_delay(tries, 5, 300)
+        expected = min(300, 5 * 2 ** (tries - 1))
+        assert expected / 2 <= delay <= expected
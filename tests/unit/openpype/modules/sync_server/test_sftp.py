@@ -0,0 +1,126 @@
+"""Test for connection pools of SFTP provider."""
+import types
+
+import paramiko
+import pytest
+
+from openpype.modules.sync_server.providers import sftp
+from openpype.modules.sync_server.providers.sftp import SFTPHandler
+
+
+class FakeConnection:
+    """Connection of fake 'pysftp' recording calls."""
+
+    instances = []
+    auth_error = False
+
+    def __init__(self, **kwargs):
+        if FakeConnection.auth_error:
+            raise paramiko.ssh_exception.AuthenticationException()
+        self.kwargs = kwargs
+        self.calls = []
+        self.closed = False
+        self.fail = False
+        self.sftp_client = self
+        FakeConnection.instances.append(self)
+
+    def get_channel(self):
+        return self
+
+    def get_transport(self):
+        return self
+
+    def is_active(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+    def makedirs(self, path):
+        self.calls.append(("makedirs", path))
+
+    def isfile(self, path):
+        if self.fail:
+            raise IOError("No such file")
+        return True
+
+    def remove(self, path):
+        self.calls.append(("remove", path))
+
+
+@pytest.fixture
+def fake_pysftp(monkeypatch):
+    monkeypatch.setattr(FakeConnection, "instances", [])
+    monkeypatch.setattr(FakeConnection, "auth_error", False)
+    monkeypatch.setattr(sftp, "_pools", {})
+    monkeypatch.setattr(sftp, "pysftp", types.SimpleNamespace(
+        Connection=FakeConnection,
+        CnOpts=types.SimpleNamespace,
+        exceptions=types.SimpleNamespace(ConnectionException=IOError)
+    ))
+    return FakeConnection
+
+
+def _get_handler(**kwargs):
+    presets = {
+        "enabled": True,
+        "sftp_host": "host",
+        "sftp_port": 22,
+        "sftp_user": "user",
+        "sftp_pass": "pass",
+        "sftp_key": None,
+        "sftp_key_pass": None,
+    }
+    presets.update(kwargs)
+    return SFTPHandler("project", "sftp", presets=presets)
+
+
+def test_pool_shared_by_credentials(fake_pysftp):
+    pool = _get_handler().pool
+    assert _get_handler().pool is pool
+    assert _get_handler(sftp_pass="other").pool is not pool
+    assert _get_handler(sftp_key_pass="secret").pool is not pool
+
+    handler = _get_handler()
+    with handler.pool.connection() as conn:
+        pass
+    with handler.pool.connection() as other_conn:
+        assert other_conn is conn
+    assert len(fake_pysftp.instances) == 1
+
+
+def test_pool_removed_on_auth_error(fake_pysftp):
+    handler = _get_handler()
+    pool = handler.pool
+    with pool.connection() as conn:
+        pass
+
+    fake_pysftp.auth_error = True
+    conn.closed = True
+    with pytest.raises(ConnectionError):
+        with pool.connection():
+            pass
+    assert not sftp._pools
+
+    fake_pysftp.auth_error = False
+    assert _get_handler().pool is not pool
+
+
+def test_known_folders_invalidated(fake_pysftp):
+    handler = _get_handler()
+    handler.create_folder("/root/project/asset")
+    handler.create_folder("/root/project/asset")
+    conn = fake_pysftp.instances[0]
+    assert conn.calls == [("makedirs", "/root/project/asset")]
+    assert handler.folder_path_exists("/root/project")
+
+    # folder might be removed with its last file
+    handler.delete_file("/root/project/asset/file.txt")
+    assert not handler.pool.is_folder_known("/root/project/asset")
+    assert handler.pool.is_folder_known("/root/project")
+
+    # failed operation clears all known folders
+    conn.fail = True
+    with pytest.raises(IOError):
+        handler.file_path_exists("/root/project/asset/file.txt")
+    assert not handler.pool.is_folder_known("/root/project")
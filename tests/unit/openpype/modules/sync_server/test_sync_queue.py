@@ -0,0 +1,48 @@
+"""Test for queue of changed representations used by sync loop."""
+import datetime
+
+from bson.objectid import ObjectId
+
+from openpype.modules.sync_server.sync_queue import SyncQueue
+
+
+def test_full_reconcile_first_and_on_request():
+    sync_queue = SyncQueue(600)
+    assert sync_queue.needs_full_reconcile("project")
+
+    sync_queue.mark_full_reconciled("project")
+    assert not sync_queue.needs_full_reconcile("project")
+
+    sync_queue.request_full_reconcile("other")
+    assert not sync_queue.needs_full_reconcile("project")
+
+    sync_queue.request_full_reconcile()
+    assert sync_queue.needs_full_reconcile("project")
+
+
+def test_pending_representations():
+    sync_queue = SyncQueue(600)
+    repre_id = ObjectId()
+    sync_queue.add("project", [str(repre_id), repre_id])
+
+    assert sync_queue.pop("project") == {repre_id}
+    assert sync_queue.pop("project") == set()
+
+    sync_queue.add("project", [repre_id])
+    sync_queue.mark_full_reconciled("project")
+    assert sync_queue.pop("project") == set()
+
+
+def test_polled_representations():
+    sync_queue = SyncQueue(600, lookback=60)
+    now = datetime.datetime.utcnow()
+    old_id = ObjectId.from_datetime(now - datetime.timedelta(seconds=30))
+    new_id = ObjectId()
+    assert sync_queue.get_lookback_start_id() < old_id
+
+    # representation inserted later with older id is not missed
+    assert sync_queue.add_polled("project", [new_id]) == {new_id}
+    assert sync_queue.add_polled("project", [old_id, new_id]) == {old_id}
+    assert sync_queue.pop("project") == {old_id, new_id}
+    assert sync_queue.add_polled("project", [old_id, new_id]) == set()
+    assert sync_queue.pop("project") == set()
@@ -0,0 +1,78 @@
+"""Test for coalescing of sync status updates."""
+import pytest
+from bson.objectid import ObjectId
+from pymongo import UpdateOne
+
+from openpype.modules.sync_server.update_buffer import SyncUpdateBuffer
+
+
+class CollectionRecorder:
+    def __init__(self):
+        self.calls = []
+
+    def bulk_write(self, operations, ordered=True):
+        self.calls.append(list(operations))
+
+
+def _operation(value):
+    return UpdateOne({"_id": value}, {"$set": {"value": value}})
+
+
+def test_progress_superseded():
+    collection = CollectionRecorder()
+    buffer = SyncUpdateBuffer(lambda _: collection, max_size=10, max_age=60)
+    repre_id = ObjectId()
+    file_id = ObjectId()
+
+    for progress in (0.1, 0.5, 0.9):
+        buffer.add("project", repre_id, file_id, "studio",
+                   SyncUpdateBuffer.PROGRESS, _operation(progress))
+    buffer.flush()
+    assert collection.calls == [[_operation(0.9)]]
+
+    buffer.add("project", repre_id, file_id, "studio",
+               SyncUpdateBuffer.PROGRESS, _operation(0.2))
+    buffer.add("project", repre_id, file_id, "studio",
+               SyncUpdateBuffer.STATUS, _operation("done"))
+    buffer.flush()
+    assert collection.calls[-1] == [_operation("done")]
+
+
+def test_flush_on_size():
+    collection = CollectionRecorder()
+    buffer = SyncUpdateBuffer(lambda _: collection, max_size=3, max_age=60)
+    repre_id = ObjectId()
+    for idx in range(3):
+        buffer.add("project", repre_id, ObjectId(), "studio",
+                   SyncUpdateBuffer.STATUS, _operation(idx))
+
+    assert len(collection.calls) == 1
+    assert len(collection.calls[0]) == 3
+    buffer.flush()
+    assert len(collection.calls) == 1
+
+
+def test_failed_flush_requeued():
+    collection = CollectionRecorder()
+    buffer = SyncUpdateBuffer(lambda _: collection, max_size=10, max_age=60)
+    repre_id = ObjectId()
+    file_id = ObjectId()
+    other_file_id = ObjectId()
+    buffer.add("project", repre_id, file_id, "studio",
+               SyncUpdateBuffer.PROGRESS, _operation(0.5))
+    buffer.add("project", repre_id, other_file_id, "studio",
+               SyncUpdateBuffer.STATUS, _operation("failed"))
+
+    def _bulk_write(operations, ordered=True):
+        # updates added during write replace failed ones
+        buffer.add("project", repre_id, file_id, "studio",
+                   SyncUpdateBuffer.STATUS, _operation("done"))
+        raise RuntimeError("Connection lost")
+
+    collection.bulk_write = _bulk_write
+    with pytest.raises(RuntimeError):
+        buffer.flush()
+
+    del collection.bulk_write
+    buffer.flush()
+    assert collection.calls == [[_operation("failed"), _operation("done")]]
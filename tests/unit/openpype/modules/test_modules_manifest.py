@@ -0,0 +1,114 @@
+"""Test lazy loading of modules using manifest."""
+import sys
+import types
+
+import pytest
+
+from openpype.modules import base
+from openpype.modules.base import OpenPypeAddOn
+
+
+def _get_manifest():
+    def _entry(class_name, name, host_name=None, settings_key=None):
+        return {
+            "import_str": "",
+            "addons": [{
+                "class_name": class_name,
+                "name": name,
+                "host_name": host_name,
+                "settings_key": settings_key,
+            }]
+        }
+
+    return {
+        "modules": {
+            "ftrack": _entry("FtrackModule", "ftrack", settings_key="ftrack"),
+            "webserver": _entry("WebServerModule", "webserver"),
+            "deadline": _entry(
+                "DeadlineModule", "deadline", settings_key="deadline"),
+            "unknown": {"import_str": "", "addons": None},
+        },
+        "hosts": {
+            "maya": _entry("MayaAddon", "maya", host_name="maya"),
+            "nuke": _entry("NukeAddon", "nuke", host_name="nuke"),
+            "photoshop": _entry(
+                "PhotoshopAddon", "photoshop", host_name="photoshop"),
+            "webpublisher": _entry(
+                "WebpublisherAddon", "webpublisher",
+                host_name="webpublisher"
+            ),
+        }
+    }
+
+
+def test_skipped_names(monkeypatch):
+    monkeypatch.setattr(base, "AYON_SERVER_ENABLED", False)
+    monkeypatch.setattr(
+        base, "_get_module_enabled_states",
+        lambda: {"ftrack": False, "deadline": True, "webserver": False}
+    )
+    manifest = _get_manifest()
+
+    monkeypatch.delenv("AVALON_APP", raising=False)
+    skipped_modules, skipped_hosts = base._get_names_skipped_by_manifest(
+        manifest)
+    assert skipped_modules == {"ftrack"}
+    assert skipped_hosts == set()
+
+    monkeypatch.setenv("AVALON_APP", "maya")
+    _, skipped_hosts = base._get_names_skipped_by_manifest(manifest)
+    assert skipped_hosts == {"nuke", "photoshop", "webpublisher"}
+
+    monkeypatch.setenv("AVALON_APP", "photoshop")
+    _, skipped_hosts = base._get_names_skipped_by_manifest(manifest)
+    assert skipped_hosts == {"maya", "nuke"}
+
+
+def test_manifest_addon_classes():
+    class ExampleAddon(OpenPypeAddOn):
+        name = "example"
+
+    module = types.SimpleNamespace(ExampleAddon=ExampleAddon)
+    entry = _get_manifest()["modules"]["webserver"]
+    assert base._get_manifest_addon_classes(module, entry) is None
+
+    entry["addons"][0]["class_name"] = "ExampleAddon"
+    assert base._get_manifest_addon_classes(module, entry) == [ExampleAddon]
+    assert base._get_addon_classes(module) == [ExampleAddon]
+
+
+def test_manifest_is_up_to_date(tmp_path, monkeypatch):
+    monkeypatch.setattr(base, "AYON_SERVER_ENABLED", False)
+    manifest = base.create_modules_manifest(str(tmp_path / "manifest.json"))
+
+    assert base.get_modules_manifest() == manifest
+
+
+@pytest.fixture
+def restore_sys_modules():
+    modules = dict(sys.modules)
+    yield
+    for name in set(sys.modules) - set(modules):
+        sys.modules.pop(name)
+    sys.modules.update(modules)
+
+
+def test_system_settings_in_lazy_mode(monkeypatch, restore_sys_modules):
+    monkeypatch.setattr(base, "AYON_SERVER_ENABLED", False)
+    monkeypatch.setenv("OPENPYPE_LAZY_MODULES", "1")
+    monkeypatch.delenv("AVALON_APP", raising=False)
+    monkeypatch.setattr(
+        base, "_get_module_enabled_states", lambda: {"sync_server": False})
+    monkeypatch.setattr(
+        base, "get_studio_system_settings_overrides", lambda: {})
+    monkeypatch.setattr(base._LoadCache, "modules_loaded", False)
+
+    from openpype.settings.entities import SystemSettings
+
+    # sync server is imported by settings entities
+    settings = SystemSettings(set_studio_state=False, reset=False)
+    assert "sync_server" in settings["modules"]
+
+    openpype_modules = sys.modules["openpype_modules"]
+    assert "sync_server" not in openpype_modules.keys()
+    assert openpype_modules.sync_server.SyncServerModule
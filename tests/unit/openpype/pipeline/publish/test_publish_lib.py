@@ -0,0 +1,83 @@
+"""Test concurrent processing of instances by publish plugins."""
+import threading
+
+import pyblish.api
+
+from openpype.pipeline.publish import lib
+
+
+def test_process_instances_concurrently():
+    context = pyblish.api.Context()
+    instances = []
+    for name in ("first", "second", "broken"):
+        instance = context.create_instance(name)
+        instance.data["family"] = "review"
+        instances.append(instance)
+
+    # All instances must be processed at the same time to pass barrier
+    barrier = threading.Barrier(len(instances), timeout=5)
+
+    class ConcurrentPlugin(pyblish.api.InstancePlugin):
+        concurrent_instances = True
+
+        def process(self, instance):
+            barrier.wait()
+            self.log.info("Processing {}".format(instance.name))
+            if instance.name == "broken":
+                raise RuntimeError("Failed {}".format(instance.name))
+
+    assert lib.is_plugin_concurrent(ConcurrentPlugin)
+
+    results = lib.process_instances_concurrently(
+        ConcurrentPlugin, context, instances, max_workers=3)
+
+    # Results are in order of instances with logs of the instance only
+    assert [result["instance"] for result in results] == instances
+    assert context.data["results"] == results
+    assert [result["success"] for result in results] == [True, True, False]
+    for result in results:
+        messages = [record.getMessage() for record in result["records"]]
+        assert messages[0] == "Processing {}".format(
+            result["instance"].name)
+    assert str(results[-1]["error"]) == "Failed broken"
+
+
+def test_process_instances_concurrently_stop():
+    context = pyblish.api.Context()
+    instances = []
+    for name in ("broken", "first", "second", "third"):
+        instance = context.create_instance(name)
+        instance.data["family"] = "review"
+        instances.append(instance)
+
+    class ConcurrentPlugin(pyblish.api.InstancePlugin):
+        concurrent_instances = True
+
+        def process(self, instance):
+            if instance.name == "broken":
+                raise RuntimeError("Failed {}".format(instance.name))
+
+    def stop_callback(results):
+        return any(not result["success"] for result in results)
+
+    results = lib.process_instances_concurrently(
+        ConcurrentPlugin, context, instances, max_workers=2,
+        stop_callback=stop_callback
+    )
+
+    # Instances are not submitted after the failure, already submitted
+    #   instance is processed or cancelled if did not start yet
+    processed = [result["instance"] for result in results]
+    assert processed in (instances[:1], instances[:2])
+
+
+def test_get_publish_max_workers(monkeypatch):
+    project_settings = {
+        "global": {"tools": {"publish": {"max_workers": 4}}}
+    }
+    monkeypatch.delenv("OPENPYPE_PUBLISH_MAX_WORKERS", raising=False)
+    assert lib.get_publish_max_workers() == 1
+    assert lib.get_publish_max_workers(project_settings) == 4
+
+    monkeypatch.setenv("OPENPYPE_PUBLISH_MAX_WORKERS", "2")
+    assert lib.get_publish_max_workers(project_settings) == 2
@@ -0,0 +1,115 @@
+"""Test project documents cached in files for anatomy."""
+import os
+import time
+import datetime
+
+from bson.objectid import ObjectId
+
+from openpype.pipeline import anatomy
+from openpype.pipeline.anatomy import ProjectDocFileCache
+
+PROJECT_DOC = {
+    "_id": ObjectId(),
+    "type": "project",
+    "name": "test_project",
+    "data": {
+        "code": "tp",
+        "fps": 25.0,
+        "frameStart": 1001,
+        "created": datetime.datetime(2023, 1, 2, 3, 4, 5),
+    },
+    "config": {"roots": {"work": {"linux": "/mnt/work"}}},
+}
+
+
+def test_project_doc_file_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(anatomy, "AYON_SERVER_ENABLED", False)
+    monkeypatch.setenv("OPENPYPE_MONGO", "mongodb://localhost:27017")
+    cache = ProjectDocFileCache(str(tmp_path), lifetime=10)
+    assert cache.get("test_project") is None
+
+    cache.set("test_project", PROJECT_DOC)
+    assert cache.get("test_project") == PROJECT_DOC
+    assert ProjectDocFileCache(str(tmp_path), 10).get("test_project") == (
+        PROJECT_DOC
+    )
+    assert cache.get("other_project") is None
+
+    # document of different database is not used
+    monkeypatch.setenv("OPENPYPE_MONGO", "mongodb://other:27017")
+    assert cache.get("test_project") is None
+    monkeypatch.setenv("OPENPYPE_MONGO", "mongodb://localhost:27017")
+
+    # outdated file is not used
+    filepath = cache._get_filepath("test_project")
+    modified = time.time() - 20
+    os.utime(filepath, (modified, modified))
+    assert cache.get("test_project") is None
+
+
+def test_project_doc_file_cache_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv(ProjectDocFileCache.lifetime_env_key, "0")
+    cache = ProjectDocFileCache(str(tmp_path))
+    cache.set("test_project", PROJECT_DOC)
+
+    assert cache.get("test_project") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_anatomy_uses_file_cache(tmp_path, monkeypatch):
+    queried = []
+
+    def get_project(project_name):
+        queried.append(project_name)
+        return PROJECT_DOC
+
+    monkeypatch.setattr(anatomy, "get_project", get_project)
+    monkeypatch.setattr(
+        anatomy.Anatomy,
+        "_project_doc_file_cache",
+        ProjectDocFileCache(str(tmp_path), lifetime=10)
+    )
+    for _ in range(2):
+        # new process starts with empty cache
+        monkeypatch.setattr(
+            anatomy.Anatomy,
+            "_project_cache",
+            anatomy.collections.defaultdict(anatomy.CacheItem)
+        )
+        project_doc = anatomy.Anatomy.get_project_doc_from_cache(
+            "test_project")
+        assert project_doc == PROJECT_DOC
+        assert project_doc is not PROJECT_DOC
+
+    assert queried == ["test_project"]
+
+
+def test_project_doc_file_cache_without_os_replace(tmp_path, monkeypatch):
+    monkeypatch.delattr(os, "replace")
+    cache = ProjectDocFileCache(str(tmp_path), lifetime=10)
+    cache.set("test_project", PROJECT_DOC)
+    cache.set("test_project", PROJECT_DOC)
+
+    assert cache.get("test_project") == PROJECT_DOC
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_anatomy_cache_uses_file_age(tmp_path, monkeypatch):
+    file_cache = ProjectDocFileCache(str(tmp_path), lifetime=10)
+    file_cache.set("test_project", PROJECT_DOC)
+    filepath = file_cache._get_filepath("test_project")
+    modified = time.time() - 9
+    os.utime(filepath, (modified, modified))
+
+    monkeypatch.setattr(
+        anatomy.Anatomy, "_project_doc_file_cache", file_cache)
+    monkeypatch.setattr(
+        anatomy.Anatomy,
+        "_project_cache",
+        anatomy.collections.defaultdict(anatomy.CacheItem)
+    )
+    anatomy.Anatomy.get_project_doc_from_cache("test_project")
+
+    project_cache = anatomy.Anatomy._project_cache["test_project"]
+    monkeypatch.setattr(time, "time", lambda: modified + 10.5)
+    assert project_cache.is_outdated
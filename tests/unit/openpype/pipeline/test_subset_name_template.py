@@ -0,0 +1,45 @@
+"""Test matching of subset name template profiles."""
+from openpype.lib import profiles_filtering
+from openpype.pipeline.create import subset_name
+
+
+def _get_project_settings(template):
+    return {
+        "global": {
+            "tools": {
+                "creator": {
+                    "subset_name_profiles": [{
+                        "families": [],
+                        "hosts": [],
+                        "task_types": [],
+                        "tasks": [],
+                        "template": template
+                    }]
+                }
+            }
+        }
+    }
+
+
+def test_queried_settings_not_shared(monkeypatch):
+    monkeypatch.setattr(
+        profiles_filtering,
+        "_PROFILE_MATCHERS",
+        profiles_filtering.collections.OrderedDict()
+    )
+    monkeypatch.setattr(
+        subset_name,
+        "get_project_settings",
+        lambda project_name: _get_project_settings("{family}{Variant}")
+    )
+    template = subset_name.get_subset_name_template(
+        "project", "render", "comp", "Compositing", "nuke")
+    assert template == "{family}{Variant}"
+    assert not profiles_filtering._PROFILE_MATCHERS
+
+    template = subset_name.get_subset_name_template(
+        "project", "render", "comp", "Compositing", "nuke",
+        project_settings=_get_project_settings("{family}")
+    )
+    assert template == "{family}"
+    assert len(profiles_filtering._PROFILE_MATCHERS) == 1
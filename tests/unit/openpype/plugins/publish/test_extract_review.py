@@ -27,3 +27,101 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+def test_fill_sequence_gaps_links_files(tmp_path):
+    plugin = ExtractReview()
+    files = ["beauty.1001.exr", "beauty.1003.exr"]
+    for filename in files:
+        (tmp_path / filename).write_bytes(b"frame")
+
+    added_files = plugin.fill_sequence_gaps(
+        files, str(tmp_path), 1001, 1005)
+    assert sorted(added_files) == [
+        str(tmp_path / "beauty.{}.exr".format(frame))
+        for frame in (1002, 1004, 1005)
+    ]
+    # Files are linked, not copied
+    src_stat = (tmp_path / "beauty.1003.exr").stat()
+    for frame in (1004, 1005):
+        dst_path = tmp_path / "beauty.{}.exr".format(frame)
+        assert dst_path.stat().st_ino == src_stat.st_ino
+
+    # Already filled holes are not reported again
+    assert plugin.fill_sequence_gaps(files, str(tmp_path), 1001, 1005) == []
+
+
+def test_remove_files_to_clean(tmp_path):
+    plugin = ExtractReview()
+    filepath = tmp_path / "beauty.1002.exr"
+    filepath.write_bytes(b"frame")
+
+    # Already removed file doesn't raise
+    plugin._remove_files_to_clean(
+        [str(filepath), str(tmp_path / "beauty.1003.exr")])
+    assert not filepath.exists()
+
+
+def test_stream_frame_paths():
+    plugin = ExtractReview()
+    input_paths = ["/in/beauty.1001.exr", "/in/beauty.1003.exr"]
+    assert plugin._get_stream_frame_paths(input_paths, 1001, 4) == [
+        "/in/beauty.1001.exr",
+        "/in/beauty.1001.exr",
+        "/in/beauty.1003.exr",
+        "/in/beauty.1003.exr",
+    ]
+
+    # Inputs which are not a sequence are not streamed
+    assert plugin._get_stream_frame_paths(
+        ["/in/beauty.exr"], 1001, 1) is None
+
+
+def test_review_thumbnail_is_tapped_from_output(tmp_path, monkeypatch):
+    from openpype.plugins.publish import extract_review
+
+    monkeypatch.setattr(
+        extract_review, "get_ffmpeg_tool_args", lambda *args: ["ffmpeg"])
+    monkeypatch.setattr(
+        extract_review.tempfile, "mkdtemp", lambda **kwargs: str(tmp_path))
+
+    plugin = ExtractReview()
+    plugin.review_thumbnail = {"enabled": True, "duration_split": 0.5}
+    job = {
+        "new_repre": {"tags": ["review"]},
+        "temp_data": {
+            "output_frames_len": 10,
+            "full_input_path_single_file": "/in/beauty.1001.exr",
+            "output_ext_is_image": False,
+            "with_audio": False,
+        },
+        "ffmpeg_args_parts": (
+            ["-i /in/beauty.%04d.exr"],
+            ["scale=1920:1080"],
+            [],
+            ["-codec:v h264", "-y", "/out/beauty_h264.mp4"]
+        ),
+    }
+
+    class Instance:
+        data = {}
+
+        class context:
+            data = {"cleanupFullPaths": []}
+
+    instance = Instance()
+    assert plugin._get_review_thumbnail_job(instance, [job]) is job
+
+    thumbnail_path, thumbnail_output = plugin._prepare_review_thumbnail(
+        instance, job)
+    assert thumbnail_path == str(tmp_path / "beauty.1001_thumb.jpg")
+
+    args = plugin._get_group_ffmpeg_args(
+        [job], job["ffmpeg_args_parts"][0], thumbnail_output)
+    cmd = " ".join(args)
+    # Input is decoded once for both outputs
+    assert cmd.count("-i ") == 1
+    assert (
+        "[in1]trim=start_frame=5:end_frame=6,scale=1920:1080[out1]" in cmd
+    )
+    assert cmd.endswith("-frames:v 1 -q:v 2 -y {}".format(thumbnail_path))
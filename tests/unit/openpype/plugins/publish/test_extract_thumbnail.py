@@ -0,0 +1,72 @@
+from openpype.plugins.publish.extract_thumbnail import ExtractThumbnail
+
+
+class Instance:
+    def __init__(self, data):
+        self.data = data
+
+    class context:
+        data = {"cleanupFullPaths": []}
+
+
+def _get_plugin(monkeypatch, tmp_path):
+    plugin = ExtractThumbnail()
+    plugin.target_size = {"type": "source"}
+    plugin.ffmpeg_args = {"input": [], "output": []}
+    converted = []
+    added = []
+
+    def _create_thumbnail_ffmpeg(src_path, dst_path):
+        converted.append(src_path)
+        return True
+
+    monkeypatch.setattr(
+        plugin, "_create_thumbnail_ffmpeg", _create_thumbnail_ffmpeg)
+    monkeypatch.setattr(
+        plugin, "_add_thumbnail_representation",
+        lambda instance, name, path: added.append(path)
+    )
+    monkeypatch.setattr(
+        "tempfile.mkdtemp", lambda **kwargs: str(tmp_path / "staging"))
+    return plugin, converted, added
+
+
+def test_review_thumbnail_reused(tmp_path, monkeypatch):
+    thumbnail_path = tmp_path / "beauty_thumb.jpg"
+    thumbnail_path.write_bytes(b"jpg")
+    instance_data = {
+        "reviewThumbnailPath": str(thumbnail_path),
+        "reviewThumbnailDurationSplit": 0.5,
+    }
+
+    plugin, converted, added = _get_plugin(monkeypatch, tmp_path)
+    assert plugin._add_review_thumbnail(Instance(dict(instance_data)))
+    assert added == [str(thumbnail_path)]
+    assert not converted
+
+    # target size is applied to thumbnail of review
+    plugin, converted, added = _get_plugin(monkeypatch, tmp_path)
+    plugin.target_size = {"type": "resize", "width": 960, "height": 540}
+    assert plugin._add_review_thumbnail(Instance(dict(instance_data)))
+    assert converted == [str(thumbnail_path)]
+    assert added == [str(tmp_path / "staging" / "beauty_thumb.jpg")]
+
+
+def test_review_thumbnail_not_reused(tmp_path, monkeypatch):
+    thumbnail_path = tmp_path / "beauty_thumb.jpg"
+    thumbnail_path.write_bytes(b"jpg")
+    instance_data = {
+        "reviewThumbnailPath": str(thumbnail_path),
+        "reviewThumbnailDurationSplit": 0.5,
+    }
+
+    # input arguments can't be applied to review output
+    plugin, _, added = _get_plugin(monkeypatch, tmp_path)
+    plugin.ffmpeg_args = {"input": ["-apply_trc gamma22"], "output": []}
+    assert not plugin._add_review_thumbnail(Instance(dict(instance_data)))
+
+    # thumbnail of review is from different frame
+    plugin, _, added = _get_plugin(monkeypatch, tmp_path)
+    plugin.duration_split = 0.2
+    assert not plugin._add_review_thumbnail(Instance(dict(instance_data)))
+    assert not added
@@ -0,0 +1,114 @@
+"""Test merging of settings and reuse of merged settings."""
+import copy
+
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.constants import M_OVERRIDDEN_KEY
+
+DEFAULTS = {
+    "global": {
+        "sync_server": {"config": {"active_site": "studio"}},
+        "publish": {"Extract": {"enabled": True, "families": ["render"]}},
+    },
+    "maya": {"publish": {"enabled": True}},
+}
+
+
+class FakeSettingsHandler(object):
+    def __init__(self):
+        self.studio_overrides = {
+            "global": {"publish": {"Extract": {"enabled": False}}}
+        }
+        self.project_overrides = {
+            "global": {
+                M_OVERRIDDEN_KEY: ["publish"],
+                "publish": {"Extract": {"families": ["review"]}},
+            }
+        }
+        self.revision = 0
+        self.reads = 0
+
+    def get_overrides_revision(self, settings_type, project_name=None):
+        return self.revision
+
+    def get_studio_project_settings_overrides(self, return_version):
+        self.reads += 1
+        return copy.deepcopy(self.studio_overrides)
+
+    def get_project_settings_overrides(self, project_name, return_version):
+        self.reads += 1
+        return copy.deepcopy(self.project_overrides)
+
+
+class FakeLocalSettingsHandler(object):
+    def __init__(self):
+        self.local_settings = {
+            "projects": {"demo": {"active_site": "local"}}
+        }
+
+    def get_local_settings_revision(self):
+        return 0
+
+    def get_local_settings(self):
+        return copy.deepcopy(self.local_settings)
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    settings_handler = FakeSettingsHandler()
+    defaults = {lib.PROJECT_SETTINGS_KEY: copy.deepcopy(DEFAULTS)}
+    monkeypatch.setattr(lib, "AYON_SERVER_ENABLED", False)
+    monkeypatch.setattr(lib, "_DEFAULT_SETTINGS", defaults)
+    monkeypatch.setattr(lib, "_SETTINGS_SNAPSHOTS", {})
+    monkeypatch.setattr(lib, "_SETTINGS_HANDLER", settings_handler)
+    monkeypatch.setattr(
+        lib, "_LOCAL_SETTINGS_HANDLER", FakeLocalSettingsHandler())
+    return settings_handler
+
+
+def test_project_settings_are_merged_once(handler):
+    settings = lib.get_project_settings("demo")
+
+    assert settings["global"] == {
+        "sync_server": {"config": {"active_site": "local"}},
+        "publish": {"Extract": {"families": ["review"]}},
+    }
+    assert settings["maya"] == DEFAULTS["maya"]
+
+    # Returned settings are copies
+    settings["maya"]["publish"]["enabled"] = False
+    reads = handler.reads
+    assert lib.get_project_settings("demo")["maya"]["publish"]["enabled"]
+    assert handler.reads == reads
+
+    # Changed overrides are merged again
+    handler.project_overrides = {}
+    handler.revision += 1
+    settings = lib.get_project_settings("demo")
+    assert settings["global"]["publish"]["Extract"] == {
+        "enabled": False, "families": ["render"]
+    }
+    assert lib.get_default_settings()[lib.PROJECT_SETTINGS_KEY] == DEFAULTS
+
+
+def test_snapshot_shares_values_with_defaults(handler):
+    snapshot = lib.get_project_settings_snapshot("demo")
+    defaults = lib._get_default_settings_data()[lib.PROJECT_SETTINGS_KEY]
+
+    assert snapshot._data["maya"] is defaults["maya"]
+    assert snapshot["global"]["sync_server"]["config"]["active_site"] == (
+        "local"
+    )
+    # Local settings did not change settings without locals
+    assert lib.get_default_project_settings(False, True)["global"][
+        "sync_server"]["config"]["active_site"] == "studio"
+
+    families = snapshot["global"]["publish"]["Extract"]["families"]
+    assert families == ("review", )
+    with pytest.raises(TypeError):
+        snapshot["maya"]["publish"]["enabled"] = False
+
+    settings = snapshot.copy()
+    settings["maya"]["publish"]["enabled"] = False
+    assert snapshot["maya"]["publish"]["enabled"]